@@ -0,0 +1,94 @@
+"""
+
+    PyDerivativeLib: opsiyon, varant ve vadeli işlem fiyatlama kütüphanesi.
+    Çekirdek fiyatlama sınıfları yalnızca standart kütüphaneyle yüklenir; NumPy/SciPy gerektiren
+    toplu fiyatlama araçları ilk erişimde, matplotlib ve statsmodels ise kullanıldıkları anda yüklenir.
+
+"""
+import importlib
+
+from .core import (
+    GreeksResult,
+    HigherOrderGreeksResult,
+    ImpliedVolatilityResult,
+    OptionCalculate,
+    WarrantCalculate,
+    disable_cache,
+    enable_cache,
+    implied_volatility,
+)
+from .cache import CacheStats, GreeksCache
+from .enums import AssetType, DerivativeType, Future_Type, Graph_Case
+from .futures import Future
+
+_LAZY_ATTRIBUTES = {
+    "OptionBatch": "batch",
+    "WarrantBatch": "batch",
+    "price_batch": "batch",
+    "implied_volatility_batch": "batch",
+    "warrant_analytics": "batch",
+    "WarrantAnalyticsResult": "batch",
+    "AmericanBatch": "american",
+    "price_american": "american",
+    "MonteCarloWarrant": "montecarlo",
+    "MonteCarloResult": "montecarlo",
+    "Graphs": "graphics",
+    "ScenarioSurface": "graphics",
+    "StreamingPricer": "streaming",
+    "Book": "book",
+    "ScenarioSet": "stress",
+    "StressResult": "stress",
+    "stress_test": "stress",
+    "ParallelPricer": "parallel",
+    "price_parallel": "parallel",
+    "implied_volatility_parallel": "parallel",
+    "PriceFile": "pipeline",
+    "hedge_ratio": "hedging",
+    "rolling_hedge_ratio": "hedging",
+    "ewma_hedge_ratio": "hedging",
+    "HedgeRatioTracker": "hedging",
+    "FutureCurve": "curve",
+    "RateCurve": "curve",
+    "ContractStore": "store",
+    "ContractView": "store",
+    "PricingService": "service",
+    "VolatilitySurface": "surface",
+    "FutureOptionBatch": "black76",
+    "price_black76": "black76",
+    "enable_profiling": "profiling",
+    "disable_profiling": "profiling",
+    "reset_profiling": "profiling",
+    "profiling_snapshot": "profiling",
+    "start_profiling_report": "profiling",
+    "stop_profiling_report": "profiling",
+}
+
+__all__ = [
+    "AssetType",
+    "DerivativeType",
+    "Future_Type",
+    "Graph_Case",
+    "GreeksResult",
+    "HigherOrderGreeksResult",
+    "ImpliedVolatilityResult",
+    "OptionCalculate",
+    "WarrantCalculate",
+    "implied_volatility",
+    "enable_cache",
+    "disable_cache",
+    "GreeksCache",
+    "CacheStats",
+    "Future",
+    *_LAZY_ATTRIBUTES,
+]
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
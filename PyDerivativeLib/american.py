@@ -0,0 +1,346 @@
+import math
+
+import numpy as np
+from scipy.special import ndtr
+
+from .batch import OptionBatch, _EuropeanPrice
+from .core import _MAX_VOLATILITY, GreeksResult, ImpliedVolatilityResult
+
+METHODS = ("BaroneAdesiWhaley", "Binomial")
+
+def _BaroneAdesiWhaley(
+    Sign,
+    UnderlyingPrice,
+    StrikePrice,
+    Time,
+    Rate,
+    Volatility,
+    Dividend,
+    Critical=None,
+    Tolerance=1e-10,
+    MaxIterations=100,
+):
+    """
+
+        Barone-Adesi & Whaley (1987) ikinci dereceden yaklaşımıyla Amerikan opsiyon fiyatını, delta ve
+        gammasını dizi girdiler üzerinde hesaplar. Kritik spot fiyat Newton iterasyonuyla tüm sözleşmeler
+        için birlikte çözülür; Critical verilirse başlangıç tahmini olarak kullanılır ve dördüncü değer
+        olarak döner. Erken kullanımın hiç optimal olmadığı sözleşmeler (q <= 0 alım, r <= 0 satım)
+        Avrupa değerlerini alır.
+
+    """
+    Sign, spot, strike, time, rate, volatility, dividend = np.broadcast_arrays(
+        Sign, UnderlyingPrice, StrikePrice, Time, Rate, Volatility, Dividend
+    )
+    carry = rate - dividend
+    carryDiscount = np.exp((carry - rate) * time)
+    volSqrtTime = volatility * np.sqrt(time)
+    european, dOne = _EuropeanPrice(Sign, spot, strike, time, rate, carry, volatility)
+    price = np.array(european, dtype=float)
+    delta = Sign * carryDiscount * ndtr(Sign * dOne)
+    gamma = carryDiscount * np.exp(-0.5 * dOne**2) / math.sqrt(2 * math.pi) / (spot * volSqrtTime)
+    critical = np.full(price.shape, np.nan)
+    active = np.flatnonzero(np.where(Sign > 0, dividend > 0, rate > 0) & (time > 0))
+    if active.size == 0:
+        return price, delta, gamma, critical
+
+    sign, spot, strike, time, rate, volatility, carry, carryDiscount = (
+        np.ravel(values)[active]
+        for values in (Sign, spot, strike, time, rate, volatility, carry, carryDiscount)
+    )
+    variance = volatility**2
+    sqrtTime = np.sqrt(time)
+    n = 2 * carry / variance
+    discountFactor = -np.expm1(-rate * time)
+    mOverK = np.where(discountFactor != 0, 2 * rate / variance / discountFactor, 2 / (variance * time))
+    exponent = (-(n - 1) + sign * np.sqrt((n - 1) ** 2 + 4 * mOverK)) / 2
+    exponentInfinity = (-(n - 1) + sign * np.sqrt((n - 1) ** 2 + 8 * rate / variance)) / 2
+    infinite = strike / (1 - 1 / exponentInfinity)
+    seed = np.where(
+        sign > 0,
+        strike
+        + (infinite - strike)
+        * (1 - np.exp(-(carry * time + 2 * volatility * sqrtTime) * strike / (infinite - strike))),
+        infinite
+        + (strike - infinite)
+        * np.exp((carry * time - 2 * volatility * sqrtTime) * strike / (strike - infinite)),
+    )
+    if Critical is not None:
+        guess = np.ravel(np.broadcast_to(Critical, price.shape))[active]
+        seed = np.where(np.isfinite(guess), guess, seed)
+    pending = np.arange(active.size)
+    for _ in range(MaxIterations):
+        s, k, sg, e, q, v, t = (
+            values[pending]
+            for values in (seed, strike, sign, carryDiscount, exponent, volatility, time)
+        )
+        value, d = _EuropeanPrice(sg, s, k, t, rate[pending], carry[pending], v)
+        cdf = ndtr(sg * d)
+        rightSide = value + sg * (1 - e * cdf) * s / q
+        leftSide = sg * (s - k)
+        slope = sg * e * cdf * (1 - 1 / q) + (
+            sg - e * np.exp(-0.5 * d**2) / math.sqrt(2 * math.pi) / (v * np.sqrt(t))
+        ) / q
+        seed[pending] = (k + sg * (rightSide - slope * s)) / (1 - sg * slope)
+        pending = pending[np.abs(leftSide - rightSide) / k >= Tolerance]
+        if pending.size == 0:
+            break
+
+    _, d = _EuropeanPrice(sign, seed, strike, time, rate, carry, volatility)
+    coefficient = sign * seed / exponent * (1 - carryDiscount * ndtr(sign * d))
+    premium = coefficient * (spot / seed) ** exponent
+    continuation = sign * (seed - spot) > 0
+    for values, early, exercised in (
+        (price, premium, sign * (spot - strike)),
+        (delta, premium * exponent / spot, sign),
+        (gamma, premium * exponent * (exponent - 1) / spot**2, 0.0),
+    ):
+        flat = values.reshape(-1)
+        flat[active] = np.where(continuation, flat[active] + early, exercised)
+    critical.reshape(-1)[active] = seed
+    return price, delta, gamma, critical
+
+def _BinomialTree(Sign, spot, strike, time, rate, volatility, dividend, Steps):
+    """
+
+        Cox-Ross-Rubinstein binom ağacında geriye doğru tümevarımı tek boyutlu sözleşme dizileri için
+        aynı anda yapar. Fiyatla birlikte ağacın ilk düğümlerinden delta, gamma ve günlük theta döner.
+
+    """
+    Sign, spot, strike, time, rate, volatility, dividend = (
+        values[:, None] for values in (Sign, spot, strike, time, rate, volatility, dividend)
+    )
+    step = time / Steps
+    up = np.exp(volatility * np.sqrt(step))
+    probability = np.clip((np.exp((rate - dividend) * step) - 1 / up) / (up - 1 / up), 0.0, 1.0)
+    discount = np.exp(-rate * step)
+    upWeight = discount * probability
+    downWeight = discount * (1 - probability)
+
+    nodeSpots = spot * up ** (2.0 * np.arange(Steps + 1) - Steps)
+    values = np.maximum(Sign * (nodeSpots - strike), 0.0)
+    layers = {}
+    for level in range(Steps - 1, -1, -1):
+        values = upWeight * values[:, 1:] + downWeight * values[:, :-1]
+        nodeSpots = nodeSpots[:, :-1] * up
+        values = np.maximum(values, Sign * (nodeSpots - strike))
+        if level <= 2:
+            layers[level] = values
+    spot, up, step = spot[:, 0], up[:, 0], step[:, 0]
+    deltaUp = (layers[2][:, 2] - layers[2][:, 1]) / (spot * up**2 - spot)
+    deltaDown = (layers[2][:, 1] - layers[2][:, 0]) / (spot - spot / up**2)
+    return (
+        layers[0][:, 0],
+        (layers[1][:, 1] - layers[1][:, 0]) / (spot * up - spot / up),
+        (deltaUp - deltaDown) / (0.5 * (spot * up**2 - spot / up**2)),
+        (layers[2][:, 1] - layers[0][:, 0]) / (2 * step) / 365,
+    )
+
+def _Binomial(
+    Sign, UnderlyingPrice, StrikePrice, Time, Rate, Volatility, Dividend, Steps=200, ChunkSize=2_000_000
+):
+    """
+
+        CRR ağacını sözleşmeler üzerinde, ağaç düğümlerinin toplamı ChunkSize elemanı aşmayacak
+        parçalar halinde çalıştırır. Vadesi dolmuş sözleşmeler ağaca girmez; içsel değer, içsel
+        değerin eğimi olan delta ve sıfır gamma/theta alır.
+
+    """
+    columns = np.broadcast_arrays(Sign, UnderlyingPrice, StrikePrice, Time, Rate, Volatility, Dividend)
+    shape = columns[0].shape
+    Sign, spot, strike, time, rate, volatility, dividend = (np.ravel(values) for values in columns)
+    intrinsic = Sign * (spot - strike)
+    result = (
+        np.maximum(intrinsic, 0.0),
+        np.where(intrinsic > 0, Sign, 0.0),
+        np.zeros(intrinsic.shape),
+        np.zeros(intrinsic.shape),
+    )
+    live = np.flatnonzero(time > 0)
+    step = max(int(ChunkSize) // (Steps + 1), 1)
+    for start in range(0, live.size, step):
+        chunk = live[start : start + step]
+        values = _BinomialTree(
+            *(column[chunk] for column in (Sign, spot, strike, time, rate, volatility, dividend)), Steps
+        )
+        for output, value in zip(result, values):
+            output[chunk] = value
+    return tuple(output.reshape(shape) for output in result)
+
+class AmericanBatch(OptionBatch):
+    """
+
+        Amerikan tipi opsiyon ve varantları OptionCalculate ile aynı girdi birimleriyle (yüzde oranlar,
+        gün cinsinden vade) toplu fiyatlar. Method "BaroneAdesiWhaley" hızlı analitik yaklaşımı,
+        "Binomial" doğrulama için Steps adımlı CRR ağacını kullanır. Greeksler sonlu farklarla
+        (ağaçta delta, gamma ve theta ağaç düğümlerinden) hesaplanır ve OptionBatch birimlerindedir.
+
+    """
+
+    def __init__(
+        self,
+        Type,
+        UnderlyingPrice,
+        StrikePrice,
+        DaysToMaturity,
+        DomesticRate,
+        ImpliedVolatility,
+        Dividend,
+        ConversionRate=1,
+        Method="BaroneAdesiWhaley",
+        Steps=200,
+    ):
+        if Method not in METHODS:
+            raise ValueError(f"Method must be one of {METHODS}.")
+        super().__init__(
+            Type,
+            UnderlyingPrice,
+            StrikePrice,
+            DaysToMaturity,
+            DomesticRate,
+            ImpliedVolatility,
+            Dividend,
+        )
+        self._ConversionRate = np.broadcast_to(
+            np.asarray(ConversionRate, dtype=float), self._Sign.shape
+        )
+        self._Method = Method
+        self._Steps = int(Steps)
+        self.__greeks = None
+
+    @classmethod
+    def FromFrame(cls, frame, Method="BaroneAdesiWhaley", Steps=200):
+        conversion = frame["ConversionRate"].to_numpy() if "ConversionRate" in frame.columns else 1
+        return cls(
+            *(frame[column].to_numpy() for column in OptionBatch._FRAME_COLUMNS),
+            ConversionRate=conversion,
+            Method=Method,
+            Steps=Steps,
+        )
+
+    def __Price(self, UnderlyingPrice, Time, Rate, Volatility, Critical=None):
+        arguments = (self._Sign, UnderlyingPrice, self._StrikePrice, Time, Rate, Volatility, self._Dividend / 100)
+        if self._Method == "Binomial":
+            return _Binomial(*arguments, self._Steps)[0]
+        return _BaroneAdesiWhaley(*arguments, Critical)[0]
+
+    def __Greeks(self):
+        spot = self._UnderlyingPrice
+        time = self._DaysToMaturity / 365
+        rate = self._DomesticRate / 100
+        volatility = self._ImpliedVolatility / 100
+        arguments = (self._Sign, spot, self._StrikePrice, time, rate, volatility, self._Dividend / 100)
+        if self._Method == "Binomial":
+            price, delta, gamma, theta = _Binomial(*arguments, self._Steps)
+            shifted = self.__Price(
+                spot,
+                time,
+                np.stack([rate + 0.01, rate - 0.01, rate, rate]),
+                np.stack([volatility, volatility, volatility + 0.01, volatility - 0.01]),
+            )
+            bump = 0.01
+        else:
+            price, delta, gamma, critical = _BaroneAdesiWhaley(*arguments)
+            bump = 1e-4
+            timeBump = np.minimum(1e-4, 0.5 * time)
+            shifted = self.__Price(
+                spot,
+                np.stack([time, time, time, time, time + timeBump, time - timeBump]),
+                np.stack([rate + bump, rate - bump, rate, rate, rate, rate]),
+                np.stack([volatility, volatility, volatility + bump, volatility - bump, volatility, volatility]),
+                critical,
+            )
+            theta = -(shifted[4] - shifted[5]) / (2 * timeBump) / 365
+        conversion = self._ConversionRate
+        return GreeksResult(
+            Price=price * conversion,
+            Delta=delta,
+            Theta=theta * conversion,
+            Vega=0.01 * (shifted[2] - shifted[3]) / (2 * bump) * conversion,
+            Gamma=gamma,
+            Rho=0.01 * (shifted[0] - shifted[1]) / (2 * bump) * conversion,
+        )
+
+    def Greeks(self):
+        """
+
+            Fonksiyon, tüm sözleşmelerin Amerikan fiyatını ve greekslerini vektörel olarak hesaplar
+
+        """
+        if self.__greeks is None:
+            with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                self.__greeks = self.__Greeks()
+        return self.__greeks
+
+    def HigherOrderGreeks(self):
+        raise TypeError("Closed-form higher-order Greeks are only available for European contracts.")
+
+    def EarlyExercisePremium(self):
+        """
+
+            Fonksiyon, Amerikan fiyatının aynı girdilerle hesaplanan Avrupa fiyatını ne kadar aştığını döndürür
+
+        """
+        return self.Price() - super().Greeks().Price * self._ConversionRate
+
+    def SolveImpliedVolatility(self, MarketPrice, Tolerance=1e-6, MaxIterations=100):
+        """
+
+            Fonksiyon, Amerikan fiyatlarından zımni volatiliteyi [0, 1000%] aralığında vektörel ikiye bölme
+            ile çözer. Tolerance yüzde puan cinsinden volatilite aralığı genişliğidir.
+
+        """
+        target = np.broadcast_to(np.asarray(MarketPrice, dtype=float), self._Sign.shape) / self._ConversionRate
+        spot = self._UnderlyingPrice
+        time = self._DaysToMaturity / 365
+        rate = self._DomesticRate / 100
+        strike = self._StrikePrice
+        lower = np.maximum.reduce(
+            [
+                self._Sign * (spot - strike),
+                self._Sign * (spot * np.exp(-self._Dividend / 100 * time) - strike * np.exp(-rate * time)),
+                np.zeros(target.shape),
+            ]
+        )
+        valid = (lower < target) & (target < np.where(self._Sign > 0, spot, strike))
+        low = np.zeros(target.shape)
+        high = np.full(target.shape, _MAX_VOLATILITY)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            iterations = np.zeros(target.shape, dtype=int)
+            converged = np.zeros(target.shape, dtype=bool)
+            for iteration in range(1, MaxIterations + 1):
+                middle = 0.5 * (low + high)
+                above = self.__Price(spot, time, rate, middle) > target
+                high = np.where(above, middle, high)
+                low = np.where(above, low, middle)
+                pending = valid & ~converged
+                iterations[pending] = iteration
+                converged |= valid & (100 * (high - low) < Tolerance)
+                if converged[valid].all():
+                    break
+        volatility = np.where(valid, 50 * (low + high), np.nan)
+        return ImpliedVolatilityResult(volatility, converged, np.where(valid, iterations, 0))
+
+def price_american(
+    types,
+    spots=None,
+    strikes=None,
+    days=None,
+    rates=None,
+    vols=None,
+    divs=None,
+    conversion_rates=1,
+    Method="BaroneAdesiWhaley",
+    Steps=200,
+):
+    """
+
+        Fonksiyon, dizi girdiler ya da OptionBatch.FromFrame kolonlarını (isteğe bağlı ConversionRate ile)
+        içeren bir DataFrame için Amerikan fiyat ve greekslerini dizi olarak döndürür
+
+    """
+    if hasattr(types, "columns"):
+        batch = AmericanBatch.FromFrame(types, Method, Steps)
+    else:
+        batch = AmericanBatch(types, spots, strikes, days, rates, vols, divs, conversion_rates, Method, Steps)
+    return batch.Greeks()
@@ -0,0 +1,561 @@
+import math
+from typing import NamedTuple
+
+import numpy as np
+from scipy.special import ndtr
+
+from .core import (
+    _MAX_VOLATILITY,
+    _TYPE_SIGNS,
+    GreeksResult,
+    HigherOrderGreeksResult,
+    ImpliedVolatilityResult,
+)
+from .enums import Future_Type
+
+class WarrantAnalyticsResult(NamedTuple):
+    Price: np.ndarray
+    Delta: np.ndarray
+    Theta: np.ndarray
+    Vega: np.ndarray
+    Gamma: np.ndarray
+    Rho: np.ndarray
+    BasicLeverage: np.ndarray
+    Leverage: np.ndarray
+    Sensitivity: np.ndarray
+    Flexibility: np.ndarray
+    BasicValue: np.ndarray
+    TimeValue: np.ndarray
+    CostDifference: np.ndarray
+    PercentCostDifference: np.ndarray
+
+def _OptionSign(Type):
+    types = np.asarray(Type).astype(str)
+    sign = np.full(types.shape, np.nan)
+    for name, value in _TYPE_SIGNS.items():
+        sign[types == name] = value
+    if np.isnan(sign).any():
+        raise ValueError("C or P can be entered as option type.")
+    return sign
+
+def _BlackScholes(Sign, UnderlyingPrice, StrikePrice, Time, Rate, Volatility, Dividend, HigherOrder=False):
+    """
+
+        Black-Scholes fiyatını ve greeksleri dizi girdiler üzerinde tek geçişte hesaplar.
+        Sign alım için 1, satım için -1'dir; oran ve volatilite ondalık, süre yıl cinsindendir.
+        HigherOrder açıksa aynı d1/d2 terimlerinden ikinci derece greeksler de hesaplanır ve
+        (GreeksResult, HigherOrderGreeksResult) döner.
+
+    """
+    sqrtTime = np.sqrt(Time)
+    volSqrtTime = Volatility * sqrtTime
+    dOne = (
+        np.log(UnderlyingPrice / StrikePrice)
+        + (Rate - Dividend + 0.5 * Volatility**2) * Time
+    ) / volSqrtTime
+    dTwo = dOne - volSqrtTime
+    NdOne = np.exp(-0.5 * dOne**2) / math.sqrt(2 * math.pi)
+    CdfOne = ndtr(Sign * dOne)
+    CdfTwo = ndtr(Sign * dTwo)
+    discountedStrike = StrikePrice * np.exp(-Rate * Time)
+    carryDiscount = np.exp(-Dividend * Time)
+    discountedSpot = UnderlyingPrice * carryDiscount
+    price = Sign * (discountedSpot * CdfOne - discountedStrike * CdfTwo)
+    theta = (
+        -(discountedSpot * Volatility * NdOne) / (2 * sqrtTime)
+        - Sign * Rate * discountedStrike * CdfTwo
+        + Sign * Dividend * discountedSpot * CdfOne
+    ) / 365
+    greeks = GreeksResult(
+        Price=price,
+        Delta=Sign * carryDiscount * CdfOne,
+        Theta=theta,
+        Vega=0.01 * discountedSpot * sqrtTime * NdOne,
+        Gamma=carryDiscount * NdOne / (UnderlyingPrice * volSqrtTime),
+        Rho=0.01 * Sign * Time * discountedStrike * CdfTwo,
+    )
+    if not HigherOrder:
+        return greeks
+    density = carryDiscount * NdOne
+    gamma = density / (UnderlyingPrice * volSqrtTime)
+    drift = (2 * (Rate - Dividend) * Time - dTwo * volSqrtTime) / (2 * Time * volSqrtTime)
+    return greeks, HigherOrderGreeksResult(
+        Vanna=-0.01 * density * dTwo / Volatility,
+        Volga=0.0001 * UnderlyingPrice * sqrtTime * density * dOne * dTwo / Volatility,
+        Charm=(Sign * Dividend * carryDiscount * CdfOne - density * drift) / 365,
+        Speed=-gamma / UnderlyingPrice * (dOne / volSqrtTime + 1),
+        Color=gamma / (2 * Time) * (2 * Dividend * Time + 1 + 2 * Time * drift * dOne) / 365,
+        DividendRho=-0.01 * Sign * Time * UnderlyingPrice * carryDiscount * CdfOne,
+    )
+
+def _EuropeanPrice(Sign, UnderlyingPrice, StrikePrice, Time, Rate, Carry, Volatility):
+    """
+
+        Taşıma oranı (Carry = r - q) ile Avrupa fiyatını ve d1'i döndürür; greeks gerekmeyen
+        yeniden değerlemelerde _BlackScholes'tan daha ucuzdur.
+
+    """
+    volSqrtTime = Volatility * np.sqrt(Time)
+    dOne = (np.log(UnderlyingPrice / StrikePrice) + (Carry + 0.5 * Volatility**2) * Time) / volSqrtTime
+    return Sign * (
+        UnderlyingPrice * np.exp((Carry - Rate) * Time) * ndtr(Sign * dOne)
+        - StrikePrice * np.exp(-Rate * Time) * ndtr(Sign * (dOne - volSqrtTime))
+    ), dOne
+
+def _FutureRisk(FutureType, UnderlyingPrice, Time, Rate, Dividend, ForeignRate, CarryAdjustment, PresentValue):
+    """
+
+        Future.TheoreticalPrice taşıma maliyeti modelini dizi girdilerle uygular. Sütunlar sırasıyla
+        fiyat, spota göre türev, iki sıfır sütun (gamma, vega), günlük theta ve %1 faiz duyarlılığıdır.
+
+    """
+    carry = np.select(
+        [
+            (FutureType == Future_Type.Stock.value) | (FutureType == Future_Type.Index.value),
+            FutureType == Future_Type.Currency.value,
+            FutureType == Future_Type.Metal.value,
+        ],
+        [Rate - Dividend, Rate - ForeignRate, Rate + CarryAdjustment],
+        default=Rate,
+    )
+    growth = np.exp(carry * Time)
+    price = np.where(
+        FutureType == Future_Type.Interest.value, UnderlyingPrice - PresentValue, UnderlyingPrice
+    ) * growth
+    zeros = np.zeros_like(price)
+    return np.stack(
+        [price, growth, zeros, zeros, -carry * price / 365, 0.01 * Time * price], axis=-1
+    )
+
+def _InitialVolatilityArrays(Sign, Spot, Strike, Time, Target):
+    call = Target + np.where(Sign < 0, Spot - Strike, 0.0)
+    half = call - 0.5 * (Spot - Strike)
+    root = np.sqrt(np.maximum(half**2 - (Spot - Strike) ** 2 / math.pi, 0))
+    guess = np.sqrt(2 * math.pi / Time) / (Spot + Strike) * (half + root)
+    return np.clip(guess, 0.01, 5.0)
+
+def _SolveImpliedVolatilityArrays(
+    Sign, UnderlyingPrice, StrikePrice, Time, Rate, Dividend, Target, Guess, Tolerance, MaxIterations
+):
+    """
+
+        _SolveImpliedVolatility ile aynı Newton/ikiye bölme adımlarını dizi girdiler üzerinde uygular.
+        Yakınsayan sözleşmeler her iterasyonda aktif kümeden çıkarılır.
+
+    """
+    Tolerance = Tolerance / 100
+    spot = UnderlyingPrice * np.exp(-Dividend * Time)
+    strike = StrikePrice * np.exp(-Rate * Time)
+    lower = np.maximum(Sign * (spot - strike), 0.0)
+    upper = np.where(Sign > 0, spot, strike)
+    volatility = np.full(spot.shape, np.nan)
+    converged = np.zeros(spot.shape, dtype=bool)
+    iterations = np.zeros(spot.shape, dtype=int)
+
+    index = np.flatnonzero((lower < Target) & (Target < upper))
+    sign, spot, strike, time, target = (
+        np.ravel(values)[index] for values in (Sign, spot, strike, Time, Target)
+    )
+    sigma = _InitialVolatilityArrays(sign, spot, strike, time, target)
+    if Guess is not None:
+        guess = np.ravel(np.broadcast_to(Guess, volatility.shape))[index]
+        sigma = np.where((guess > 0) & (guess < _MAX_VOLATILITY), guess, sigma)
+    sqrtTime = np.sqrt(time)
+    moneyness = np.log(spot / strike)
+    low = np.zeros(index.size)
+    high = np.full(index.size, _MAX_VOLATILITY)
+
+    flatVolatility = volatility.reshape(-1)
+    flatConverged = converged.reshape(-1)
+    flatIterations = iterations.reshape(-1)
+    for iteration in range(1, MaxIterations + 1):
+        if index.size == 0:
+            break
+        volSqrtTime = sigma * sqrtTime
+        dOne = moneyness / volSqrtTime + 0.5 * volSqrtTime
+        price = sign * (spot * ndtr(sign * dOne) - strike * ndtr(sign * (dOne - volSqrtTime)))
+        difference = price - target
+        high = np.where(difference > 0, sigma, high)
+        low = np.where(difference > 0, low, sigma)
+        vega = spot * sqrtTime * np.exp(-0.5 * dOne**2) / math.sqrt(2 * math.pi)
+        step = sigma - difference / vega
+        step = np.where((low <= step) & (step <= high), step, 0.5 * (low + high))
+
+        done = np.abs(step - sigma) < Tolerance
+        sigma = step
+        flatVolatility[index[done]] = 100 * sigma[done]
+        flatConverged[index[done]] = True
+        flatIterations[index[done]] = iteration
+
+        keep = ~done
+        index, sign, spot, strike, target, sqrtTime, moneyness, low, high, sigma = (
+            values[keep]
+            for values in (index, sign, spot, strike, target, sqrtTime, moneyness, low, high, sigma)
+        )
+    flatVolatility[index] = 100 * sigma
+    flatIterations[index] = MaxIterations
+    return ImpliedVolatilityResult(volatility, converged, iterations)
+
+class OptionBatch:
+    _FRAME_COLUMNS = (
+        "Type",
+        "UnderlyingPrice",
+        "StrikePrice",
+        "DaysToMaturity",
+        "DomesticRate",
+        "ImpliedVolatility",
+        "Dividend",
+    )
+
+    def __init__(
+        self,
+        Type,
+        UnderlyingPrice,
+        StrikePrice,
+        DaysToMaturity,
+        DomesticRate,
+        ImpliedVolatility,
+        Dividend,
+    ):
+        (
+            self._Sign,
+            self._UnderlyingPrice,
+            self._StrikePrice,
+            self._DaysToMaturity,
+            self._DomesticRate,
+            self._ImpliedVolatility,
+            self._Dividend,
+        ) = np.broadcast_arrays(
+            _OptionSign(Type),
+            np.asarray(UnderlyingPrice, dtype=float),
+            np.asarray(StrikePrice, dtype=float),
+            np.asarray(DaysToMaturity, dtype=float),
+            np.asarray(DomesticRate, dtype=float),
+            np.asarray(ImpliedVolatility, dtype=float),
+            np.asarray(Dividend, dtype=float),
+        )
+        self.__DaysToMaturity = self._DaysToMaturity / 365
+        self.__DomesticRate = self._DomesticRate / 100
+        self.__ImpliedVolatility = self._ImpliedVolatility / 100
+        self.__Dividend = self._Dividend / 100
+        self.__greeks = None
+        self.__higher = None
+
+    @classmethod
+    def FromFrame(cls, frame):
+        """
+
+            Type, UnderlyingPrice, StrikePrice, DaysToMaturity, DomesticRate, ImpliedVolatility
+            ve Dividend kolonlarını içeren bir DataFrame'den toplu opsiyon nesnesi oluşturur.
+
+        """
+        return cls(*(frame[column].to_numpy() for column in cls._FRAME_COLUMNS))
+
+    def __len__(self):
+        return self._Sign.size
+
+    def Greeks(self):
+        """
+
+            Fonksiyon, tüm sözleşmelerin fiyat ve greekslerini tek vektörel geçişte hesaplar
+
+        """
+        if self.__greeks is None:
+            with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                self.__greeks = _BlackScholes(
+                    self._Sign,
+                    self._UnderlyingPrice,
+                    self._StrikePrice,
+                    self.__DaysToMaturity,
+                    self.__DomesticRate,
+                    self.__ImpliedVolatility,
+                    self.__Dividend,
+                )
+        return self.__greeks
+
+    def HigherOrderGreeks(self):
+        """
+
+            Fonksiyon, vanna, volga, charm, speed, color ve temettü rho'sunu birinci derece greekslerle
+            aynı vektörel geçişte hesaplar (birimler için bkz. OptionCalculate.HigherOrderGreeks)
+
+        """
+        if self.__higher is None:
+            with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                greeks, self.__higher = _BlackScholes(
+                    self._Sign,
+                    self._UnderlyingPrice,
+                    self._StrikePrice,
+                    self.__DaysToMaturity,
+                    self.__DomesticRate,
+                    self.__ImpliedVolatility,
+                    self.__Dividend,
+                    HigherOrder=True,
+                )
+            if self.__greeks is None:
+                self.__greeks = greeks
+        return self.__higher
+
+    def Price(self):
+        return self.Greeks().Price
+
+    def Delta(self):
+        return self.Greeks().Delta
+
+    def Theta(self):
+        return self.Greeks().Theta
+
+    def PercentTheta(self):
+        greeks = self.Greeks()
+        return 100 * (((greeks.Price + greeks.Theta) / greeks.Price) - 1)
+
+    def Vega(self):
+        return self.Greeks().Vega
+
+    def Gamma(self):
+        return self.Greeks().Gamma
+
+    def Rho(self):
+        return self.Greeks().Rho
+
+    def Vanna(self):
+        return self.HigherOrderGreeks().Vanna
+
+    def Volga(self):
+        return self.HigherOrderGreeks().Volga
+
+    def Charm(self):
+        return self.HigherOrderGreeks().Charm
+
+    def Speed(self):
+        return self.HigherOrderGreeks().Speed
+
+    def Color(self):
+        return self.HigherOrderGreeks().Color
+
+    def DividendRho(self):
+        return self.HigherOrderGreeks().DividendRho
+
+    def SolveImpliedVolatility(self, MarketPrice, Tolerance=1e-6, MaxIterations=100):
+        """
+
+            Fonksiyon, piyasa fiyatlarından tüm sözleşmelerin zımni volatilitelerini vektörel olarak hesaplar.
+            Mevcut volatiliteler başlangıç tahmini olarak kullanılır.
+
+        """
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            return _SolveImpliedVolatilityArrays(
+                self._Sign,
+                self._UnderlyingPrice,
+                self._StrikePrice,
+                self.__DaysToMaturity,
+                self.__DomesticRate,
+                self.__Dividend,
+                np.broadcast_to(np.asarray(MarketPrice, dtype=float), self._Sign.shape),
+                self.__ImpliedVolatility,
+                Tolerance,
+                MaxIterations,
+            )
+
+class WarrantBatch(OptionBatch):
+    _FRAME_COLUMNS = OptionBatch._FRAME_COLUMNS + ("ConversionRate",)
+
+    def __init__(
+        self,
+        Type,
+        UnderlyingPrice,
+        StrikePrice,
+        DaysToMaturity,
+        DomesticRate,
+        ImpliedVolatility,
+        Dividend,
+        ConversionRate=1,
+    ):
+        super().__init__(
+            Type,
+            UnderlyingPrice,
+            StrikePrice,
+            DaysToMaturity,
+            DomesticRate,
+            ImpliedVolatility,
+            Dividend,
+        )
+        self._ConversionRate = np.broadcast_to(
+            np.asarray(ConversionRate, dtype=float), self._Sign.shape
+        )
+        self.__greeks = None
+        self.__higher = None
+        self.__analytics = None
+
+    def Greeks(self):
+        if self.__greeks is None:
+            greeks = super().Greeks()
+            self.__greeks = greeks._replace(
+                Price=greeks.Price * self._ConversionRate,
+                Theta=greeks.Theta * self._ConversionRate,
+                Vega=greeks.Vega * self._ConversionRate,
+                Rho=greeks.Rho * self._ConversionRate,
+            )
+        return self.__greeks
+
+    def HigherOrderGreeks(self):
+        if self.__higher is None:
+            higher = super().HigherOrderGreeks()
+            self.__higher = higher._replace(
+                Volga=higher.Volga * self._ConversionRate,
+                DividendRho=higher.DividendRho * self._ConversionRate,
+            )
+        return self.__higher
+
+    def SolveImpliedVolatility(self, MarketPrice, Tolerance=1e-6, MaxIterations=100):
+        return super().SolveImpliedVolatility(
+            np.asarray(MarketPrice, dtype=float) / self._ConversionRate,
+            Tolerance,
+            MaxIterations,
+        )
+
+    def Analytics(self):
+        """
+
+            Fonksiyon, fiyat, greeksler ve ihraççı göstergelerini (kaldıraç, duyarlılık, esneklik, içsel değer,
+            zaman değeri, maliyet farkı) WarrantCalculate ile aynı tanımlarla tek vektörel geçişte hesaplar
+
+        """
+        if self.__analytics is None:
+            greeks = self.Greeks()
+            spot = self._UnderlyingPrice
+            conversion = self._ConversionRate
+            call = self._Sign > 0
+            with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                basicLeverage = spot / greeks.Price * conversion
+                basicValue = np.where(call, spot - self._StrikePrice, self._StrikePrice - spot) * conversion
+                costDifference = greeks.Price / conversion + np.where(
+                    call, self._StrikePrice - spot, spot - self._StrikePrice
+                )
+                self.__analytics = WarrantAnalyticsResult(
+                    *greeks,
+                    BasicLeverage=basicLeverage,
+                    Leverage=np.round(np.abs(basicLeverage * greeks.Delta)),
+                    Sensitivity=1 / (greeks.Delta * conversion) / 100,
+                    Flexibility=basicLeverage,
+                    BasicValue=basicValue,
+                    TimeValue=greeks.Price - basicValue,
+                    CostDifference=costDifference,
+                    PercentCostDifference=costDifference / spot * 100,
+                )
+        return self.__analytics
+
+    def BasicLeverage(self):
+        return self.Analytics().BasicLeverage
+
+    def Leverage(self):
+        return self.Analytics().Leverage
+
+    def Sensitivity(self):
+        return self.Analytics().Sensitivity
+
+    def Flexibility(self):
+        return self.Analytics().Flexibility
+
+    def BasicValue(self):
+        return self.Analytics().BasicValue
+
+    def TimeValue(self):
+        return self.Analytics().TimeValue
+
+    def CostDifference(self):
+        return self.Analytics().CostDifference
+
+    def PercentCostDifference(self):
+        return self.Analytics().PercentCostDifference
+
+def price_batch(types, spots=None, strikes=None, days=None, rates=None, vols=None, divs=None):
+    """
+
+        Fonksiyon, dizi girdiler ya da OptionBatch.FromFrame kolonlarını içeren bir DataFrame için
+        fiyat ve greeksleri dizi olarak döndürür. pd.DataFrame(sonuc._asdict()) ile tabloya çevrilebilir.
+
+    """
+    if hasattr(types, "columns"):
+        batch = OptionBatch.FromFrame(types)
+    else:
+        batch = OptionBatch(types, spots, strikes, days, rates, vols, divs)
+    return batch.Greeks()
+
+def warrant_analytics(
+    types, spots=None, strikes=None, days=None, rates=None, vols=None, divs=None, conversion_rates=1
+):
+    """
+
+        Fonksiyon, bir varant ihraç tablosu (dizi girdiler ya da WarrantBatch.FromFrame kolonlarını içeren
+        DataFrame) için fiyat, greeksler ve ihraççı göstergelerini kolon dizileri olarak döndürür.
+        pd.DataFrame(sonuc._asdict()) ile tabloya çevrilebilir.
+
+    """
+    if hasattr(types, "columns"):
+        frame = types
+        if "ConversionRate" not in frame.columns:
+            frame = frame.assign(ConversionRate=conversion_rates)
+        batch = WarrantBatch.FromFrame(frame)
+    else:
+        batch = WarrantBatch(types, spots, strikes, days, rates, vols, divs, conversion_rates)
+    return batch.Analytics()
+
+def implied_volatility_batch(
+    types,
+    spots=None,
+    strikes=None,
+    days=None,
+    rates=None,
+    divs=None,
+    prices=None,
+    conversion_rates=1,
+    Tolerance=1e-6,
+    MaxIterations=100,
+):
+    """
+
+        Fonksiyon, bir opsiyon/varant zinciri için piyasa fiyatlarından yüzde cinsinden zımni
+        volatiliteleri, yakınsama bilgisi ve iterasyon sayılarıyla birlikte dizi olarak döndürür.
+        DataFrame verilirse MarketPrice ve isteğe bağlı ConversionRate kolonları da okunur.
+
+    """
+    if hasattr(types, "columns"):
+        frame = types
+        types, spots, strikes, days, rates, divs, prices = (
+            frame[column].to_numpy()
+            for column in (
+                "Type",
+                "UnderlyingPrice",
+                "StrikePrice",
+                "DaysToMaturity",
+                "DomesticRate",
+                "Dividend",
+                "MarketPrice",
+            )
+        )
+        if "ConversionRate" in frame.columns:
+            conversion_rates = frame["ConversionRate"].to_numpy()
+    sign, spots, strikes, days, rates, divs, prices, conversion_rates = np.broadcast_arrays(
+        _OptionSign(types),
+        np.asarray(spots, dtype=float),
+        np.asarray(strikes, dtype=float),
+        np.asarray(days, dtype=float),
+        np.asarray(rates, dtype=float),
+        np.asarray(divs, dtype=float),
+        np.asarray(prices, dtype=float),
+        np.asarray(conversion_rates, dtype=float),
+    )
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        return _SolveImpliedVolatilityArrays(
+            sign,
+            spots,
+            strikes,
+            days / 365,
+            rates / 100,
+            divs / 100,
+            prices / conversion_rates,
+            None,
+            Tolerance,
+            MaxIterations,
+        )
@@ -0,0 +1,270 @@
+import math
+
+import numpy as np
+from scipy.special import ndtr
+
+from .batch import _OptionSign, _SolveImpliedVolatilityArrays
+from .core import GreeksResult
+from .enums import Future_Type
+
+def _Black76(Sign, FuturePrice, StrikePrice, Time, Rate, Volatility):
+    """
+
+        Black-76 fiyatını ve vadeli fiyata göre greeksleri dizi girdilerle tek geçişte hesaplar.
+        Theta vadeli fiyat sabitken günlük, Rho vadeli fiyat sabitken %1 faiz değişimi içindir.
+
+    """
+    sqrtTime = np.sqrt(Time)
+    volSqrtTime = Volatility * sqrtTime
+    dOne = (np.log(FuturePrice / StrikePrice) + 0.5 * Volatility**2 * Time) / volSqrtTime
+    discount = np.exp(-Rate * Time)
+    NdOne = np.exp(-0.5 * dOne**2) / math.sqrt(2 * math.pi)
+    CdfOne = ndtr(Sign * dOne)
+    price = Sign * discount * (FuturePrice * CdfOne - StrikePrice * ndtr(Sign * (dOne - volSqrtTime)))
+    return GreeksResult(
+        Price=price,
+        Delta=Sign * discount * CdfOne,
+        Theta=(Rate * price - discount * FuturePrice * NdOne * Volatility / (2 * sqrtTime)) / 365,
+        Vega=0.01 * discount * FuturePrice * sqrtTime * NdOne,
+        Gamma=discount * NdOne / (FuturePrice * volSqrtTime),
+        Rho=-0.01 * Time * price,
+    )
+
+class FutureOptionBatch:
+    """
+
+        Vadeli işlem sözleşmeleri üzerine yazılmış opsiyonları Black-76 ile toplu fiyatlar. Vadeli fiyat
+        gözlenen değer olarak verilebilir ya da FromFuture / FromCurve ile Future.TheoreticalPrice /
+        FutureCurve.TheoreticalPrices taşıma modelinden türetilir. Girdiler yayınlanabilir (broadcast) dizilerdir;
+        örneğin StrikePrice[:, None] ile kullanım fiyatı x vade ızgarası tek çağrıda fiyatlanır.
+        Delta ve Gamma vadeli fiyata göredir; GarmanKohlhagen ile kurulan döviz opsiyonlarında spota göredir.
+        Fiyat, Theta, Vega ve Rho varantlardaki gibi ConversionRate ile ölçeklenir.
+
+    """
+
+    def __init__(
+        self,
+        Type,
+        FuturePrice,
+        StrikePrice,
+        DaysToMaturity,
+        DomesticRate,
+        ImpliedVolatility,
+        ConversionRate=1,
+    ):
+        (
+            self._Sign,
+            self._FuturePrice,
+            self._StrikePrice,
+            self._DaysToMaturity,
+            self._DomesticRate,
+            self._ImpliedVolatility,
+            self._ConversionRate,
+        ) = np.broadcast_arrays(
+            _OptionSign(Type),
+            np.asarray(FuturePrice, dtype=float),
+            np.asarray(StrikePrice, dtype=float),
+            np.asarray(DaysToMaturity, dtype=float),
+            np.asarray(DomesticRate, dtype=float),
+            np.asarray(ImpliedVolatility, dtype=float),
+            np.asarray(ConversionRate, dtype=float),
+        )
+        self.__Time = self._DaysToMaturity / 365
+        self.__Rate = self._DomesticRate / 100
+        self._UnderlyingPrice = None
+        self._ForeignRate = None
+        self.__greeks = None
+
+    @classmethod
+    def FromFuture(
+        cls,
+        Contract,
+        Type,
+        StrikePrice,
+        ImpliedVolatility,
+        DaysToMaturity=None,
+        AnnualStorageCostRate=0,
+        GoldLeaseRate=0,
+        PresentValue=1,
+        ConversionRate=1,
+        GarmanKohlhagen=False,
+    ):
+        """
+
+            Fonksiyon, bir Future nesnesinin teorik fiyatını dayanak alan opsiyonları oluşturur.
+            DaysToMaturity verilmezse opsiyon vadesi vadeli işlemin vadesine eşit kabul edilir.
+            GarmanKohlhagen=True ise Future_Type.Currency sözleşmesinin spot kuru ve faizleriyle
+            spot döviz opsiyonları kurulur.
+
+        """
+        days = Contract._DaysToMaturity if DaysToMaturity is None else DaysToMaturity
+        if GarmanKohlhagen:
+            if Contract.Type != Future_Type.Currency:
+                raise TypeError("Garman-Kohlhagen pricing is defined for Currency futures.")
+            return cls.GarmanKohlhagen(
+                Type,
+                Contract._UnderlyingPrice,
+                StrikePrice,
+                days,
+                Contract._DomesticRate,
+                Contract._ForeignRate,
+                ImpliedVolatility,
+                ConversionRate,
+            )
+        return cls(
+            Type,
+            Contract.TheoreticalPrice(AnnualStorageCostRate, GoldLeaseRate, PresentValue),
+            StrikePrice,
+            days,
+            Contract._DomesticRate,
+            ImpliedVolatility,
+            ConversionRate,
+        )
+
+    @classmethod
+    def FromCurve(cls, Curve, Type, StrikePrice, ImpliedVolatility, DaysToMaturity=None, ConversionRate=1):
+        """
+
+            Fonksiyon, bir FutureCurve'ün her vadesi için teorik vadeli fiyatı dayanak alan opsiyonları
+            oluşturur. Son eksen eğrinin vadeleridir; iskonto için eğrinin yerel faizleri kullanılır.
+
+        """
+        return cls(
+            Type,
+            Curve.TheoreticalPrices(),
+            StrikePrice,
+            Curve._DaysToMaturity if DaysToMaturity is None else DaysToMaturity,
+            Curve._DomesticRate,
+            ImpliedVolatility,
+            ConversionRate,
+        )
+
+    @classmethod
+    def GarmanKohlhagen(
+        cls,
+        Type,
+        UnderlyingPrice,
+        StrikePrice,
+        DaysToMaturity,
+        DomesticRate,
+        ForeignRate,
+        ImpliedVolatility,
+        ConversionRate=1,
+    ):
+        """
+
+            Fonksiyon, spot döviz opsiyonlarını Garman-Kohlhagen modeliyle kurar. Vadeli kur
+            Future_Type.Currency taşıma modeliyle (S e^((r - rf)T)) hesaplanır; Delta, Gamma, Theta ve Rho
+            spot kur sabit tutularak verilir, yabancı faiz duyarlılığı ForeignRho ile alınır.
+
+        """
+        days = np.asarray(DaysToMaturity, dtype=float)
+        carry = (np.asarray(DomesticRate, dtype=float) - np.asarray(ForeignRate, dtype=float)) / 100
+        batch = cls(
+            Type,
+            np.asarray(UnderlyingPrice, dtype=float) * np.exp(carry * days / 365),
+            StrikePrice,
+            days,
+            DomesticRate,
+            ImpliedVolatility,
+            ConversionRate,
+        )
+        batch._UnderlyingPrice, batch._ForeignRate = np.broadcast_arrays(
+            np.asarray(UnderlyingPrice, dtype=float), np.asarray(ForeignRate, dtype=float), batch._Sign
+        )[:2]
+        return batch
+
+    def __len__(self):
+        return self._Sign.size
+
+    def Greeks(self):
+        """
+
+            Fonksiyon, tüm sözleşmelerin fiyat ve greekslerini tek vektörel geçişte hesaplar
+
+        """
+        if self.__greeks is None:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                greeks = _Black76(
+                    self._Sign,
+                    self._FuturePrice,
+                    self._StrikePrice,
+                    self.__Time,
+                    self.__Rate,
+                    self._ImpliedVolatility / 100,
+                )
+                if self._UnderlyingPrice is not None:
+                    growth = self._FuturePrice / self._UnderlyingPrice
+                    carry = self.__Rate - self._ForeignRate / 100
+                    forwardDelta = greeks.Delta * self._FuturePrice
+                    greeks = greeks._replace(
+                        Delta=greeks.Delta * growth,
+                        Gamma=greeks.Gamma * growth**2,
+                        Theta=greeks.Theta - carry * forwardDelta / 365,
+                        Rho=greeks.Rho + 0.01 * self.__Time * forwardDelta,
+                    )
+            conversion = self._ConversionRate
+            self.__greeks = greeks._replace(
+                Price=greeks.Price * conversion,
+                Theta=greeks.Theta * conversion,
+                Vega=greeks.Vega * conversion,
+                Rho=greeks.Rho * conversion,
+            )
+        return self.__greeks
+
+    def Price(self):
+        return self.Greeks().Price
+
+    def Delta(self):
+        return self.Greeks().Delta
+
+    def Theta(self):
+        return self.Greeks().Theta
+
+    def Vega(self):
+        return self.Greeks().Vega
+
+    def Gamma(self):
+        return self.Greeks().Gamma
+
+    def Rho(self):
+        return self.Greeks().Rho
+
+    def ForeignRho(self):
+        """
+
+            Fonksiyon, Garman-Kohlhagen döviz opsiyonlarında yabancı faizdeki %1 değişime duyarlılığı döndürür
+
+        """
+        if self._UnderlyingPrice is None:
+            raise TypeError("Foreign rho is defined for options built with GarmanKohlhagen.")
+        return -0.01 * self.__Time * self.Delta() * self._UnderlyingPrice * self._ConversionRate
+
+    def SolveImpliedVolatility(self, MarketPrice, Tolerance=1e-6, MaxIterations=100):
+        """
+
+            Fonksiyon, piyasa fiyatlarından Black-76 zımni volatilitelerini vektörel olarak hesaplar.
+            Mevcut volatiliteler başlangıç tahmini olarak kullanılır.
+
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return _SolveImpliedVolatilityArrays(
+                self._Sign,
+                self._FuturePrice,
+                self._StrikePrice,
+                self.__Time,
+                self.__Rate,
+                self.__Rate,
+                np.broadcast_to(np.asarray(MarketPrice, dtype=float), self._Sign.shape) / self._ConversionRate,
+                self._ImpliedVolatility / 100,
+                Tolerance,
+                MaxIterations,
+            )
+
+def price_black76(types, futures, strikes, days, rates, vols, conversion_rates=1):
+    """
+
+        Fonksiyon, vadeli işlem opsiyonları için Black-76 fiyat ve greekslerini dizi olarak döndürür
+
+    """
+    return FutureOptionBatch(types, futures, strikes, days, rates, vols, conversion_rates).Greeks()
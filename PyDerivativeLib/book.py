@@ -0,0 +1,326 @@
+import numpy as np
+
+from .batch import _BlackScholes, _FutureRisk, _OptionSign
+from .core import OptionCalculate
+from .enums import Future_Type
+from .futures import Future
+
+_RISK_FIELDS = ("Value", "Delta", "Gamma", "Vega", "Theta", "Rho")
+_OPTION, _FUTURE = 0, 1
+_COLUMNS = {
+    "Kind": np.int8,
+    "Underlying": np.int64,
+    "Sign": float,
+    "StrikePrice": float,
+    "DaysToMaturity": float,
+    "DomesticRate": float,
+    "ImpliedVolatility": float,
+    "Dividend": float,
+    "ConversionRate": float,
+    "FutureType": np.int8,
+    "ForeignRate": float,
+    "CarryAdjustment": float,
+    "PresentValue": float,
+    "Quantity": float,
+}
+
+def _Grow(Array, Capacity, Count):
+    # np.resize boş kapasiteyi mevcut satırların kopyalarıyla doldurur; yeni alan sıfırlı ayrılıp kopyalanır
+    grown = np.zeros((Capacity, *Array.shape[1:]), dtype=Array.dtype)
+    grown[:Count] = Array[:Count]
+    return grown
+
+class Book:
+    """
+
+        Opsiyon, varant ve vadeli işlem pozisyonlarını kolon bazlı dizilerde tutar; net Delta, Gamma, Vega,
+        Theta, Rho ve değeri dayanak varlık bazında ve toplamda izler. Bir pozisyon, spot ya da volatilite
+        değiştiğinde yalnızca etkilenen satırlar yeniden hesaplanır ve toplamlara farkları eklenir.
+        Delta ve Gamma dayanak varlık birimi cinsindendir (miktar ve dönüşüm oranı ile çarpılır).
+
+    """
+
+    def __init__(self, Capacity=1024):
+        self.__size = 0
+        self.__columns = {name: np.zeros(Capacity, dtype=dtype) for name, dtype in _COLUMNS.items()}
+        self.__risk = np.zeros((Capacity, len(_RISK_FIELDS)))
+        self.__underlyings = {}
+        self.__spots = np.zeros(0)
+        self.__rows = {}
+        self.__byUnderlying = np.zeros((0, len(_RISK_FIELDS)))
+        self.__total = np.zeros(len(_RISK_FIELDS))
+
+    def __len__(self):
+        return self.__size
+
+    def __Register(self, Underlyings):
+        start = len(self.__underlyings)
+        count = start + len(Underlyings)
+        if count > self.__spots.size:
+            capacity = max(2 * self.__spots.size, count, 16)
+            self.__spots = _Grow(self.__spots, capacity, start)
+            self.__byUnderlying = _Grow(self.__byUnderlying, capacity, start)
+        self.__spots[start:count] = np.nan
+        for index, name in enumerate(Underlyings, start):
+            self.__underlyings[name] = index
+
+    def __UnderlyingIndex(self, Underlying):
+        if Underlying not in self.__underlyings:
+            self.__Register([Underlying])
+        return self.__underlyings[Underlying]
+
+    def __UnderlyingIndices(self, Underlyings):
+        # Adlar pozisyon başına değil, tekil ad başına çözülür; yalnızca yeni adlar kaydedilir
+        names, inverse = np.unique(Underlyings, return_inverse=True)
+        names = names.tolist()
+        self.__Register([name for name in names if name not in self.__underlyings])
+        return np.array([self.__underlyings[name] for name in names], dtype=np.int64)[inverse.reshape(-1)]
+
+    def __Append(self, Underlying, UnderlyingPrice, **values):
+        underlyings = np.atleast_1d(np.asarray(Underlying, dtype=object))
+        count = underlyings.size
+        if self.__size + count > self.__risk.shape[0]:
+            capacity = max(2 * self.__risk.shape[0], self.__size + count, 16)
+            for name, column in self.__columns.items():
+                self.__columns[name] = _Grow(column, capacity, self.__size)
+            self.__risk = _Grow(self.__risk, capacity, self.__size)
+        rows = np.arange(self.__size, self.__size + count)
+        self.__size += count
+        indices = self.__UnderlyingIndices(underlyings)
+        self.__columns["Underlying"][rows] = indices
+        for name, value in values.items():
+            self.__columns[name][rows] = value
+        self.__risk[rows] = 0
+        for index in np.unique(indices):
+            self.__rows.pop(index, None)
+        if UnderlyingPrice is not None:
+            prices = np.broadcast_to(np.asarray(UnderlyingPrice, dtype=float), (count,))
+            unset = np.isnan(self.__spots[indices])
+            self.__spots[indices[unset]] = prices[unset]
+        self.__Refresh(rows)
+        return rows.item() if np.ndim(Underlying) == 0 else rows
+
+    def AddOption(
+        self,
+        Underlying,
+        Type,
+        StrikePrice,
+        DaysToMaturity,
+        DomesticRate,
+        ImpliedVolatility,
+        Dividend,
+        Quantity,
+        ConversionRate=1,
+        UnderlyingPrice=None,
+    ):
+        """
+
+            Fonksiyon, bir opsiyon (ConversionRate verilirse varant) pozisyonu ekler ve satır numarasını döndürür.
+            Dizi girdilerle çok sayıda pozisyon tek seferde eklenir ve satır numaraları dizi olarak döner.
+
+        """
+        return self.__Append(
+            Underlying,
+            UnderlyingPrice,
+            Kind=_OPTION,
+            Sign=_OptionSign(Type),
+            StrikePrice=StrikePrice,
+            DaysToMaturity=DaysToMaturity,
+            DomesticRate=DomesticRate,
+            ImpliedVolatility=ImpliedVolatility,
+            Dividend=Dividend,
+            ConversionRate=ConversionRate,
+            Quantity=Quantity,
+        )
+
+    def AddFuture(
+        self,
+        Underlying,
+        Type: Future_Type,
+        DaysToMaturity,
+        DomesticRate,
+        ForeignRate,
+        Dividend,
+        Quantity,
+        AnnualStorageCostRate=0,
+        GoldLeaseRate=0,
+        PresentValue=1,
+        UnderlyingPrice=None,
+    ):
+        """
+
+            Fonksiyon, bir ya da (dizi girdilerle) çok sayıda vadeli işlem pozisyonu ekler;
+            taşıma maliyeti Future.TheoreticalPrice ile aynıdır
+
+        """
+        return self.__Append(
+            Underlying,
+            UnderlyingPrice,
+            Kind=_FUTURE,
+            FutureType=np.vectorize(lambda value: Future_Type(value).value)(Type),
+            DaysToMaturity=DaysToMaturity,
+            DomesticRate=DomesticRate,
+            ForeignRate=ForeignRate,
+            Dividend=Dividend,
+            CarryAdjustment=AnnualStorageCostRate - GoldLeaseRate,
+            PresentValue=PresentValue,
+            Quantity=Quantity,
+        )
+
+    def AddPosition(self, Contract, Quantity, Underlying, **FutureArguments):
+        """
+
+            Fonksiyon, bir OptionCalculate, WarrantCalculate ya da Future nesnesini pozisyon olarak ekler.
+            Dayanak varlığın spotu henüz bilinmiyorsa nesnenin spot fiyatı kullanılır.
+
+        """
+        if isinstance(Contract, OptionCalculate):
+            return self.AddOption(
+                Underlying,
+                Contract.Type,
+                Contract._StrikePrice,
+                Contract._DaysToMaturity,
+                Contract._DomesticRate,
+                Contract._ImpliedVolatility,
+                Contract._Dividend,
+                Quantity,
+                Contract.ConversionRate,
+                Contract._UnderlyingPrice,
+            )
+        if isinstance(Contract, Future):
+            return self.AddFuture(
+                Underlying,
+                Contract.Type,
+                Contract._DaysToMaturity,
+                Contract._DomesticRate,
+                Contract._ForeignRate,
+                Contract._Dividend,
+                Quantity,
+                UnderlyingPrice=Contract._UnderlyingPrice,
+                **FutureArguments,
+            )
+        raise TypeError("Contract must be an OptionCalculate, WarrantCalculate or Future.")
+
+    def __Refresh(self, Rows):
+        columns = {name: column[Rows] for name, column in self.__columns.items()}
+        spot = self.__spots[columns["Underlying"]]
+        time = columns["DaysToMaturity"] / 365
+        risk = np.zeros((Rows.size, len(_RISK_FIELDS)))
+
+        option = columns["Kind"] == _OPTION
+        if option.any():
+            with np.errstate(divide="ignore", invalid="ignore"):
+                greeks = _BlackScholes(
+                    columns["Sign"][option],
+                    spot[option],
+                    columns["StrikePrice"][option],
+                    time[option],
+                    columns["DomesticRate"][option] / 100,
+                    columns["ImpliedVolatility"][option] / 100,
+                    columns["Dividend"][option] / 100,
+                )
+            risk[option] = np.stack(
+                [greeks.Price, greeks.Delta, greeks.Gamma, greeks.Vega, greeks.Theta, greeks.Rho],
+                axis=-1,
+            ) * columns["ConversionRate"][option, None]
+        future = ~option
+        if future.any():
+            risk[future] = _FutureRisk(
+                columns["FutureType"][future],
+                spot[future],
+                time[future],
+                columns["DomesticRate"][future] / 100,
+                columns["Dividend"][future] / 100,
+                columns["ForeignRate"][future] / 100,
+                columns["CarryAdjustment"][future] / 100,
+                columns["PresentValue"][future],
+            )
+        risk *= columns["Quantity"][:, None]
+        risk[np.isnan(spot)] = 0
+
+        change = risk - self.__risk[Rows]
+        self.__risk[Rows] = risk
+        np.add.at(self.__byUnderlying, columns["Underlying"], change)
+        self.__total += change.sum(axis=0)
+
+    def __UnderlyingRows(self, Underlying):
+        underlying = self.__underlyings[Underlying]
+        rows = self.__rows.get(underlying)
+        if rows is None:
+            rows = self.__rows[underlying] = np.flatnonzero(
+                self.__columns["Underlying"][: self.__size] == underlying
+            )
+        return rows
+
+    def SetSpot(self, Underlying, UnderlyingPrice):
+        """
+
+            Fonksiyon, dayanak varlığın spotunu günceller ve yalnızca ona bağlı pozisyonları yeniden hesaplar
+
+        """
+        self.__spots[self.__UnderlyingIndex(Underlying)] = UnderlyingPrice
+        self.__Refresh(self.__UnderlyingRows(Underlying))
+
+    def SetImpliedVolatility(self, Position, ImpliedVolatility):
+        self.__columns["ImpliedVolatility"][Position] = ImpliedVolatility
+        self.__Refresh(np.atleast_1d(np.arange(self.__size)[Position]))
+
+    def SetQuantity(self, Position, Quantity):
+        self.__columns["Quantity"][Position] = Quantity
+        self.__Refresh(np.atleast_1d(np.arange(self.__size)[Position]))
+
+    def SetDaysToMaturity(self, DaysToMaturity, Position=slice(None)):
+        """
+
+            Fonksiyon, vadeye kalan günleri günceller (örneğin gün sonunda tüm defter için)
+
+        """
+        rows = np.atleast_1d(np.arange(self.__size)[Position])
+        self.__columns["DaysToMaturity"][rows] = DaysToMaturity
+        self.__Refresh(rows)
+
+    def Spot(self, Underlying):
+        return self.__spots[self.__underlyings[Underlying]]
+
+    def Positions(self):
+        """
+
+            Fonksiyon, pozisyon kolonlarını ve her pozisyonun risk katkısını dizi sözlüğü olarak döndürür
+
+        """
+        positions = {name: column[: self.__size].copy() for name, column in self.__columns.items()}
+        names = np.array(list(self.__underlyings), dtype=object)
+        positions["Underlying"] = names[positions["Underlying"]]
+        for index, field in enumerate(_RISK_FIELDS):
+            positions[field] = self.__risk[: self.__size, index].copy()
+        return positions
+
+    def Totals(self):
+        return dict(zip(_RISK_FIELDS, self.__total.tolist()))
+
+    def ByUnderlying(self):
+        return {
+            Underlying: dict(zip(_RISK_FIELDS, self.__byUnderlying[index].tolist()))
+            for Underlying, index in self.__underlyings.items()
+        }
+
+    def Stress(self, Scenarios, Mode="Full", ByPosition=True):
+        """
+
+            Fonksiyon, defteri bir ScenarioSet ile stres testine sokar (bkz. stress.stress_test)
+
+        """
+        from .stress import stress_test
+
+        return stress_test(self, Scenarios, Mode, ByPosition)
+
+    def Recalculate(self):
+        """
+
+            Fonksiyon, tüm defteri baştan hesaplayıp birikimli toplamlardaki kayan nokta sapmasını sıfırlar
+
+        """
+        self.__risk[: self.__size] = 0
+        self.__byUnderlying[:] = 0
+        self.__total[:] = 0
+        self.__Refresh(np.arange(self.__size))
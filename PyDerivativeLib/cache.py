@@ -0,0 +1,94 @@
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+class CacheStats(NamedTuple):
+    Hits: int
+    Misses: int
+    Evictions: int
+    Size: int
+    MaxSize: int
+
+    @property
+    def HitRate(self):
+        requests = self.Hits + self.Misses
+        return self.Hits / requests if requests else 0.0
+
+class GreeksCache:
+    """
+
+        Sözleşme girdileriyle anahtarlanan, en fazla MaxSize kayıt tutan ve en uzun süredir kullanılmayan
+        kaydı atan (LRU) sonuç önbelleği. SpotStep / VolatilityStep sıfırdan büyükse spot fiyat ve yüzde
+        volatilite bu adımlara yuvarlanır; yakın girdiler aynı kaydı paylaşır ve sonuç yuvarlanmış
+        değerlerle hesaplanır.
+
+    """
+
+    def __init__(self, MaxSize=100_000, SpotStep=0, VolatilityStep=0):
+        if MaxSize < 1:
+            raise ValueError("MaxSize must be at least 1.")
+        self._MaxSize = int(MaxSize)
+        self._SpotStep = SpotStep
+        self._VolatilityStep = VolatilityStep
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def __len__(self):
+        return len(self.__entries)
+
+    @staticmethod
+    def __Quantize(Value, Step):
+        return round(Value / Step) * Step if Step else Value
+
+    def Key(
+        self,
+        Type,
+        UnderlyingPrice,
+        StrikePrice,
+        DaysToMaturity,
+        DomesticRate,
+        ImpliedVolatility,
+        Dividend,
+    ):
+        return (
+            Type,
+            self.__Quantize(UnderlyingPrice, self._SpotStep),
+            StrikePrice,
+            DaysToMaturity,
+            DomesticRate,
+            self.__Quantize(ImpliedVolatility, self._VolatilityStep),
+            Dividend,
+        )
+
+    def Get(self, Key, Evaluate):
+        """
+
+            Fonksiyon, anahtar önbellekteyse kaydı döndürür; değilse Evaluate(Key) sonucunu önbelleğe ekler
+
+        """
+        with self.__lock:
+            value = self.__entries.get(Key)
+            if value is not None:
+                self.__entries.move_to_end(Key)
+                self.__hits += 1
+                return value
+            self.__misses += 1
+        value = Evaluate(Key)
+        with self.__lock:
+            self.__entries[Key] = value
+            if len(self.__entries) > self._MaxSize:
+                self.__entries.popitem(last=False)
+                self.__evictions += 1
+        return value
+
+    def Stats(self):
+        with self.__lock:
+            return CacheStats(self.__hits, self.__misses, self.__evictions, len(self.__entries), self._MaxSize)
+
+    def Clear(self):
+        with self.__lock:
+            self.__entries.clear()
+            self.__hits = self.__misses = self.__evictions = 0
@@ -0,0 +1,579 @@
+import math
+from typing import NamedTuple
+
+from .cache import GreeksCache
+from .enums import AssetType
+
+class GreeksResult(NamedTuple):
+    Price: float
+    Delta: float
+    Theta: float
+    Vega: float
+    Gamma: float
+    Rho: float
+
+class HigherOrderGreeksResult(NamedTuple):
+    Vanna: float
+    Volga: float
+    Charm: float
+    Speed: float
+    Color: float
+    DividendRho: float
+
+class ImpliedVolatilityResult(NamedTuple):
+    ImpliedVolatility: float
+    Converged: bool
+    Iterations: int
+
+_MAX_VOLATILITY = 10.0
+
+_TYPE_SIGNS = {"C": 1.0, "P": -1.0, str(AssetType.C): 1.0, str(AssetType.P): -1.0}
+
+_GREEKS_CACHE = None
+
+def _NormCdf(x):
+    return 0.5 * math.erfc(-x / math.sqrt(2))
+
+def _NormPdf(x):
+    return math.exp(-0.5 * x**2) / math.sqrt(2 * math.pi)
+
+class OptionCalculate:
+    __slots__ = (
+        "__Type",
+        "_UnderlyingPrice",
+        "_StrikePrice",
+        "_DaysToMaturity",
+        "_DomesticRate",
+        "_ImpliedVolatility",
+        "_Dividend",
+        "__DaysToMaturity",
+        "__DomesticRate",
+        "__ImpliedVolatility",
+        "__Dividend",
+        "__d_one",
+        "__d_two",
+        "__NdOne",
+        "__NdTwo",
+        "__greeks",
+        "__higher",
+    )
+
+    def __init__(
+        self,
+        Type,
+        UnderlyingPrice,
+        StrikePrice,
+        DaysToMaturity,
+        DomesticRate,
+        ImpliedVolatility,
+        Dividend,
+    ):
+        self.__Type = Type.name if isinstance(Type, AssetType) else str(Type)
+        self._UnderlyingPrice = UnderlyingPrice
+        self._StrikePrice = StrikePrice
+        self._DaysToMaturity = DaysToMaturity
+        self._DomesticRate = DomesticRate
+        self._ImpliedVolatility = ImpliedVolatility
+        self._Dividend = Dividend
+        self.__DaysToMaturity = DaysToMaturity / 365
+        self.__DomesticRate = DomesticRate / 100
+        self.__ImpliedVolatility = ImpliedVolatility / 100
+        self.__Dividend = Dividend / 100
+        self.__d_one = None
+        self.__d_two = None
+        self.__NdOne = None
+        self.__NdTwo = None
+        self.__greeks = None
+        self.__higher = None
+    
+    @property
+    def Type(self):
+        return self.__Type
+
+    @property
+    def ConversionRate(self):
+        return 1
+
+    @property
+    def dOne(self):
+        if self.__d_one is None:
+            returns = (
+                math.log(self._UnderlyingPrice / self._StrikePrice)
+                + (
+                    self.__DomesticRate
+                    - self.__Dividend
+                    + 0.5 * self.__ImpliedVolatility**2
+                )
+                * self.__DaysToMaturity
+            ) / (self.__ImpliedVolatility * math.sqrt(self.__DaysToMaturity))
+            self.__d_one = returns
+        return self.__d_one
+
+    @property
+    def NdOne(self):
+        if self.__NdOne is None:
+            returns = _NormPdf(self.dOne)
+            self.__NdOne = returns
+        return self.__NdOne
+
+    @property
+    def dTwo(self):
+        if self.__d_two is None:
+            returns = self.dOne - self.__ImpliedVolatility * math.sqrt(
+                self.__DaysToMaturity
+            )
+            self.__d_two = returns
+        return self.__d_two
+
+    @property
+    def NdTwo(self):
+        if self.__NdTwo is None:
+            returns = _NormCdf(self.dTwo)
+            self.__NdTwo = returns
+        return self.__NdTwo
+
+    def Greeks(self):
+        """
+
+            Fonksiyon, opsiyonun fiyatını ve tüm greekslerini d1/d2 ve N(.) terimlerini bir kez
+            hesaplayarak tek bir GreeksResult kaydı olarak döndürür
+
+        """
+        if self.__greeks is None:
+            if _GREEKS_CACHE is None:
+                self.__greeks = self._Evaluate()
+            else:
+                key = _GREEKS_CACHE.Key(
+                    self.__Type,
+                    self._UnderlyingPrice,
+                    self._StrikePrice,
+                    self._DaysToMaturity,
+                    self._DomesticRate,
+                    self._ImpliedVolatility,
+                    self._Dividend,
+                )
+                self.__greeks = _GREEKS_CACHE.Get(key, _EvaluateKey)
+        return self.__greeks
+
+    def _Evaluate(self):
+        Sign = _TYPE_SIGNS.get(self.__Type)
+        if Sign is None:
+            raise ValueError("C or P can be entered as option type.")
+        sqrtTime = math.sqrt(self.__DaysToMaturity)
+        CdfOne = _NormCdf(Sign * self.dOne)
+        CdfTwo = _NormCdf(Sign * self.dTwo)
+        discountedStrike = self._StrikePrice * math.exp(
+            -self.__DomesticRate * self.__DaysToMaturity
+        )
+        carryDiscount = math.exp(-self.__Dividend * self.__DaysToMaturity)
+        discountedSpot = self._UnderlyingPrice * carryDiscount
+        price = Sign * (discountedSpot * CdfOne - discountedStrike * CdfTwo)
+        theta = (
+            -(discountedSpot * self.__ImpliedVolatility * self.NdOne)
+            / (2 * sqrtTime)
+            - Sign * self.__DomesticRate * discountedStrike * CdfTwo
+            + Sign * self.__Dividend * discountedSpot * CdfOne
+        ) / 365
+        return GreeksResult(
+            Price=price,
+            Delta=Sign * carryDiscount * CdfOne,
+            Theta=theta,
+            Vega=0.01 * discountedSpot * sqrtTime * self.NdOne,
+            Gamma=carryDiscount
+            * self.NdOne
+            / (self._UnderlyingPrice * self.__ImpliedVolatility * sqrtTime),
+            Rho=0.01 * Sign * self.__DaysToMaturity * discountedStrike * CdfTwo,
+        )
+
+    def HigherOrderGreeks(self):
+        """
+
+            Fonksiyon, vanna, volga, charm, speed, color ve temettü rho'sunu Greeks ile aynı d1/d2 ve N(.)
+            terimlerinden kapalı formda hesaplar. Değerler Greeks'in döndürdüğü (e^(-qT) içeren) Delta, Gamma
+            ve Vega'nın türevleridir: Vanna ve Volga volatilite puanı başına, Charm ve Color günlük, DividendRho
+            %1 içindir.
+
+        """
+        if self.__higher is None:
+            Sign = _TYPE_SIGNS.get(self.__Type)
+            if Sign is None:
+                raise ValueError("C or P can be entered as option type.")
+            spot = self._UnderlyingPrice
+            time = self.__DaysToMaturity
+            volatility = self.__ImpliedVolatility
+            sqrtTime = math.sqrt(time)
+            volSqrtTime = volatility * sqrtTime
+            carryDiscount = math.exp(-self.__Dividend * time)
+            density = carryDiscount * self.NdOne
+            gamma = density / (spot * volSqrtTime)
+            drift = (2 * (self.__DomesticRate - self.__Dividend) * time - self.dTwo * volSqrtTime) / (
+                2 * time * volSqrtTime
+            )
+            CdfOne = _NormCdf(Sign * self.dOne)
+            self.__higher = HigherOrderGreeksResult(
+                Vanna=-0.01 * density * self.dTwo / volatility,
+                Volga=0.0001 * spot * sqrtTime * density * self.dOne * self.dTwo / volatility,
+                Charm=(Sign * self.__Dividend * carryDiscount * CdfOne - density * drift) / 365,
+                Speed=-gamma / spot * (self.dOne / volSqrtTime + 1),
+                Color=gamma
+                / (2 * time)
+                * (2 * self.__Dividend * time + 1 + 2 * time * drift * self.dOne)
+                / 365,
+                DividendRho=-0.01 * Sign * time * spot * carryDiscount * CdfOne,
+            )
+        return self.__higher
+
+    def Price(self):
+        """
+
+            Fonksiyon, gerekli parametreler girdiğinde opsiyonun Black-Scholes yöntemine göre teorik fiyatını hesaplar
+
+        """
+        return self.Greeks().Price
+
+    def Delta(self):
+        """
+
+            Fonksiyon, gerekli parametreler girdiğinde opsiyonun delta greeksini hesaplar
+
+        """
+        return self.Greeks().Delta
+
+    def Theta(self):
+        """
+
+            Fonksiyon, gerekli parametreler girdiğinde opsiyonun theta greeksini hesaplar
+
+        """
+        return self.Greeks().Theta
+
+    def PercentTheta(self):
+        """
+
+            Fonksiyon, gerekli parametreler girdiğinde opsiyonun yüzde theta greeksini hesaplar. 
+            Theta değişimişiniş fiyatı yüzde kaç değiştirir onu gösterir.
+
+        """
+        greeks = self.Greeks()
+        returns = 100 * (((greeks.Price + greeks.Theta) / greeks.Price) - 1)
+        return returns
+
+    def Vega(self):
+
+        """
+
+            Fonksiyon, gerekli parametreler girdiğinde opsiyonun vega greeksini hesaplar. 
+
+
+        """
+        return self.Greeks().Vega
+
+    def Gamma(self):
+
+        """
+
+            Fonksiyon, gerekli parametreler girdiğinde opsiyonun gamma greeksini hesaplar. 
+
+
+        """
+        return self.Greeks().Gamma
+
+    def Rho(self):
+
+        """
+
+            Fonksiyon, gerekli parametreler girdiğinde opsiyonun rho greeksini hesaplar. 
+
+
+        """
+        return self.Greeks().Rho
+
+    def Vanna(self):
+        return self.HigherOrderGreeks().Vanna
+
+    def Volga(self):
+        return self.HigherOrderGreeks().Volga
+
+    def Charm(self):
+        return self.HigherOrderGreeks().Charm
+
+    def Speed(self):
+        return self.HigherOrderGreeks().Speed
+
+    def Color(self):
+        return self.HigherOrderGreeks().Color
+
+    def DividendRho(self):
+        return self.HigherOrderGreeks().DividendRho
+
+    def Sensitivity(self):
+        returns = 1 / self.Delta() / 100
+        return returns
+
+    def Flexibility(self):
+        returns = self._UnderlyingPrice / self.Price()
+        return returns
+
+    def BasicValue(self):
+        callValue = self._UnderlyingPrice - self._StrikePrice
+        putValue = self._StrikePrice - self._UnderlyingPrice
+        if self.Type == "C":
+            returns = callValue
+        else:
+            returns = putValue
+        return returns
+
+    def TimeValue(self):
+        returns = self.Price() - self.BasicValue()
+        return returns
+
+    def CostDifference(self):
+        callValue = self.Price() + self._StrikePrice - self._UnderlyingPrice
+        putValue = self.Price() + self._UnderlyingPrice - self._StrikePrice
+        if self.Type == "C":
+            returns = callValue
+        else:
+            returns = putValue
+        return returns
+
+    def PercentCostDifference(self):
+        returns = self.CostDifference() / self._UnderlyingPrice * 100
+        return returns
+
+    def Leverage(self):
+        returns = round(abs(self._UnderlyingPrice / self.Price() * self.Delta()), 0)
+        return returns
+
+    def SolveImpliedVolatility(self, MarketPrice, Tolerance=1e-6, MaxIterations=100):
+        """
+
+            Fonksiyon, piyasa fiyatından opsiyonun zımni volatilitesini hesaplar.
+            Nesnenin mevcut volatilitesi başlangıç tahmini olarak kullanılır.
+
+        """
+        Sign = _TYPE_SIGNS.get(self.__Type)
+        if Sign is None:
+            raise ValueError("C or P can be entered as option type.")
+        return _SolveImpliedVolatility(
+            Sign,
+            self._UnderlyingPrice,
+            self._StrikePrice,
+            self.__DaysToMaturity,
+            self.__DomesticRate,
+            self.__Dividend,
+            MarketPrice,
+            self.__ImpliedVolatility,
+            Tolerance,
+            MaxIterations,
+        )
+
+class WarrantCalculate(OptionCalculate):
+    __slots__ = ("__ConversionRate", "__greeks", "__higher")
+
+    def __init__(
+        self,
+        Type,
+        UnderlyingPrice,
+        StrikePrice,
+        DaysToMaturity,
+        DomesticRate,
+        ImpliedVolatility,
+        Dividend,
+        ConversionRate=1,
+    ):
+        super().__init__(
+            Type,
+            UnderlyingPrice,
+            StrikePrice,
+            DaysToMaturity,
+            DomesticRate,
+            ImpliedVolatility,
+            Dividend,
+        )
+        self.__ConversionRate = ConversionRate
+        self.__greeks = None
+        self.__higher = None
+
+    def Greeks(self):
+        if self.__greeks is None:
+            greeks = super().Greeks()
+            self.__greeks = greeks._replace(
+                Price=greeks.Price * self.__ConversionRate,
+                Theta=greeks.Theta * self.__ConversionRate,
+                Vega=greeks.Vega * self.__ConversionRate,
+                Rho=greeks.Rho * self.__ConversionRate,
+            )
+        return self.__greeks
+
+    def HigherOrderGreeks(self):
+        """
+
+            Fonksiyon, ikinci derece greeksleri döndürür; Volga ve DividendRho Vega ve Rho gibi
+            dönüşüm oranıyla ölçeklenir, Delta ve Gamma'dan türeyenler ölçeklenmez
+
+        """
+        if self.__higher is None:
+            higher = super().HigherOrderGreeks()
+            self.__higher = higher._replace(
+                Volga=higher.Volga * self.__ConversionRate,
+                DividendRho=higher.DividendRho * self.__ConversionRate,
+            )
+        return self.__higher
+
+    @property
+    def ConversionRate(self):
+        return self.__ConversionRate
+
+    def BasicLeverage(self):
+        returns = self._UnderlyingPrice / self.Price() * self.__ConversionRate
+        return returns
+
+    def Leverage(self):
+        returns = round(abs(self.BasicLeverage() * self.Delta()), 0)
+        return returns
+
+    def Sensitivity(self):
+        returns = (1 / (self.Delta() * self.__ConversionRate)) / 100
+        return returns
+
+    def Flexibility(self):
+        return super().Flexibility() * self.__ConversionRate
+
+    def BasicValue(self):
+        return super().BasicValue() * self.__ConversionRate
+
+    def TimeValue(self):
+        return super().TimeValue()
+
+    def CostDifference(self):
+        callValue = (
+            (self.Price() / self.__ConversionRate)
+            + self._StrikePrice
+            - self._UnderlyingPrice
+        )
+        putValue = (
+            (self.Price() / self.__ConversionRate)
+            + self._UnderlyingPrice
+            - self._StrikePrice
+        )
+        if self.Type == "C":
+            returns = callValue
+        else:
+            returns = putValue
+        return returns
+
+    def PercentCostDifference(self):
+        returns = self.CostDifference() / self._UnderlyingPrice * 100
+        return returns
+
+    def SolveImpliedVolatility(self, MarketPrice, Tolerance=1e-6, MaxIterations=100):
+        return super().SolveImpliedVolatility(
+            MarketPrice / self.__ConversionRate, Tolerance, MaxIterations
+        )
+
+def _EvaluateKey(Key):
+    return OptionCalculate(*Key)._Evaluate()
+
+def enable_cache(MaxSize=100_000, SpotStep=0, VolatilityStep=0):
+    """
+
+        Fonksiyon, OptionCalculate/WarrantCalculate fiyat ve greeks hesaplarının önünde paylaşılan bir
+        LRU önbelleği etkinleştirir ve önbellek nesnesini (isabet/ıskalama istatistikleri için) döndürür
+
+    """
+    global _GREEKS_CACHE
+    _GREEKS_CACHE = GreeksCache(MaxSize, SpotStep, VolatilityStep)
+    return _GREEKS_CACHE
+
+def disable_cache():
+    global _GREEKS_CACHE
+    _GREEKS_CACHE = None
+
+def _InitialVolatility(Sign, Spot, Strike, Time, Target):
+    """
+
+        Corrado-Miller yaklaşımıyla Newton iterasyonu için başlangıç volatilitesi üretir.
+        Spot ve Strike iskonto edilmiş değerlerdir; satım fiyatları alım-satım paritesiyle çevrilir.
+
+    """
+    call = Target + (Spot - Strike if Sign < 0 else 0)
+    half = call - 0.5 * (Spot - Strike)
+    root = math.sqrt(max(half**2 - (Spot - Strike) ** 2 / math.pi, 0))
+    guess = math.sqrt(2 * math.pi / Time) / (Spot + Strike) * (half + root)
+    return min(max(guess, 0.01), 5.0)
+
+def _SolveImpliedVolatility(
+    Sign, UnderlyingPrice, StrikePrice, Time, Rate, Dividend, Target, Guess, Tolerance, MaxIterations
+):
+    """
+
+        Newton adımlarını fiyatın volatiliteye göre türevi ile atar, adım aralık dışına
+        çıkarsa ya da türev sıfırlanırsa ikiye bölme ile devam eder. Volatilite ondalık girer, yüzde döner;
+        Tolerance yüzde puan cinsinden volatilite adımıdır.
+
+    """
+    spot = UnderlyingPrice * math.exp(-Dividend * Time)
+    strike = StrikePrice * math.exp(-Rate * Time)
+    lower = max(Sign * (spot - strike), 0.0)
+    upper = spot if Sign > 0 else strike
+    if not lower < Target < upper:
+        return ImpliedVolatilityResult(math.nan, False, 0)
+    Tolerance = Tolerance / 100
+    if Guess is None or not 0 < Guess < _MAX_VOLATILITY:
+        Guess = _InitialVolatility(Sign, spot, strike, Time, Target)
+    sqrtTime = math.sqrt(Time)
+    moneyness = math.log(spot / strike)
+    low, high = 0.0, _MAX_VOLATILITY
+    sigma = Guess
+    for iteration in range(1, MaxIterations + 1):
+        volSqrtTime = sigma * sqrtTime
+        dOne = moneyness / volSqrtTime + 0.5 * volSqrtTime
+        price = Sign * (
+            spot * _NormCdf(Sign * dOne) - strike * _NormCdf(Sign * (dOne - volSqrtTime))
+        )
+        difference = price - Target
+        if difference > 0:
+            high = sigma
+        else:
+            low = sigma
+        vega = spot * sqrtTime * _NormPdf(dOne)
+        step = sigma - difference / vega if vega > 0 else math.nan
+        step = step if low <= step <= high else 0.5 * (low + high)
+        if abs(step - sigma) < Tolerance:
+            return ImpliedVolatilityResult(100 * step, True, iteration)
+        sigma = step
+    return ImpliedVolatilityResult(100 * sigma, False, MaxIterations)
+
+def implied_volatility(
+    Type,
+    UnderlyingPrice,
+    StrikePrice,
+    DaysToMaturity,
+    DomesticRate,
+    Dividend,
+    MarketPrice,
+    ConversionRate=1,
+    Tolerance=1e-6,
+    MaxIterations=100,
+):
+    """
+
+        Fonksiyon, piyasa fiyatından opsiyonun (ConversionRate verilirse varantın) yüzde cinsinden
+        zımni volatilitesini, yakınsama bilgisi ve iterasyon sayısıyla birlikte hesaplar
+
+    """
+    Sign = _TYPE_SIGNS.get(str(Type))
+    if Sign is None:
+        raise ValueError("C or P can be entered as option type.")
+    return _SolveImpliedVolatility(
+        Sign,
+        UnderlyingPrice,
+        StrikePrice,
+        DaysToMaturity / 365,
+        DomesticRate / 100,
+        Dividend / 100,
+        MarketPrice / ConversionRate,
+        None,
+        Tolerance,
+        MaxIterations,
+    )
@@ -0,0 +1,131 @@
+import numpy as np
+
+from .enums import Future_Type
+
+class RateCurve:
+    """
+
+        Vadeye kalan gün - yüzde oran noktalarından oluşan eğri. Noktalar arasında doğrusal interpolasyon,
+        uçlarda sabit ekstrapolasyon yapılır.
+
+    """
+
+    def __init__(self, DaysToMaturity, Rates):
+        days = np.asarray(DaysToMaturity, dtype=float)
+        order = np.argsort(days)
+        self._DaysToMaturity = days[order]
+        self._Rates = np.asarray(Rates, dtype=float)[order]
+
+    def __call__(self, DaysToMaturity):
+        return np.interp(DaysToMaturity, self._DaysToMaturity, self._Rates)
+
+def _CurveValues(Value, DaysToMaturity):
+    if isinstance(Value, RateCurve):
+        return Value(DaysToMaturity)
+    if isinstance(Value, tuple):
+        return RateCurve(*Value)(DaysToMaturity)
+    return np.broadcast_to(np.asarray(Value, dtype=float), DaysToMaturity.shape)
+
+class FutureCurve:
+    """
+
+        Bir dayanak varlık için birden çok vadedeki vadeli fiyatları tek vektörel çağrıda hesaplar.
+        Faiz, temettü ve yabancı faiz sabit değer, vadelerle hizalı dizi, RateCurve ya da (günler, oranlar)
+        olarak verilebilir. Future_Type dalı ve taşıma/iskonto faktörleri kurulumda bir kez hesaplanır.
+
+    """
+
+    def __init__(
+        self,
+        Type: Future_Type,
+        UnderlyingPrice,
+        DaysToMaturity,
+        DomesticRate,
+        ForeignRate=0,
+        Dividend=0,
+        AnnualStorageCostRate=0,
+        GoldLeaseRate=0,
+        PresentValue=1,
+    ):
+        self.__Type = Future_Type(Type)
+        self._UnderlyingPrice = UnderlyingPrice
+        self._DaysToMaturity = np.atleast_1d(np.asarray(DaysToMaturity, dtype=float))
+        self._DomesticRate = _CurveValues(DomesticRate, self._DaysToMaturity)
+        self._ForeignRate = _CurveValues(ForeignRate, self._DaysToMaturity)
+        self._Dividend = _CurveValues(Dividend, self._DaysToMaturity)
+        self._AnnualStorageCostRate = _CurveValues(AnnualStorageCostRate, self._DaysToMaturity)
+        self._GoldLeaseRate = _CurveValues(GoldLeaseRate, self._DaysToMaturity)
+        self._PresentValue = PresentValue
+
+        self.__Time = self._DaysToMaturity / 365
+        self.__CarryRate = self.__ModelCarry() / 100
+        self.__Growth = np.exp(self.__CarryRate * self.__Time)
+        self.__Discount = np.exp(-self._DomesticRate / 100 * self.__Time)
+
+    def __ModelCarry(self):
+        match self.__Type:
+            case Future_Type.Stock | Future_Type.Index:
+                return self._DomesticRate - self._Dividend
+            case Future_Type.Currency:
+                return self._DomesticRate - self._ForeignRate
+            case Future_Type.Metal:
+                return self._DomesticRate + self._AnnualStorageCostRate - self._GoldLeaseRate
+            case Future_Type.Interest:
+                return self._DomesticRate
+
+    def __Base(self, UnderlyingPrice):
+        spot = np.asarray(
+            self._UnderlyingPrice if UnderlyingPrice is None else UnderlyingPrice, dtype=float
+        )
+        if self.__Type == Future_Type.Interest:
+            spot = spot - self._PresentValue
+        return spot[..., None]
+
+    def TheoreticalPrices(self, UnderlyingPrice=None):
+        """
+
+            Fonksiyon, tüm vadeler için teorik vadeli fiyatları döndürür. UnderlyingPrice dizi verilirse
+            her spot için bir satır olmak üzere (spot sayısı, vade sayısı) boyutlu matris döner.
+
+        """
+        return self.__Base(UnderlyingPrice) * self.__Growth
+
+    def CarryFactors(self):
+        return self.__Growth.copy()
+
+    def DiscountFactors(self):
+        return self.__Discount.copy()
+
+    def ImpliedCarry(self, FuturePrice, UnderlyingPrice=None):
+        """
+
+            Fonksiyon, gözlenen vadeli fiyatlardan yıllık yüzde taşıma oranını (ln(F / S) / T) hesaplar
+
+        """
+        base = self.__Base(UnderlyingPrice)
+        return 100 * np.log(np.asarray(FuturePrice, dtype=float) / base) / self.__Time
+
+    def ImpliedDividend(self, FuturePrice, UnderlyingPrice=None):
+        """
+
+            Fonksiyon, hisse/endeks vadelilerinde gözlenen fiyatların ima ettiği yüzde temettü verimini,
+            döviz vadelilerinde ise ima edilen yabancı faizi hesaplar
+
+        """
+        if self.__Type not in (Future_Type.Stock, Future_Type.Index, Future_Type.Currency):
+            raise TypeError("Implied dividend is defined for Stock, Index and Currency futures.")
+        return self._DomesticRate - self.ImpliedCarry(FuturePrice, UnderlyingPrice)
+
+    def ImpliedLeaseRate(self, FuturePrice, UnderlyingPrice=None):
+        """
+
+            Fonksiyon, metal vadelilerinde gözlenen fiyatların ima ettiği yüzde kiralama (lease) oranını hesaplar
+
+        """
+        if self.__Type != Future_Type.Metal:
+            raise TypeError("Implied lease rate is defined for Metal futures.")
+        return (
+            self._DomesticRate
+            + self._AnnualStorageCostRate
+            - self.ImpliedCarry(FuturePrice, UnderlyingPrice)
+        )
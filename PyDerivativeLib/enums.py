@@ -0,0 +1,24 @@
+from enum import Enum
+
+class AssetType(Enum):
+    C = 1
+    P = 2
+
+class DerivativeType(Enum):
+    Warrant = 1
+    Option = 2
+
+class Graph_Case(Enum):
+    Price = 1
+    Delta = 2
+    Theta = 3
+    Vega = 4
+    Rho = 5
+    Gamma = 6
+
+class Future_Type(Enum):
+    Stock = 1
+    Index = 2
+    Currency = 3
+    Metal = 4
+    Interest = 5
@@ -0,0 +1,52 @@
+import math
+
+from .enums import Future_Type
+
+class Future:
+    def __init__(
+        self,
+        Type,
+        UnderlyingPrice,
+        DaysToMaturity,
+        DomesticRate,
+        ForeignRate,
+        Dividend,
+    ):
+        self.__Type = Type
+        self._UnderlyingPrice = UnderlyingPrice
+        self._DaysToMaturity = DaysToMaturity
+        self._DomesticRate = DomesticRate
+        self._ForeignRate = ForeignRate
+        self._Dividend = Dividend
+        self.__DaysToMaturity = DaysToMaturity / 365
+        self.__DomesticRate = DomesticRate / 100
+        self.__ForeignRate = ForeignRate / 100
+        self.__Dividend = Dividend / 100
+
+    @property
+    def Type(self):
+        return self.__Type
+    
+    def TheoreticalPrice(self, AnnualStorageCostRate=0, GoldLeaseRate=0, PresentValue=1):
+        if self.__Type == Future_Type.Index or self.__Type == Future_Type.Stock:
+            prices = self._UnderlyingPrice * math.exp((self.__DomesticRate - self.__Dividend) * self.__DaysToMaturity)
+        elif self.__Type == Future_Type.Currency:
+            prices = self._UnderlyingPrice * math.exp((self.__DomesticRate - self.__ForeignRate) * self.__DaysToMaturity)
+        elif self.__Type == Future_Type.Metal:
+            prices = self._UnderlyingPrice * math.exp((self.__DomesticRate + (AnnualStorageCostRate / 100) - (GoldLeaseRate / 100)) * self.__DaysToMaturity)
+        elif self.__Type == Future_Type.Interest:
+            prices = (self._UnderlyingPrice - PresentValue) * math.exp(self.__DomesticRate * self.__DaysToMaturity)
+        else:
+            print(Exception)
+        return prices
+    
+    def HedgeRatio(self, MarketPrice, FuturePrice):
+        """
+
+            Fonksiyon, vadeli getirilerinin piyasa getirilerine göre OLS eğimini kapalı formda hesaplar.
+            Kayan, üstel ağırlıklı ve çevrimiçi hedge oranları için hedging modülüne bakınız.
+
+        """
+        from .hedging import hedge_ratio
+
+        return float(hedge_ratio(MarketPrice, FuturePrice))
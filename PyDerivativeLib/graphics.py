@@ -0,0 +1,200 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from .batch import OptionBatch, WarrantBatch
+from .enums import AssetType, Graph_Case
+
+class ScenarioSurface(NamedTuple):
+    GraphCase: Graph_Case
+    UnderlyingPrice: np.ndarray
+    ImpliedVolatility: np.ndarray
+    DaysToMaturity: np.ndarray
+    Values: np.ndarray
+
+    def ToFrame(self):
+        """
+
+            Fonksiyon, senaryo yüzeyini her satırı bir ızgara noktası olan uzun formatta DataFrame'e çevirir
+
+        """
+        import pandas as pd
+
+        spot, volatility, days = np.meshgrid(
+            self.UnderlyingPrice, self.ImpliedVolatility, self.DaysToMaturity, indexing="ij"
+        )
+        return pd.DataFrame(
+            {
+                "UnderlyingPrice": spot.ravel(),
+                "ImpliedVolatility": volatility.ravel(),
+                "DaysToMaturity": days.ravel(),
+                self.GraphCase.name: self.Values.ravel(),
+            }
+        )
+
+    def Save(self, Path, Kind="heatmap", X="UnderlyingPrice", Y="ImpliedVolatility", Index=0):
+        """
+
+            Fonksiyon, yüzeyin X ve Y eksenlerindeki kesitini ekran gerektirmeden dosyaya yazar.
+            Kind "heatmap" ya da "surface" olabilir; dosya biçimi (PNG, SVG, ...) uzantıdan belirlenir.
+            Üçüncü eksen Index konumunda sabitlenir.
+
+        """
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        axes = ("UnderlyingPrice", "ImpliedVolatility", "DaysToMaturity")
+        if X not in axes or Y not in axes or X == Y:
+            raise ValueError(f"X and Y must be two different axes among {axes}.")
+        fixed = next(axis for axis in axes if axis not in (X, Y))
+        values = np.take(self.Values, Index, axis=axes.index(fixed))
+        if axes.index(X) < axes.index(Y):
+            values = values.T
+        x, y = getattr(self, X), getattr(self, Y)
+
+        figure = Figure(figsize=(8, 6))
+        FigureCanvasAgg(figure)
+        if Kind == "heatmap":
+            axis = figure.add_subplot()
+            mesh = axis.pcolormesh(x, y, values, shading="auto")
+            figure.colorbar(mesh, ax=axis, label=self.GraphCase.name)
+        elif Kind == "surface":
+            axis = figure.add_subplot(projection="3d")
+            gridX, gridY = np.meshgrid(x, y)
+            axis.plot_surface(gridX, gridY, values, cmap="viridis")
+            axis.set_zlabel(self.GraphCase.name)
+        else:
+            raise ValueError("Kind can be 'heatmap' or 'surface'.")
+        axis.set_xlabel(X)
+        axis.set_ylabel(Y)
+        axis.set_title(f"{self.GraphCase.name} ({fixed} = {getattr(self, fixed)[Index]:g})")
+        figure.savefig(Path)
+        return Path
+
+class Graphs:
+    def __init__(
+        self,
+        Type,
+        Asset_Type: AssetType,
+        UnderlyingPrice,
+        StrikePrice,
+        DaysToMaturity,
+        DomesticRate,
+        ImpliedVolatility,
+        Dividend,
+        ConversionRate = 1
+    ):
+        self.__Type = str(Type)
+        self.__assetType = Asset_Type
+        self._UnderlyingPrice = UnderlyingPrice
+        self._StrikePrice = StrikePrice
+        self.__DaysToMaturity = DaysToMaturity
+        self.__DomesticRate = int(DomesticRate)
+        self.__ImpliedVolatility = ImpliedVolatility
+        self.__Dividend = Dividend
+        self.__ConversionRate = ConversionRate
+    
+        if any(
+            val < 0
+            for val in [
+                self._UnderlyingPrice,
+                self._StrikePrice,
+                self.__DaysToMaturity,
+                self.__DomesticRate,
+                self.__ImpliedVolatility,
+                self.__Dividend,
+                self.__ConversionRate,
+            ]
+        ):
+            raise ValueError("Values cannot be negative. Check the entered values.")
+        
+    def _Evaluate(self, GraphCase, UnderlyingPrice, ImpliedVolatility, DaysToMaturity):
+        if not isinstance(GraphCase, Graph_Case):
+            raise TypeError("Girilen grafik tipi parametresi doğru değildir.")
+        match self.__Type:
+            case "Option" | "Opsiyon":
+                batch = OptionBatch(
+                    self.__assetType,
+                    UnderlyingPrice,
+                    self._StrikePrice,
+                    DaysToMaturity,
+                    self.__DomesticRate,
+                    ImpliedVolatility,
+                    self.__Dividend,
+                )
+            case "Warrant" | "warrant":
+                batch = WarrantBatch(
+                    self.__assetType,
+                    UnderlyingPrice,
+                    self._StrikePrice,
+                    DaysToMaturity,
+                    self.__DomesticRate,
+                    ImpliedVolatility,
+                    self.__Dividend,
+                    self.__ConversionRate,
+                )
+            case _:
+                raise TypeError("Girilen tip parametresi doğru değildir.")
+        return getattr(batch.Greeks(), GraphCase.name)
+
+    def DerivativeToolSimulationGraph(
+        self, GraphCase: Graph_Case = Graph_Case.Price, percentage_change=0.05, Show=True
+    ):
+        price_range = self._UnderlyingPrice * (1 + percentage_change) ** np.arange(-5, 5 + 1)
+        asset_value = self._Evaluate(
+            GraphCase, price_range, self.__ImpliedVolatility, self.__DaysToMaturity
+        )
+        for price, value in zip(price_range, asset_value):
+            print(f"Underlying Price: {price:.2f} Warrant {GraphCase.name}: {value:.6f}")
+        if Show:
+            import matplotlib.pyplot as plt
+
+            plt.plot(price_range, asset_value, marker="o")
+            plt.xlabel("Underlying Price")
+            plt.ylabel(f"Warrant {Graph_Case(GraphCase).name}")
+            plt.title(
+                f"The Relationship Option {Graph_Case(GraphCase).name} and Underlying Price"
+            )
+            plt.grid()
+            plt.show()
+        return price_range, asset_value
+
+    def ScenarioSurface(
+        self,
+        GraphCase: Graph_Case = Graph_Case.Price,
+        UnderlyingPrices=None,
+        ImpliedVolatilities=None,
+        DaysToMaturities=None,
+    ):
+        """
+
+            Fonksiyon, seçilen grafik tipini spot × volatilite × vadeye kalan gün ızgarasında tek vektörel
+            geçişte hesaplar. Verilmeyen eksenler nesnenin kendi değerine sabitlenir. Çizim yapılmaz;
+            sonuç ToFrame() ile tabloya çevrilebilir ya da Save() ile dosyaya yazılabilir.
+
+        """
+        spots = np.atleast_1d(
+            np.asarray(
+                self._UnderlyingPrice if UnderlyingPrices is None else UnderlyingPrices,
+                dtype=float,
+            )
+        )
+        volatilities = np.atleast_1d(
+            np.asarray(
+                self.__ImpliedVolatility if ImpliedVolatilities is None else ImpliedVolatilities,
+                dtype=float,
+            )
+        )
+        days = np.atleast_1d(
+            np.asarray(
+                self.__DaysToMaturity if DaysToMaturities is None else DaysToMaturities,
+                dtype=float,
+            )
+        )
+        values = self._Evaluate(
+            GraphCase,
+            spots[:, None, None],
+            volatilities[None, :, None],
+            days[None, None, :],
+        )
+        return ScenarioSurface(GraphCase, spots, volatilities, days, values)
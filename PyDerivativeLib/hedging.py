@@ -0,0 +1,135 @@
+import numpy as np
+
+def _Returns(Prices):
+    prices = np.asarray(Prices, dtype=float)
+    return prices[1:] / prices[:-1] - 1
+
+def _Pairs(MarketPrice, FuturePrice):
+    if MarketPrice is None or FuturePrice is None:
+        raise ValueError("MarketPrice and FuturePrice cannot be None.")
+    market = np.atleast_1d(np.asarray(MarketPrice, dtype=float))
+    future = np.atleast_1d(np.asarray(FuturePrice, dtype=float))
+    if market.shape != future.shape:
+        raise ValueError("MarketPrice and FuturePrice must have the same length.")
+    if market.shape[0] < 3:
+        raise ValueError("At least three prices are needed to estimate a hedge ratio.")
+    return _Returns(market), _Returns(future)
+
+def _Slope(Weight, SumX, SumY, SumXX, SumXY):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (Weight * SumXY - SumX * SumY) / (Weight * SumXX - SumX**2)
+
+def hedge_ratio(MarketPrice, FuturePrice):
+    """
+
+        Fonksiyon, vadeli getirilerinin piyasa getirilerine göre en küçük kareler eğimini kapalı formda hesaplar
+        (Future.HedgeRatio'daki OLS modeliyle aynı). Sütunlar ayrı piyasa/vadeli çiftleri olarak vektörel işlenir.
+
+    """
+    x, y = _Pairs(MarketPrice, FuturePrice)
+    x = x - x.mean(axis=0)
+    y = y - y.mean(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (x * y).sum(axis=0) / (x * x).sum(axis=0)
+
+def rolling_hedge_ratio(MarketPrice, FuturePrice, Window):
+    """
+
+        Fonksiyon, son Window getiri üzerinden kayan hedge oranlarını döndürür. Sonuç getiri serisiyle aynı
+        uzunluktadır (fiyat sayısı - 1); ilk Window - 1 değer NaN'dır.
+
+    """
+    x, y = _Pairs(MarketPrice, FuturePrice)
+    if not 1 <= Window <= x.shape[0]:
+        raise ValueError("Window must be between 1 and the number of returns.")
+    x = x - np.nanmean(x, axis=0)
+    y = y - np.nanmean(y, axis=0)
+    zeros = np.zeros((1,) + x.shape[1:])
+    sums = [
+        np.concatenate([zeros, np.cumsum(values, axis=0)])
+        for values in (x, y, x * x, x * y)
+    ]
+    windowed = [total[Window:] - total[:-Window] for total in sums]
+    ratios = np.full(x.shape, np.nan)
+    ratios[Window - 1 :] = _Slope(Window, *windowed)
+    return ratios
+
+def ewma_hedge_ratio(MarketPrice, FuturePrice, Decay=0.94):
+    """
+
+        Fonksiyon, üstel ağırlıklı (her adımda eski gözlemler Decay ile çarpılır) hedge oranı serisini döndürür
+
+    """
+    from scipy.signal import lfilter
+
+    x, y = _Pairs(MarketPrice, FuturePrice)
+    decayed = [
+        lfilter([1.0], [1.0, -Decay], values, axis=0)
+        for values in (np.ones_like(x), x, y, x * x, x * y)
+    ]
+    return _Slope(*decayed)
+
+class HedgeRatioTracker:
+    """
+
+        Çok sayıda piyasa/vadeli çifti için hedge oranını yeni fiyatlar geldikçe O(1) maliyetle günceller.
+        Window verilirse kayan pencere, Decay verilirse üstel ağırlık, ikisi de verilmezse tüm geçmiş kullanılır.
+        Kayan pencerede toplamlar her Window güncellemede bir pencere tamponundan yeniden hesaplanır.
+
+    """
+
+    def __init__(self, Pairs=1, Window=None, Decay=None):
+        if Window is not None and Decay is not None:
+            raise ValueError("Window and Decay cannot be used together.")
+        self._Window = Window
+        self._Decay = Decay
+        self.__lastMarket = None
+        self.__lastFuture = None
+        self.__sums = np.zeros((5, Pairs))
+        self.__history = np.zeros((Window, 4, Pairs)) if Window else None
+        self.__count = 0
+
+    def Update(self, MarketPrice, FuturePrice):
+        """
+
+            Fonksiyon, her çift için yeni piyasa ve vadeli fiyatını alır ve güncel hedge oranlarını döndürür
+
+        """
+        market = np.asarray(MarketPrice, dtype=float)
+        future = np.asarray(FuturePrice, dtype=float)
+        if self.__lastMarket is not None:
+            x = market / self.__lastMarket - 1
+            y = future / self.__lastFuture - 1
+            terms = np.stack([x, y, x * x, x * y])
+            if self._Decay is not None:
+                self.__sums *= self._Decay
+            elif self._Window:
+                slot = self.__count % self._Window
+                if self.__count >= self._Window:
+                    self.__sums[1:] -= self.__history[slot]
+                    self.__sums[0] -= 1
+                self.__history[slot] = terms
+            self.__sums[0] += 1
+            self.__sums[1:] += terms
+            self.__count += 1
+            if self._Window and self.__count % self._Window == 0:
+                self.Recalculate()
+        self.__lastMarket = market
+        self.__lastFuture = future
+        return self.Ratio()
+
+    def Recalculate(self):
+        """
+
+            Fonksiyon, kayan pencere toplamlarını tampondan baştan hesaplayıp ekle-çıkar güncellemelerinin
+            biriktirdiği kayan nokta sapmasını sıfırlar
+
+        """
+        if self._Window:
+            self.__sums[0] = min(self.__count, self._Window)
+            self.__sums[1:] = self.__history.sum(axis=0)
+
+    def Ratio(self):
+        if self.__count < 2:
+            return np.full(self.__sums.shape[1], np.nan)
+        return _Slope(*self.__sums)
@@ -0,0 +1,214 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+from .core import _TYPE_SIGNS, OptionCalculate
+from .enums import AssetType
+
+PAYOFFS = ("European", "Asian", "Barrier", "Lookback")
+BARRIER_TYPES = ("UpAndOut", "UpAndIn", "DownAndOut", "DownAndIn")
+
+class MonteCarloResult(NamedTuple):
+    Price: float
+    StandardError: float
+    Paths: int
+
+def _Payoffs(Model, Generator, Count, Antithetic):
+    """
+
+        Bir parça için yolları üretir; iskontosuz ürün getirisini ve kontrol değişkeni olarak vade sonu
+        Avrupa getirisini döndürür. Antithetic açıksa her çift ortalanarak tek örnek sayılır.
+
+    """
+    sign, spot, strike, time, rate, dividend, volatility, steps, payoff, options = Model
+    step = time / steps
+    paths = Generator.standard_normal((Count, steps))
+    if Antithetic:
+        paths = np.concatenate([paths, -paths])
+    paths *= volatility * math.sqrt(step)
+    paths += (rate - dividend - 0.5 * volatility**2) * step
+    np.cumsum(paths, axis=1, out=paths)
+    if payoff == "Asian" and options["Averaging"] == "Geometric":
+        average = spot * np.exp(paths.mean(axis=1))
+    np.exp(paths, out=paths)
+    paths *= spot
+
+    terminal = paths[:, -1]
+    control = np.maximum(sign * (terminal - strike), 0.0)
+    if payoff in ("Barrier", "Lookback"):
+        # Uç değerler başlangıç spotunu da içerir; başlangıçta bariyerin ötesindeki yol dokunmuş sayılır
+        highest = np.maximum(paths.max(axis=1), spot)
+        lowest = np.minimum(paths.min(axis=1), spot)
+    if payoff == "European":
+        value = control
+    elif payoff == "Asian":
+        if options["Averaging"] == "Arithmetic":
+            average = paths.mean(axis=1)
+        value = np.maximum(sign * (average - strike), 0.0)
+    elif payoff == "Barrier":
+        barrierType = options["BarrierType"]
+        if barrierType.startswith("Up"):
+            touched = highest >= options["Barrier"]
+        else:
+            touched = lowest <= options["Barrier"]
+        alive = ~touched if barrierType.endswith("Out") else touched
+        value = np.where(alive, control, options["Rebate"])
+    else:
+        if options["Lookback"] == "Floating":
+            value = np.where(sign > 0, terminal - lowest, highest - terminal)
+        else:
+            extreme = highest if sign > 0 else lowest
+            value = np.maximum(sign * (extreme - strike), 0.0)
+
+    if Antithetic:
+        value = 0.5 * (value[:Count] + value[Count:])
+        control = 0.5 * (control[:Count] + control[Count:])
+    return value, control
+
+def _SimulateChunk(Task):
+    Model, Seed, Count, Antithetic = Task
+    value, control = _Payoffs(Model, np.random.default_rng(Seed), Count, Antithetic)
+    return np.array(
+        [
+            Count,
+            value.sum(),
+            control.sum(),
+            (value * value).sum(),
+            (control * control).sum(),
+            (value * control).sum(),
+        ]
+    )
+
+class MonteCarloWarrant:
+    """
+
+        Yola bağlı (Asya, bariyer, geriye bakan) varantları WarrantCalculate ile aynı girdilerle Monte Carlo
+        simülasyonuyla fiyatlar. Yollar ChunkSize büyüklüğünde parçalarla üretilir, her parça SeedSequence'tan
+        türetilen kendi üretecini kullanır; bu yüzden sonuç Workers sayısından bağımsız olarak Seed ile
+        tekrarlanabilir. Gözlem tarihleri Steps adet eşit aralıklı tarihtir (varsayılan: günlük).
+
+        Payoff="Asian": Averaging "Arithmetic" ya da "Geometric" ortalama fiyat opsiyonu.
+        Payoff="Barrier": Barrier seviyesi, BarrierType (UpAndOut, UpAndIn, DownAndOut, DownAndIn) ve vadede
+        ödenen Rebate.
+        Payoff="Lookback": Lookback "Floating" (kullanım fiyatı yolun en iyi değeri) ya da "Fixed".
+
+    """
+
+    def __init__(
+        self,
+        Type,
+        UnderlyingPrice,
+        StrikePrice,
+        DaysToMaturity,
+        DomesticRate,
+        ImpliedVolatility,
+        Dividend,
+        ConversionRate=1,
+        Payoff="Asian",
+        Steps=None,
+        Averaging="Arithmetic",
+        Barrier=None,
+        BarrierType="UpAndOut",
+        Rebate=0,
+        Lookback="Floating",
+        Seed=None,
+    ):
+        self.__Type = Type.name if isinstance(Type, AssetType) else str(Type)
+        if self.__Type not in _TYPE_SIGNS:
+            raise ValueError("C or P can be entered as option type.")
+        if Payoff not in PAYOFFS:
+            raise ValueError(f"Payoff must be one of {PAYOFFS}.")
+        if Payoff == "Barrier" and (Barrier is None or BarrierType not in BARRIER_TYPES):
+            raise ValueError(f"Barrier payoffs need a Barrier level and a BarrierType in {BARRIER_TYPES}.")
+        if Averaging not in ("Arithmetic", "Geometric") or Lookback not in ("Floating", "Fixed"):
+            raise ValueError("Averaging must be Arithmetic or Geometric and Lookback Floating or Fixed.")
+        self._UnderlyingPrice = UnderlyingPrice
+        self._StrikePrice = StrikePrice
+        self._DaysToMaturity = DaysToMaturity
+        self._DomesticRate = DomesticRate
+        self._ImpliedVolatility = ImpliedVolatility
+        self._Dividend = Dividend
+        self._ConversionRate = ConversionRate
+        self._Payoff = Payoff
+        self._Steps = int(Steps) if Steps else max(int(round(DaysToMaturity)), 1)
+        self._Seed = Seed
+        self.__model = (
+            _TYPE_SIGNS[self.__Type],
+            float(UnderlyingPrice),
+            float(StrikePrice),
+            DaysToMaturity / 365,
+            DomesticRate / 100,
+            Dividend / 100,
+            ImpliedVolatility / 100,
+            self._Steps,
+            Payoff,
+            {
+                "Averaging": Averaging,
+                "Barrier": Barrier,
+                "BarrierType": BarrierType,
+                "Rebate": Rebate,
+                "Lookback": Lookback,
+            },
+        )
+
+    @property
+    def Type(self):
+        return self.__Type
+
+    @property
+    def ConversionRate(self):
+        return self._ConversionRate
+
+    def Price(self, Paths=1_000_000, ChunkSize=20_000, Antithetic=True, ControlVariate=True, Workers=1):
+        """
+
+            Fonksiyon, varantın Monte Carlo fiyatını standart hatası ve kullanılan yol sayısıyla döndürür.
+            ControlVariate açıksa aynı yollardaki Avrupa getirisi, beklenen değeri Black-Scholes fiyatı olan
+            kontrol değişkeni olarak kullanılır. Workers > 1 ise parçalar süreç havuzunda çalıştırılır.
+
+        """
+        samplesPerChunk = max(int(ChunkSize) // (2 if Antithetic else 1), 1)
+        samples = max(int(Paths) // (2 if Antithetic else 1), 2)
+        seeds = np.random.SeedSequence(self._Seed).spawn(math.ceil(samples / samplesPerChunk))
+        tasks = [
+            (self.__model, seed, min(samplesPerChunk, samples - index * samplesPerChunk), Antithetic)
+            for index, seed in enumerate(seeds)
+        ]
+        Workers = Workers or os.cpu_count() or 1
+        if Workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=Workers) as executor:
+                sums = sum(executor.map(_SimulateChunk, tasks))
+        else:
+            sums = sum(map(_SimulateChunk, tasks))
+
+        count, sumValue, sumControl, sumValueSquared, sumControlSquared, sumProduct = sums
+        meanValue = sumValue / count
+        varianceValue = (sumValueSquared - count * meanValue**2) / (count - 1)
+        estimate, variance = meanValue, varianceValue
+        if ControlVariate:
+            meanControl = sumControl / count
+            varianceControl = (sumControlSquared - count * meanControl**2) / (count - 1)
+            covariance = (sumProduct - count * meanValue * meanControl) / (count - 1)
+            if varianceControl > 0:
+                beta = covariance / varianceControl
+                time, rate = self.__model[3], self.__model[4]
+                expected = OptionCalculate(
+                    self.__Type,
+                    self._UnderlyingPrice,
+                    self._StrikePrice,
+                    self._DaysToMaturity,
+                    self._DomesticRate,
+                    self._ImpliedVolatility,
+                    self._Dividend,
+                ).Price() * math.exp(rate * time)
+                estimate = meanValue - beta * (meanControl - expected)
+                variance = varianceValue - covariance**2 / varianceControl
+        discount = math.exp(-self.__model[4] * self.__model[3]) * self._ConversionRate
+        return MonteCarloResult(
+            Price=float(discount * estimate),
+            StandardError=discount * math.sqrt(max(variance, 0.0) / count),
+            Paths=int(count) * (2 if Antithetic else 1),
+        )
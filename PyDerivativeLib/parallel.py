@@ -0,0 +1,231 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .batch import _BlackScholes, _OptionSign, _SolveImpliedVolatilityArrays
+from .core import GreeksResult, ImpliedVolatilityResult
+
+_PRICE, _IMPLIED = "Price", "ImpliedVolatility"
+_INPUT_ROWS = 8
+_OUTPUT_ROWS = {_PRICE: len(GreeksResult._fields), _IMPLIED: len(ImpliedVolatilityResult._fields)}
+_CONVERSION_SCALED = ("Price", "Theta", "Vega", "Rho")
+
+def _EvaluateChunk(Kind, Inputs, Outputs, Tolerance, MaxIterations):
+    sign, spot, strike, days, rate, volatilityOrPrice, dividend, conversion = Inputs
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if Kind == _PRICE:
+            greeks = _BlackScholes(
+                sign, spot, strike, days / 365, rate / 100, volatilityOrPrice / 100, dividend / 100
+            )
+            for row, (field, values) in enumerate(zip(GreeksResult._fields, greeks)):
+                Outputs[row] = values * conversion if field in _CONVERSION_SCALED else values
+        else:
+            result = _SolveImpliedVolatilityArrays(
+                sign,
+                spot,
+                strike,
+                days / 365,
+                rate / 100,
+                dividend / 100,
+                volatilityOrPrice / conversion,
+                None,
+                Tolerance,
+                MaxIterations,
+            )
+            for row, values in enumerate(result):
+                Outputs[row] = values
+
+def _RunChunk(Task):
+    Kind, InputName, OutputName, Count, Start, Stop, Tolerance, MaxIterations = Task
+    inputMemory = shared_memory.SharedMemory(name=InputName)
+    outputMemory = shared_memory.SharedMemory(name=OutputName)
+    try:
+        inputs = np.ndarray((_INPUT_ROWS, Count), dtype=float, buffer=inputMemory.buf)
+        outputs = np.ndarray((_OUTPUT_ROWS[Kind], Count), dtype=float, buffer=outputMemory.buf)
+        _EvaluateChunk(
+            Kind, inputs[:, Start:Stop], outputs[:, Start:Stop], Tolerance, MaxIterations
+        )
+        del inputs, outputs
+    finally:
+        inputMemory.close()
+        outputMemory.close()
+    return Stop - Start
+
+class ParallelPricer:
+    """
+
+        Büyük sözleşme kümelerini süreç havuzunda parçalara bölerek fiyatlar. Girdiler ve çıktılar
+        paylaşılan bellekteki NumPy tamponlarından geçer, sonuçlar OptionBatch gibi girdilerin yayın
+        (broadcast) boyutunda döner.
+        Havuz, nesne kapatılana kadar (Close ya da with bloğu) çağrılar arasında yeniden kullanılır.
+
+    """
+
+    def __init__(self, Workers=None, ChunkSize=250_000):
+        self._Workers = Workers or os.cpu_count() or 1
+        self._ChunkSize = int(ChunkSize)
+        self.__executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.Close()
+
+    def Close(self):
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+
+    def __Run(self, Kind, Columns, Tolerance=1e-6, MaxIterations=100):
+        count = Columns[0].size
+        outputRows = _OUTPUT_ROWS[Kind]
+        if self._Workers == 1 or count <= self._ChunkSize:
+            outputs = np.empty((outputRows, count))
+            _EvaluateChunk(Kind, np.stack(Columns), outputs, Tolerance, MaxIterations)
+            return outputs
+
+        inputMemory = shared_memory.SharedMemory(create=True, size=_INPUT_ROWS * count * 8)
+        outputMemory = shared_memory.SharedMemory(create=True, size=outputRows * count * 8)
+        try:
+            inputs = np.ndarray((_INPUT_ROWS, count), dtype=float, buffer=inputMemory.buf)
+            for row, values in enumerate(Columns):
+                inputs[row] = values
+            if self.__executor is None:
+                self.__executor = ProcessPoolExecutor(max_workers=self._Workers)
+            tasks = [
+                (
+                    Kind,
+                    inputMemory.name,
+                    outputMemory.name,
+                    count,
+                    start,
+                    min(start + self._ChunkSize, count),
+                    Tolerance,
+                    MaxIterations,
+                )
+                for start in range(0, count, self._ChunkSize)
+            ]
+            for _ in self.__executor.map(_RunChunk, tasks):
+                pass
+            outputs = np.ndarray((outputRows, count), dtype=float, buffer=outputMemory.buf).copy()
+            del inputs
+        finally:
+            inputMemory.close()
+            inputMemory.unlink()
+            outputMemory.close()
+            outputMemory.unlink()
+        return outputs
+
+    @staticmethod
+    def __Columns(Type, *Values):
+        # Girdiler düzleştirilerek paylaşılır; yayın (broadcast) boyutu sonuçları geri şekillendirmek için döner
+        arrays = np.broadcast_arrays(_OptionSign(Type), *(np.asarray(value, dtype=float) for value in Values))
+        return arrays[0].shape, [np.ascontiguousarray(values, dtype=float).ravel() for values in arrays]
+
+    def Price(
+        self,
+        Type,
+        UnderlyingPrice,
+        StrikePrice,
+        DaysToMaturity,
+        DomesticRate,
+        ImpliedVolatility,
+        Dividend,
+        ConversionRate=1,
+    ):
+        """
+
+            Fonksiyon, opsiyon (ConversionRate verilirse varant) fiyat ve greekslerini paralel hesaplar
+
+        """
+        shape, columns = self.__Columns(
+            Type,
+            UnderlyingPrice,
+            StrikePrice,
+            DaysToMaturity,
+            DomesticRate,
+            ImpliedVolatility,
+            Dividend,
+            ConversionRate,
+        )
+        return GreeksResult(*(values.reshape(shape) for values in self.__Run(_PRICE, columns)))
+
+    def SolveImpliedVolatility(
+        self,
+        Type,
+        UnderlyingPrice,
+        StrikePrice,
+        DaysToMaturity,
+        DomesticRate,
+        Dividend,
+        MarketPrice,
+        ConversionRate=1,
+        Tolerance=1e-6,
+        MaxIterations=100,
+    ):
+        """
+
+            Fonksiyon, piyasa fiyatlarından zımni volatiliteleri paralel olarak hesaplar
+
+        """
+        shape, columns = self.__Columns(
+            Type,
+            UnderlyingPrice,
+            StrikePrice,
+            DaysToMaturity,
+            DomesticRate,
+            MarketPrice,
+            Dividend,
+            ConversionRate,
+        )
+        volatility, converged, iterations = (
+            values.reshape(shape) for values in self.__Run(_IMPLIED, columns, Tolerance, MaxIterations)
+        )
+        return ImpliedVolatilityResult(volatility, converged.astype(bool), iterations.astype(int))
+
+def price_parallel(
+    types,
+    spots,
+    strikes,
+    days,
+    rates,
+    vols,
+    divs,
+    conversion_rates=1,
+    Workers=None,
+    ChunkSize=250_000,
+):
+    """
+
+        Fonksiyon, price_batch ile aynı sonucu süreç havuzunda parçalara bölerek hesaplar
+
+    """
+    with ParallelPricer(Workers, ChunkSize) as pricer:
+        return pricer.Price(types, spots, strikes, days, rates, vols, divs, conversion_rates)
+
+def implied_volatility_parallel(
+    types,
+    spots,
+    strikes,
+    days,
+    rates,
+    divs,
+    prices,
+    conversion_rates=1,
+    Workers=None,
+    ChunkSize=250_000,
+    Tolerance=1e-6,
+    MaxIterations=100,
+):
+    """
+
+        Fonksiyon, implied_volatility_batch ile aynı sonucu süreç havuzunda parçalara bölerek hesaplar
+
+    """
+    with ParallelPricer(Workers, ChunkSize) as pricer:
+        return pricer.SolveImpliedVolatility(
+            types, spots, strikes, days, rates, divs, prices, conversion_rates, Tolerance, MaxIterations
+        )
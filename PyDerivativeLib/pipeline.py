@@ -0,0 +1,185 @@
+"""
+
+    Opsiyon, varant ve vadeli işlem zincirlerini CSV/Parquet dosyalarından sınırlı bellekle, parça parça
+    okuyup fiyatlayan ve sonuçları yine parça parça CSV/Parquet olarak yazan toplu işlem hattı.
+
+    Kullanım: python -m PyDerivativeLib girdi.csv cikti.parquet --kind warrant --chunk-size 200000
+
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+
+from .batch import OptionBatch, WarrantBatch, _FutureRisk, implied_volatility_batch
+from .enums import Future_Type
+
+KINDS = ("option", "warrant", "analytics", "future", "implied")
+_FUTURE_DEFAULTS = {"ForeignRate": 0, "AnnualStorageCostRate": 0, "GoldLeaseRate": 0, "PresentValue": 1}
+
+def _Format(Path):
+    name = Path.lower()
+    if name.endswith((".parquet", ".pq")):
+        return "parquet"
+    if name.endswith((".csv", ".csv.gz", ".csv.bz2", ".csv.zip", ".txt")):
+        return "csv"
+    raise ValueError(f"Unsupported file type: {Path}. Use .csv or .parquet.")
+
+def ReadChunks(Path, ChunkSize=100_000):
+    """
+
+        Fonksiyon, CSV ya da Parquet dosyasını en fazla ChunkSize satırlık DataFrame parçaları olarak okur
+
+    """
+    if _Format(Path) == "parquet":
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(Path).iter_batches(batch_size=ChunkSize):
+            yield batch.to_pandas()
+    else:
+        import pandas as pd
+
+        yield from pd.read_csv(Path, chunksize=ChunkSize)
+
+class ChunkWriter:
+    """
+
+        Parça parça gelen DataFrame'leri tek bir CSV ya da Parquet dosyasına akıtır
+
+    """
+
+    def __init__(self, Path):
+        self._Path = Path
+        self.__format = _Format(Path)
+        self.__writer = None
+        self.__started = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.Close()
+
+    def Write(self, Frame):
+        if self.__format == "parquet":
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            # CSV parçalarında tamsayı çıkarımı parçadan parçaya değişebilir; sayısal kolonlar float64 yazılır
+            # ve sonraki parçalar ilk parçanın şemasına dönüştürülür
+            integers = Frame.select_dtypes(include=["integer", "bool"]).columns
+            if len(integers):
+                Frame = Frame.astype({column: "float64" for column in integers})
+            table = pa.Table.from_pandas(Frame, preserve_index=False)
+            if self.__writer is None:
+                self.__writer = pq.ParquetWriter(self._Path, table.schema)
+            elif not table.schema.equals(self.__writer.schema):
+                table = table.select(self.__writer.schema.names).cast(self.__writer.schema)
+            self.__writer.write_table(table)
+        else:
+            Frame.to_csv(
+                self._Path,
+                mode="a" if self.__started else "w",
+                header=not self.__started,
+                index=False,
+            )
+        self.__started = True
+
+    def Close(self):
+        if self.__writer is not None:
+            self.__writer.close()
+            self.__writer = None
+
+def _FutureType(Values):
+    """
+
+        Fonksiyon, Future_Type adlarını ("Index"), değerlerini (3, "3") ya da üyelerini tek vektörel
+        eşlemeyle tamsayı koda dönüştürür
+
+    """
+    import pandas as pd
+
+    series = pd.Series(np.asarray(Values, dtype=object))
+    names = {member.name: member.value for member in Future_Type}
+    names.update({member: member.value for member in Future_Type})
+    codes = series.map(names).fillna(pd.to_numeric(series, errors="coerce"))
+    valid = codes.isin([member.value for member in Future_Type])
+    if not valid.all():
+        raise ValueError(f"Type must be a Future_Type name or value, got {series[~valid].iloc[0]!r}.")
+    return codes.to_numpy(dtype=np.int8)
+
+def PriceChunk(Frame, Kind="option"):
+    """
+
+        Fonksiyon, bir DataFrame parçasını seçilen modelle fiyatlar ve sonuç kolonlarını ekleyerek döndürür.
+        option/warrant/analytics: OptionBatch kolonları (+ ConversionRate), analytics varant ihraççı
+        göstergelerini de ekler, implied: MarketPrice kolonu,
+        future: Type (Future_Type adı ya da değeri), UnderlyingPrice, DaysToMaturity, DomesticRate, Dividend.
+
+    """
+    result = Frame.copy()
+    if Kind in ("option", "warrant", "analytics"):
+        if Kind == "option":
+            batch = OptionBatch.FromFrame(result)
+        else:
+            if "ConversionRate" not in result.columns:
+                result["ConversionRate"] = 1.0
+            batch = WarrantBatch.FromFrame(result)
+        values = (batch.Analytics() if Kind == "analytics" else batch.Greeks())._asdict()
+    elif Kind == "implied":
+        values = implied_volatility_batch(result)._asdict()
+    elif Kind == "future":
+        for column, default in _FUTURE_DEFAULTS.items():
+            if column not in result.columns:
+                result[column] = default
+        values = {
+            "TheoreticalPrice": _FutureRisk(
+                _FutureType(result["Type"]),
+                result["UnderlyingPrice"].to_numpy(dtype=float),
+                result["DaysToMaturity"].to_numpy(dtype=float) / 365,
+                result["DomesticRate"].to_numpy(dtype=float) / 100,
+                result["Dividend"].to_numpy(dtype=float) / 100,
+                result["ForeignRate"].to_numpy(dtype=float) / 100,
+                (result["AnnualStorageCostRate"] - result["GoldLeaseRate"]).to_numpy(dtype=float) / 100,
+                result["PresentValue"].to_numpy(dtype=float),
+            )[:, 0]
+        }
+    else:
+        raise ValueError(f"Kind must be one of {KINDS}.")
+    existing = [column for column in values if column in Frame.columns]
+    if existing:
+        raise ValueError(f"Input already has output column(s) {existing}; rename them before pricing.")
+    for column, value in values.items():
+        result[column] = value
+    return result
+
+def PriceFile(Input, Output, Kind="option", ChunkSize=100_000):
+    """
+
+        Fonksiyon, girdi dosyasını parça parça fiyatlayıp çıktı dosyasına yazar ve işlenen satır sayısını döndürür
+
+    """
+    rows = 0
+    with ChunkWriter(Output) as writer:
+        for frame in ReadChunks(Input, ChunkSize):
+            writer.Write(PriceChunk(frame, Kind))
+            rows += len(frame)
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m PyDerivativeLib",
+        description="Price option, warrant or futures chains from CSV/Parquet in bounded-memory chunks.",
+    )
+    parser.add_argument("input", help="input .csv or .parquet file")
+    parser.add_argument("output", help="output .csv or .parquet file")
+    parser.add_argument("--kind", choices=KINDS, default="option")
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    if os.path.abspath(args.input) == os.path.abspath(args.output):
+        parser.error("input and output must be different files")
+    rows = PriceFile(args.input, args.output, args.kind, args.chunk_size)
+    print(f"{rows} rows priced ({args.kind}) -> {args.output}", file=sys.stderr)
+    return 0
@@ -0,0 +1,282 @@
+import functools
+import importlib
+import json
+import logging
+import pkgutil
+import sys
+import threading
+import time
+
+_TARGETS = {
+    "core": (
+        "_NormCdf",
+        "_NormPdf",
+        "OptionCalculate.dOne",
+        "OptionCalculate.NdOne",
+        "OptionCalculate.dTwo",
+        "OptionCalculate.NdTwo",
+        "OptionCalculate.Greeks",
+        "OptionCalculate._Evaluate",
+        "OptionCalculate.HigherOrderGreeks",
+        "OptionCalculate.Price",
+        "OptionCalculate.SolveImpliedVolatility",
+        "WarrantCalculate.Greeks",
+        "WarrantCalculate.SolveImpliedVolatility",
+        "_SolveImpliedVolatility",
+        "implied_volatility",
+    ),
+    "futures": ("Future.TheoreticalPrice", "Future.HedgeRatio"),
+    "batch": (
+        "_BlackScholes",
+        "_EuropeanPrice",
+        "_FutureRisk",
+        "_SolveImpliedVolatilityArrays",
+        "OptionBatch.Greeks",
+        "OptionBatch.HigherOrderGreeks",
+        "OptionBatch.SolveImpliedVolatility",
+        "WarrantBatch.Greeks",
+        "WarrantBatch.Analytics",
+        "price_batch",
+        "implied_volatility_batch",
+    ),
+    "black76": ("_Black76", "FutureOptionBatch.Greeks", "FutureOptionBatch.SolveImpliedVolatility"),
+    "american": ("_BaroneAdesiWhaley", "_Binomial", "AmericanBatch.Greeks"),
+    "montecarlo": ("MonteCarloWarrant.Price",),
+    "graphics": ("Graphs.DerivativeToolSimulationGraph", "Graphs.ScenarioSurface"),
+    "hedging": ("hedge_ratio", "rolling_hedge_ratio", "ewma_hedge_ratio", "HedgeRatioTracker.Update"),
+    "streaming": ("StreamingPricer.Update",),
+    "book": ("Book.SetSpot", "Book.Recalculate"),
+    "curve": ("FutureCurve.TheoreticalPrices",),
+    "store": ("ContractStore.Greeks", "ContractStore.SolveImpliedVolatility"),
+    "service": ("PricingService._Evaluate",),
+    "surface": ("_FitSvi", "VolatilitySurface.ImpliedVolatility"),
+    "stress": ("stress_test",),
+    "parallel": ("ParallelPricer.Price", "ParallelPricer.SolveImpliedVolatility"),
+}
+# Çağrıdan önce bu alan doluysa nesne içi önbellek isabet etmiş sayılır
+_CACHE_ATTRIBUTES = {
+    "OptionCalculate.dOne": "_OptionCalculate__d_one",
+    "OptionCalculate.NdOne": "_OptionCalculate__NdOne",
+    "OptionCalculate.dTwo": "_OptionCalculate__d_two",
+    "OptionCalculate.NdTwo": "_OptionCalculate__NdTwo",
+    "OptionCalculate.Greeks": "_OptionCalculate__greeks",
+    "OptionCalculate.HigherOrderGreeks": "_OptionCalculate__higher",
+    "OptionBatch.HigherOrderGreeks": "_OptionBatch__higher",
+    "WarrantCalculate.Greeks": "_WarrantCalculate__greeks",
+    "OptionBatch.Greeks": "_OptionBatch__greeks",
+    "WarrantBatch.Greeks": "_WarrantBatch__greeks",
+    "WarrantBatch.Analytics": "_WarrantBatch__analytics",
+    "AmericanBatch.Greeks": "_AmericanBatch__greeks",
+    "FutureOptionBatch.Greeks": "_FutureOptionBatch__greeks",
+}
+
+_LOCK = threading.Lock()
+_STATS = {}
+_PATCHES = []
+# Sarmalayıcı -> orijinal; kapatırken paket içinde kalmış sarmalayıcı referanslarını bulmak için
+_ORIGINALS = {}
+_REPORTER = None
+
+def _Size(Arguments):
+    for argument in Arguments:
+        if isinstance(argument, (str, bytes)):
+            continue
+        size = getattr(argument, "size", None)
+        if isinstance(size, int):
+            return size
+        if hasattr(argument, "__len__"):
+            return len(argument)
+    return 1
+
+def _Wrap(Name, Function):
+    # [çağrı, toplam süre, en uzun süre, toplam eleman, önbellek isabeti]
+    stats = _STATS.setdefault(Name, [0, 0.0, 0.0, 0, 0])
+    attribute = _CACHE_ATTRIBUTES.get(Name)
+
+    @functools.wraps(Function)
+    def wrapper(*args, **kwargs):
+        hit = attribute is not None and getattr(args[0], attribute, None) is not None
+        start = time.perf_counter()
+        try:
+            return Function(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            with _LOCK:
+                stats[0] += 1
+                stats[1] += elapsed
+                stats[2] = max(stats[2], elapsed)
+                stats[3] += _Size(args)
+                stats[4] += hit
+
+    return wrapper
+
+def _Patch(Owner, Attribute, Name):
+    original = Owner.__dict__[Attribute] if isinstance(Owner, type) else getattr(Owner, Attribute)
+    if isinstance(original, property):
+        replacement = property(_Wrap(Name, original.fget), original.fset, original.fdel, original.__doc__)
+    elif isinstance(original, (classmethod, staticmethod)):
+        replacement = type(original)(_Wrap(Name, original.__func__))
+    else:
+        replacement = _Wrap(Name, original)
+    setattr(Owner, Attribute, replacement)
+    _PATCHES.append((Owner, Attribute, original))
+    _ORIGINALS[replacement] = original
+    return original, replacement
+
+def _PackageModules(Package):
+    """
+
+        Fonksiyon, paketi ve yüklenebilen tüm alt modüllerini içe aktarıp döndürür. Hedef fonksiyonları
+        adıyla içe aktaran modüller yama öncesinde yüklenir ki referansları da değiştirilebilsin;
+        isteğe bağlı bağımlılığı eksik olan modüller atlanır.
+
+    """
+    package = sys.modules[Package]
+    for info in pkgutil.iter_modules(package.__path__):
+        if info.name != "__main__":
+            try:
+                importlib.import_module(f".{info.name}", Package)
+            except ImportError:
+                pass
+    return [
+        module
+        for name, module in list(sys.modules.items())
+        if module is not None and (name == Package or name.startswith(f"{Package}."))
+    ]
+
+def is_profiling_enabled():
+    return bool(_PATCHES)
+
+def enable_profiling(Modules=None):
+    """
+
+        Fonksiyon, fiyatlama metotlarını ve çekirdek fonksiyonları sayaç ve süre ölçen sarmalayıcılarla
+        değiştirir. Modules verilmezse tüm hedef modüller yamalanır; adıyla içe aktarılan referansların da
+        değişmesi için paketin tüm alt modülleri önceden yüklenir. Kapalıyken orijinal fonksiyonlar
+        yerinde durduğu için ek maliyet yoktur. Süreler kapsayıcıdır (Greeks süresi _NormCdf'i de içerir).
+
+    """
+    if _PATCHES:
+        return
+    package = __name__.rpartition(".")[0]
+    modules = {}
+    for moduleName in _TARGETS if Modules is None else Modules:
+        if moduleName not in _TARGETS:
+            raise ValueError(f"Module must be one of {tuple(_TARGETS)}.")
+        modules[moduleName] = importlib.import_module(f".{moduleName}", package)
+    loaded = _PackageModules(package)
+    for moduleName, module in modules.items():
+        for target in _TARGETS[moduleName]:
+            owner, _, attribute = target.rpartition(".")
+            if owner:
+                _Patch(getattr(module, owner), attribute, target)
+                continue
+            original, replacement = _Patch(module, attribute, target)
+            # Fonksiyonu adıyla içe aktaran diğer modüllerdeki (paketin kendisi dahil) referanslar da değiştirilir
+            for other in loaded:
+                for key, value in list(vars(other).items()):
+                    if value is original and other is not module:
+                        setattr(other, key, replacement)
+                        _PATCHES.append((other, key, original))
+
+def disable_profiling():
+    """
+
+        Fonksiyon, tüm sarmalayıcıları kaldırıp orijinal fonksiyonları geri yükler; toplanan veriler korunur.
+        Profil açıkken yüklenen modüllerde ya da paketin tembel içe aktarmalarında kalan sarmalayıcılar da
+        orijinalleriyle değiştirilir.
+
+    """
+    stop_profiling_report()
+    while _PATCHES:
+        owner, attribute, original = _PATCHES.pop()
+        setattr(owner, attribute, original)
+    if not _ORIGINALS:
+        return
+    package = __name__.rpartition(".")[0]
+    for name, module in list(sys.modules.items()):
+        if module is None or not (name == package or name.startswith(f"{package}.")):
+            continue
+        for key, value in list(vars(module).items()):
+            try:
+                original = _ORIGINALS.get(value)
+            except TypeError:
+                continue
+            if original is not None:
+                setattr(module, key, original)
+    _ORIGINALS.clear()
+
+def reset_profiling():
+    with _LOCK:
+        for stats in _STATS.values():
+            stats[:] = [0, 0.0, 0.0, 0, 0]
+
+def profiling_snapshot(Reset=False):
+    """
+
+        Fonksiyon, her ölçülen fonksiyon için çağrı sayısı, toplam / ortalama / en uzun süre (saniye),
+        ortalama toplu işlem büyüklüğü ve varsa nesne içi önbellek isabet oranını; GreeksCache açıksa
+        onun istatistiklerini sözlük olarak döndürür.
+
+    """
+    with _LOCK:
+        rows = {name: list(stats) for name, stats in _STATS.items() if stats[0]}
+        if Reset:
+            for stats in _STATS.values():
+                stats[:] = [0, 0.0, 0.0, 0, 0]
+    calls = {}
+    for name, (count, total, longest, items, hits) in sorted(rows.items()):
+        calls[name] = {
+            "Calls": count,
+            "TotalSeconds": total,
+            "MeanSeconds": total / count,
+            "MaxSeconds": longest,
+            "Items": items,
+            "MeanBatchSize": items / count,
+        }
+        if name in _CACHE_ATTRIBUTES:
+            calls[name]["CacheHits"] = hits
+            calls[name]["CacheHitRate"] = hits / count
+    from .core import _GREEKS_CACHE
+
+    cache = None
+    if _GREEKS_CACHE is not None:
+        stats = _GREEKS_CACHE.Stats()
+        cache = dict(stats._asdict(), HitRate=stats.HitRate)
+    return {"Enabled": is_profiling_enabled(), "Time": time.time(), "Calls": calls, "GreeksCache": cache}
+
+def start_profiling_report(Interval=60, Callback=None, Logger=None, Reset=False):
+    """
+
+        Fonksiyon, arka planda her Interval saniyede bir anlık görüntü alır; Callback verilirse ona
+        (örneğin bir metrik sistemine aktarmak için) iletir, yoksa JSON olarak Logger'a INFO seviyesinde yazar.
+        Reset açıksa her raporda sayaçlar sıfırlanır ve rapor yalnızca son aralığı kapsar.
+
+    """
+    global _REPORTER
+    if Interval <= 0:
+        raise ValueError("Interval must be positive.")
+    stop_profiling_report()
+    logger = Logger or logging.getLogger(__name__)
+    stop = threading.Event()
+
+    def report():
+        while not stop.wait(Interval):
+            snapshot = profiling_snapshot(Reset)
+            if Callback is not None:
+                Callback(snapshot)
+            else:
+                logger.info("%s", json.dumps(snapshot))
+
+    thread = threading.Thread(target=report, name="PyDerivativeLibProfiling", daemon=True)
+    thread.start()
+    _REPORTER = (thread, stop)
+
+def stop_profiling_report():
+    global _REPORTER
+    if _REPORTER is not None:
+        thread, stop = _REPORTER
+        stop.set()
+        if thread is not threading.current_thread():
+            thread.join()
+        _REPORTER = None
@@ -0,0 +1,303 @@
+"""
+
+    Eşzamanlı fiyat, greeks ve zımni volatilite isteklerini kısa bir zaman penceresinde toplayıp tek bir
+    vektörel hesaplamayla yanıtlayan asyncio fiyatlama servisi. Aynı süreçte doğrudan ya da satır başına bir
+    JSON mesajı kullanan yerel bir soket (Serve) üzerinden kullanılabilir.
+
+"""
+import asyncio
+import json
+import threading
+import time
+
+import numpy as np
+
+from .batch import WarrantBatch, implied_volatility_batch
+from .core import _TYPE_SIGNS, GreeksResult, ImpliedVolatilityResult
+from .enums import AssetType
+
+_GREEKS, _IMPLIED = 0, 1
+
+def _TypeName(Type):
+    name = Type.name if isinstance(Type, AssetType) else str(Type)
+    if name not in _TYPE_SIGNS:
+        raise ValueError("C or P can be entered as option type.")
+    return name
+
+def _Request(Type, *Values):
+    # Girdiler kuyruğa girmeden doğrulanır; hatalı bir istek yalnızca kendi çağıranına hata verir
+    name = _TypeName(Type)
+    try:
+        return (name, *(float(value) for value in Values))
+    except (TypeError, ValueError) as error:
+        raise ValueError("Contract inputs must be numbers.") from error
+
+def _Abandon(Future):
+    if not Future.done():
+        Future.set_exception(RuntimeError("PricingService stopped before the request was processed."))
+
+class PricingService:
+    """
+
+        İstekler en fazla Window saniye (varsayılan 300 mikrosaniye) ya da MaxBatchSize isteğe ulaşılana kadar
+        biriktirilir ve WarrantBatch / implied_volatility_batch ile tek seferde hesaplanır; her çağıranın
+        sonucu kendi future'ına yazılır. Kuyrukta MaxPending istek varken yeni istekler yer açılana kadar
+        bekler (RejectWhenFull=True ise asyncio.QueueFull hatası verir). Executor verilirse toplu hesap
+        olay döngüsünü bloklamadan o havuzda yapılır ve bu sırada yeni istekler birikmeye devam eder.
+
+    """
+
+    def __init__(self, MaxBatchSize=4096, Window=0.0003, MaxPending=100_000, RejectWhenFull=False, Executor=None):
+        if MaxBatchSize < 1 or MaxPending < 1 or Window < 0:
+            raise ValueError("MaxBatchSize and MaxPending must be positive and Window non-negative.")
+        self._MaxBatchSize = int(MaxBatchSize)
+        self._Window = Window
+        self._MaxPending = int(MaxPending)
+        self._RejectWhenFull = RejectWhenFull
+        self._Executor = Executor
+        self.__queue = None
+        self.__task = None
+        self.__stopping = False
+        self.__waiting = 0
+        self.__lock = threading.Lock()
+        self.__requests = 0
+        self.__batches = 0
+        self.__largest = 0
+        self.__busy = 0.0
+
+    async def __aenter__(self):
+        await self.Start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.Stop()
+
+    async def Start(self):
+        if self.__task is None:
+            self.__queue = asyncio.Queue(self._MaxPending)
+            self.__task = asyncio.get_running_loop().create_task(self.__Run())
+
+    async def Stop(self):
+        """
+
+            Fonksiyon, yeni istekleri reddederek kuyruktaki istekleri yanıtladıktan sonra servisi durdurur.
+            Durdurma sırasında kuyruğa girmeyi bekleyen ve artık işlenmeyecek isteklerin future'ları
+            RuntimeError ile sonlandırılır.
+
+        """
+        if self.__task is None or self.__stopping:
+            return
+        self.__stopping = True
+        try:
+            await self.__queue.put(None)
+            await self.__task
+        finally:
+            # Boşaltılan her yer kuyruğa girmeyi bekleyen bir isteği uyandırır; bekleyen kalmayana kadar sürer
+            while True:
+                while not self.__queue.empty():
+                    request = self.__queue.get_nowait()
+                    if request is not None:
+                        _Abandon(request[2])
+                if not self.__waiting:
+                    break
+                await asyncio.sleep(0)
+            self.__queue, self.__task = None, None
+            self.__stopping = False
+
+    async def __Submit(self, Kind, Values):
+        if self.__task is None:
+            raise RuntimeError("PricingService is not running; use 'async with PricingService()' or Start().")
+        if self.__stopping:
+            raise RuntimeError("PricingService is stopping; no new requests are accepted.")
+        future = asyncio.get_running_loop().create_future()
+        if self._RejectWhenFull:
+            self.__queue.put_nowait((Kind, Values, future))
+        else:
+            self.__waiting += 1
+            try:
+                await self.__queue.put((Kind, Values, future))
+            finally:
+                self.__waiting -= 1
+        return await future
+
+    async def Greeks(
+        self,
+        Type,
+        UnderlyingPrice,
+        StrikePrice,
+        DaysToMaturity,
+        DomesticRate,
+        ImpliedVolatility,
+        Dividend,
+        ConversionRate=1,
+    ):
+        return await self.__Submit(
+            _GREEKS,
+            _Request(
+                Type,
+                UnderlyingPrice,
+                StrikePrice,
+                DaysToMaturity,
+                DomesticRate,
+                ImpliedVolatility,
+                Dividend,
+                ConversionRate,
+            ),
+        )
+
+    async def Price(self, *Contract, **Arguments):
+        return (await self.Greeks(*Contract, **Arguments)).Price
+
+    async def ImpliedVolatility(
+        self,
+        Type,
+        UnderlyingPrice,
+        StrikePrice,
+        DaysToMaturity,
+        DomesticRate,
+        Dividend,
+        MarketPrice,
+        ConversionRate=1,
+    ):
+        return await self.__Submit(
+            _IMPLIED,
+            _Request(
+                Type,
+                UnderlyingPrice,
+                StrikePrice,
+                DaysToMaturity,
+                DomesticRate,
+                Dividend,
+                MarketPrice,
+                ConversionRate,
+            ),
+        )
+
+    async def __Run(self):
+        queue = self.__queue
+        loop = asyncio.get_running_loop()
+        running = True
+        while running:
+            requests = [await queue.get()]
+            if queue.qsize() < self._MaxBatchSize and self._Window > 0:
+                await asyncio.sleep(self._Window)
+            while len(requests) < self._MaxBatchSize and not queue.empty():
+                requests.append(queue.get_nowait())
+            if None in requests:
+                running = False
+                while not queue.empty():
+                    requests.append(queue.get_nowait())
+                requests = [request for request in requests if request is not None]
+            if not requests:
+                continue
+            if self._Executor is None:
+                results = self._Evaluate(requests)
+            else:
+                results = await loop.run_in_executor(self._Executor, self._Evaluate, requests)
+            for (_, _, future), result in zip(requests, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    def _Evaluate(self, Requests):
+        """
+
+            Fonksiyon, bir istek grubunu türüne göre ayırıp her türü tek vektörel çağrıyla hesaplar.
+            Girdiler kuyruğa alınırken doğrulandığından toplu hesap yalnızca beklenmedik bir hatada
+            başarısız olur; bu durumda o türdeki tüm isteklere hata döndürülür.
+
+        """
+        start = time.perf_counter()
+        results = [None] * len(Requests)
+        for kind in (_GREEKS, _IMPLIED):
+            indices = [index for index, request in enumerate(Requests) if request[0] == kind]
+            if not indices:
+                continue
+            columns = [np.array(column) for column in zip(*(Requests[index][1] for index in indices))]
+            try:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    if kind == _GREEKS:
+                        values = WarrantBatch(*columns).Greeks()
+                        rows = [GreeksResult(*row) for row in np.column_stack(values).tolist()]
+                    else:
+                        values = implied_volatility_batch(*columns)
+                        rows = [
+                            ImpliedVolatilityResult(*row)
+                            for row in zip(*(column.tolist() for column in values))
+                        ]
+            except Exception as error:
+                rows = [error] * len(indices)
+            for index, row in zip(indices, rows):
+                results[index] = row
+        # Executor verildiğinde bu fonksiyon havuz iş parçacığında çalışır; sayaçlar kilitle güncellenir
+        with self.__lock:
+            self.__requests += len(Requests)
+            self.__batches += 1
+            self.__largest = max(self.__largest, len(Requests))
+            self.__busy += time.perf_counter() - start
+        return results
+
+    def Stats(self):
+        """
+
+            Fonksiyon, yanıtlanan istek ve grup sayılarını, ortalama / en büyük grup boyutunu,
+            toplu hesapta geçen süreyi ve kuyrukta bekleyen istek sayısını döndürür
+
+        """
+        with self.__lock:
+            requests, batches, largest, busy = self.__requests, self.__batches, self.__largest, self.__busy
+        queue = self.__queue
+        return {
+            "Requests": requests,
+            "Batches": batches,
+            "MeanBatchSize": requests / batches if batches else 0.0,
+            "MaxBatchSize": largest,
+            "BusySeconds": busy,
+            "Pending": queue.qsize() if queue is not None else 0,
+        }
+
+    async def __Respond(self, Line, Writer):
+        message = None
+        try:
+            message = json.loads(Line)
+            method = message.get("method")
+            if method not in ("Greeks", "Price", "ImpliedVolatility"):
+                raise ValueError("method must be Greeks, Price or ImpliedVolatility.")
+            result = await getattr(self, method)(*message.get("args", ()), **message.get("kwargs", {}))
+            response = {"id": message.get("id"), "result": getattr(result, "_asdict", lambda: result)()}
+        except Exception as error:
+            identifier = message.get("id") if isinstance(message, dict) else None
+            response = {"id": identifier, "error": str(error)}
+        Writer.write(json.dumps(response).encode() + b"\n")
+
+    async def __Connection(self, Reader, Writer):
+        tasks = set()
+        try:
+            while line := await Reader.readline():
+                task = asyncio.ensure_future(self.__Respond(line, Writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                if Writer.transport.get_write_buffer_size() > 1 << 20:
+                    await Writer.drain()
+            if tasks:
+                await asyncio.gather(*tasks)
+            await Writer.drain()
+        finally:
+            Writer.close()
+
+    async def Serve(self, Host="127.0.0.1", Port=8765, Path=None):
+        """
+
+            Fonksiyon, servisi satır başına bir JSON mesajı kullanan bir TCP (Path verilirse Unix) soketinde
+            açar ve asyncio sunucusunu döndürür. İstek: {"id": 1, "method": "Greeks", "args": [...]};
+            yanıt: {"id": 1, "result": {...}} ya da {"id": 1, "error": "..."}. Bir bağlantıdaki istekler
+            yanıt beklemeden art arda gönderilebilir; yanıtlar tamamlanma sırasıyla döner.
+
+        """
+        await self.Start()
+        if Path is not None:
+            return await asyncio.start_unix_server(self.__Connection, Path)
+        return await asyncio.start_server(self.__Connection, Host, Port)
@@ -0,0 +1,237 @@
+import numpy as np
+
+from .batch import WarrantBatch, _OptionSign
+from .core import GreeksResult, ImpliedVolatilityResult, WarrantCalculate
+from .enums import AssetType
+
+CONTRACT_DTYPE = np.dtype(
+    [
+        ("Type", "S1"),
+        ("UnderlyingPrice", "f8"),
+        ("StrikePrice", "f8"),
+        ("DaysToMaturity", "f8"),
+        ("DomesticRate", "f8"),
+        ("ImpliedVolatility", "f8"),
+        ("Dividend", "f8"),
+        ("ConversionRate", "f8"),
+    ]
+)
+
+def _Field(Name):
+    return property(lambda self: float(self._Data[Name][self._Row]))
+
+class ContractView:
+    """
+
+        ContractStore içindeki tek bir sözleşmeye hafif (yalnızca dizi ve satır numarası tutan) erişim.
+        Değerler her okumada depodan alınır; Calculate() skaler hesaplar için WarrantCalculate üretir.
+
+    """
+
+    __slots__ = ("_Data", "_Row")
+
+    def __init__(self, Data, Row):
+        self._Data = Data
+        self._Row = Row
+
+    @property
+    def Type(self):
+        return self._Data["Type"][self._Row].decode()
+
+    UnderlyingPrice = _Field("UnderlyingPrice")
+    StrikePrice = _Field("StrikePrice")
+    DaysToMaturity = _Field("DaysToMaturity")
+    DomesticRate = _Field("DomesticRate")
+    ImpliedVolatility = _Field("ImpliedVolatility")
+    Dividend = _Field("Dividend")
+    ConversionRate = _Field("ConversionRate")
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in CONTRACT_DTYPE.names)
+        return f"ContractView({fields})"
+
+    def Calculate(self):
+        return WarrantCalculate(*(getattr(self, name) for name in CONTRACT_DTYPE.names))
+
+    def Greeks(self):
+        return self.Calculate().Greeks()
+
+class ContractStore:
+    """
+
+        Opsiyon ve varant sözleşmelerini tek bir yapılandırılmış NumPy dizisinde (sözleşme başına 57 bayt)
+        tutar. Opsiyonlar ConversionRate=1 olan varantlardır. Open() ile diske kaydedilmiş bir depo
+        bellek eşlemli (memmap) açılır; fiyatlama ChunkSize sözleşmelik parçalarla yapıldığından bellekte
+        aynı anda yalnızca bir parçanın ara dizileri bulunur.
+
+    """
+
+    def __init__(self, Capacity=0):
+        self.__data = np.zeros(Capacity, dtype=CONTRACT_DTYPE)
+        self.__size = 0
+        self.__growable = True
+
+    @classmethod
+    def FromArray(cls, Array):
+        """
+
+            Fonksiyon, CONTRACT_DTYPE tipindeki mevcut bir diziyi (ör. memmap) kopyalamadan depo olarak sarar
+
+        """
+        if Array.dtype != CONTRACT_DTYPE:
+            raise ValueError("Array must have the CONTRACT_DTYPE structured dtype.")
+        store = cls()
+        store.__data = Array
+        store.__size = Array.shape[0]
+        store.__growable = False
+        return store
+
+    @classmethod
+    def FromFrame(cls, frame):
+        """
+
+            Type, UnderlyingPrice, StrikePrice, DaysToMaturity, DomesticRate, ImpliedVolatility, Dividend
+            ve isteğe bağlı ConversionRate kolonlarını içeren bir DataFrame'den depo oluşturur.
+
+        """
+        store = cls(len(frame))
+        store.Add(
+            *(frame[column].to_numpy() for column in CONTRACT_DTYPE.names[:-1]),
+            frame["ConversionRate"].to_numpy() if "ConversionRate" in frame.columns else 1,
+        )
+        return store
+
+    @classmethod
+    def Open(cls, Path, Mode="r"):
+        """
+
+            Fonksiyon, Save() ile yazılmış .npy dosyasını bellek eşlemli açar.
+            Mode="r+" değişikliklerin (Set) dosyaya yazılmasına izin verir.
+
+        """
+        return cls.FromArray(np.load(Path, mmap_mode=Mode))
+
+    def Save(self, Path):
+        np.save(Path, self.Data)
+
+    @property
+    def Data(self):
+        return self.__data[: self.__size]
+
+    def __len__(self):
+        return self.__size
+
+    def __getitem__(self, Index):
+        if isinstance(Index, (int, np.integer)):
+            if not -self.__size <= Index < self.__size:
+                raise IndexError("Contract index out of range.")
+            return ContractView(self.Data, int(Index) % self.__size)
+        return ContractStore.FromArray(self.Data[Index])
+
+    def __iter__(self):
+        data = self.Data
+        return (ContractView(data, row) for row in range(self.__size))
+
+    def Add(
+        self,
+        Type,
+        UnderlyingPrice,
+        StrikePrice,
+        DaysToMaturity,
+        DomesticRate,
+        ImpliedVolatility,
+        Dividend,
+        ConversionRate=1,
+    ):
+        """
+
+            Fonksiyon, bir ya da (dizi girdilerle) çok sayıda sözleşme ekler ve satır numaralarını döndürür
+
+        """
+        if not self.__growable:
+            raise ValueError("Contracts cannot be added to a store that wraps an existing array.")
+        sign = _OptionSign(Type.name if isinstance(Type, AssetType) else Type)
+        values = np.broadcast_arrays(
+            np.where(sign > 0, b"C", b"P"),
+            *(
+                np.asarray(value, dtype=float)
+                for value in (
+                    UnderlyingPrice,
+                    StrikePrice,
+                    DaysToMaturity,
+                    DomesticRate,
+                    ImpliedVolatility,
+                    Dividend,
+                    ConversionRate,
+                )
+            ),
+        )
+        count = values[0].size
+        if self.__size + count > self.__data.shape[0]:
+            data = np.zeros(max(2 * self.__data.shape[0], self.__size + count, 16), dtype=CONTRACT_DTYPE)
+            data[: self.__size] = self.__data[: self.__size]
+            self.__data = data
+        rows = np.arange(self.__size, self.__size + count)
+        for name, value in zip(CONTRACT_DTYPE.names, values):
+            self.__data[name][rows] = value.ravel()
+        self.__size += count
+        return rows.item() if values[0].ndim == 0 else rows
+
+    def Column(self, Name):
+        return self.Data[Name]
+
+    def Set(self, Name, Values, Index=slice(None)):
+        """
+
+            Fonksiyon, bir kolonu (ör. UnderlyingPrice ya da ImpliedVolatility) yerinde günceller
+
+        """
+        if Name == "Type":
+            Values = np.where(_OptionSign(Values) > 0, b"C", b"P")
+        self.Data[Name][Index] = Values
+
+    def Batch(self, Index=slice(None)):
+        """
+
+            Fonksiyon, seçilen satırlar için kolonları kopyalamadan bir WarrantBatch oluşturur
+
+        """
+        data = self.Data[Index]
+        return WarrantBatch(*(data[name] for name in CONTRACT_DTYPE.names))
+
+    def __Chunks(self, ChunkSize):
+        step = max(int(ChunkSize), 1)
+        for start in range(0, self.__size, step):
+            yield slice(start, min(start + step, self.__size))
+
+    def Greeks(self, ChunkSize=1_000_000):
+        """
+
+            Fonksiyon, tüm sözleşmelerin fiyat ve greekslerini (dönüşüm oranıyla ölçeklenmiş) parça parça
+            hesaplayıp tek bir GreeksResult dizi kaydında döndürür
+
+        """
+        result = GreeksResult(*(np.empty(self.__size) for _ in GreeksResult._fields))
+        for chunk in self.__Chunks(ChunkSize):
+            for output, values in zip(result, self.Batch(chunk).Greeks()):
+                output[chunk] = values
+        return result
+
+    def Price(self, ChunkSize=1_000_000):
+        return self.Greeks(ChunkSize).Price
+
+    def SolveImpliedVolatility(self, MarketPrice, Tolerance=1e-6, MaxIterations=100, ChunkSize=1_000_000):
+        """
+
+            Fonksiyon, piyasa fiyatlarından tüm sözleşmelerin zımni volatilitelerini parça parça hesaplar
+
+        """
+        prices = np.broadcast_to(np.asarray(MarketPrice, dtype=float), (self.__size,))
+        result = ImpliedVolatilityResult(
+            np.empty(self.__size), np.empty(self.__size, dtype=bool), np.empty(self.__size, dtype=np.int64)
+        )
+        for chunk in self.__Chunks(ChunkSize):
+            solved = self.Batch(chunk).SolveImpliedVolatility(prices[chunk], Tolerance, MaxIterations)
+            for output, values in zip(result, solved):
+                output[chunk] = values
+        return result
@@ -0,0 +1,155 @@
+import math
+
+import numpy as np
+from scipy.special import ndtr
+
+from .batch import _OptionSign
+from .core import GreeksResult
+
+class StreamingPricer:
+    """
+
+        Aynı dayanak varlığa bağlı opsiyon/varant sözleşmelerini tick bazında yeniden fiyatlar.
+        Spottan bağımsız terimler (iskonto faktörleri, σ√T, drift) bir kez hesaplanır; her güncellemede
+        yalnızca spota bağlı terimler önceden ayrılmış tamponlara yazılır.
+
+    """
+
+    def __init__(
+        self,
+        Type,
+        StrikePrice,
+        DaysToMaturity,
+        DomesticRate,
+        ImpliedVolatility,
+        Dividend,
+        ConversionRate=1,
+    ):
+        (
+            self._Sign,
+            self._StrikePrice,
+            self._DaysToMaturity,
+            self._DomesticRate,
+            self._ImpliedVolatility,
+            self._Dividend,
+            self._ConversionRate,
+        ) = (
+            np.array(values, dtype=float)
+            for values in np.broadcast_arrays(
+                _OptionSign(Type),
+                np.asarray(StrikePrice, dtype=float),
+                np.asarray(DaysToMaturity, dtype=float),
+                np.asarray(DomesticRate, dtype=float),
+                np.asarray(ImpliedVolatility, dtype=float),
+                np.asarray(Dividend, dtype=float),
+                np.asarray(ConversionRate, dtype=float),
+            )
+        )
+        shape = self._Sign.shape
+        self.__dOne = np.empty(shape)
+        self.__NdOne = np.empty(shape)
+        self.__CdfOne = np.empty(shape)
+        self.__CdfTwo = np.empty(shape)
+        self.__work = np.empty(shape)
+        self.__greeks = GreeksResult(*(np.empty(shape) for _ in GreeksResult._fields))
+        self.__Precompute()
+
+    def __len__(self):
+        return self._Sign.size
+
+    def __Precompute(self):
+        time = self._DaysToMaturity / 365
+        rate = self._DomesticRate / 100
+        volatility = self._ImpliedVolatility / 100
+        dividend = self._Dividend / 100
+        sqrtTime = np.sqrt(time)
+        discountedStrike = self._StrikePrice * np.exp(-rate * time)
+        carryDiscount = np.exp(-dividend * time)
+        scale = self._ConversionRate
+
+        self.__volSqrtTime = volatility * sqrtTime
+        self.__logStrikeLessDrift = np.log(self._StrikePrice) - (
+            rate - dividend + 0.5 * volatility**2
+        ) * time
+        self.__deltaCoefficient = self._Sign * carryDiscount
+        self.__gammaCoefficient = carryDiscount / self.__volSqrtTime
+        self.__spotCoefficient = self.__deltaCoefficient * scale
+        self.__strikeCoefficient = self._Sign * discountedStrike * scale
+        self.__thetaVolCoefficient = -carryDiscount * volatility / (2 * sqrtTime) / 365 * scale
+        self.__thetaRateCoefficient = self._Sign * rate * discountedStrike / 365 * scale
+        self.__thetaDividendCoefficient = dividend * self.__spotCoefficient / 365
+        self.__vegaCoefficient = 0.01 * carryDiscount * sqrtTime * scale
+        self.__rhoCoefficient = 0.01 * self._Sign * time * discountedStrike * scale
+
+    def SetImpliedVolatility(self, ImpliedVolatility, Index=slice(None)):
+        """
+
+            Fonksiyon, seçilen sözleşmelerin volatilitesini günceller ve spottan bağımsız terimleri yeniden hesaplar
+
+        """
+        self._ImpliedVolatility[Index] = ImpliedVolatility
+        self.__Precompute()
+
+    def SetDaysToMaturity(self, DaysToMaturity, Index=slice(None)):
+        """
+
+            Fonksiyon, vadeye kalan gün sayısını günceller (örneğin gün dönümünde) ve terimleri yeniden hesaplar
+
+        """
+        self._DaysToMaturity[Index] = DaysToMaturity
+        self.__Precompute()
+
+    def Update(self, UnderlyingPrice):
+        """
+
+            Fonksiyon, yeni spot fiyatı için tüm sözleşmelerin fiyat ve greekslerini hesaplar.
+            Dönen diziler iç tamponlardır ve bir sonraki güncellemede üzerine yazılır; saklanacaksa kopyalanmalıdır.
+
+        """
+        dOne, NdOne, CdfOne, CdfTwo, work = (
+            self.__dOne,
+            self.__NdOne,
+            self.__CdfOne,
+            self.__CdfTwo,
+            self.__work,
+        )
+        price, delta, theta, vega, gamma, rho = self.__greeks
+
+        np.subtract(math.log(UnderlyingPrice), self.__logStrikeLessDrift, out=dOne)
+        np.divide(dOne, self.__volSqrtTime, out=dOne)
+        np.multiply(dOne, dOne, out=NdOne)
+        np.multiply(NdOne, -0.5, out=NdOne)
+        np.exp(NdOne, out=NdOne)
+        np.multiply(NdOne, 1 / math.sqrt(2 * math.pi), out=NdOne)
+        np.multiply(self._Sign, dOne, out=work)
+        ndtr(work, out=CdfOne)
+        np.subtract(dOne, self.__volSqrtTime, out=work)
+        np.multiply(self._Sign, work, out=work)
+        ndtr(work, out=CdfTwo)
+
+        np.multiply(self.__spotCoefficient, CdfOne, out=price)
+        np.multiply(price, UnderlyingPrice, out=price)
+        np.multiply(self.__strikeCoefficient, CdfTwo, out=work)
+        np.subtract(price, work, out=price)
+        np.multiply(self.__deltaCoefficient, CdfOne, out=delta)
+        np.multiply(self.__thetaVolCoefficient, NdOne, out=theta)
+        np.multiply(self.__thetaDividendCoefficient, CdfOne, out=work)
+        np.add(theta, work, out=theta)
+        np.multiply(theta, UnderlyingPrice, out=theta)
+        np.multiply(self.__thetaRateCoefficient, CdfTwo, out=work)
+        np.subtract(theta, work, out=theta)
+        np.multiply(self.__vegaCoefficient, NdOne, out=vega)
+        np.multiply(vega, UnderlyingPrice, out=vega)
+        np.multiply(self.__gammaCoefficient, NdOne, out=gamma)
+        np.divide(gamma, UnderlyingPrice, out=gamma)
+        np.multiply(self.__rhoCoefficient, CdfTwo, out=rho)
+        return self.__greeks
+
+    def Stream(self, UnderlyingPrices):
+        """
+
+            Fonksiyon, spot fiyat akışındaki (liste, üreteç vb.) her tick için (spot, greeksler) ikilisi üretir
+
+        """
+        for UnderlyingPrice in UnderlyingPrices:
+            yield UnderlyingPrice, self.Update(UnderlyingPrice)
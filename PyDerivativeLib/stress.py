@@ -0,0 +1,240 @@
+import numpy as np
+
+from .batch import _EuropeanPrice, _FutureRisk
+
+MODES = ("Full", "DeltaGamma")
+
+def _ShockMatrix(Value):
+    value = np.asarray(Value, dtype=float)
+    return value.reshape(-1, 1) if value.ndim < 2 else value
+
+class ScenarioSet:
+    """
+
+        Stres senaryoları kümesi. Her senaryo birlikte uygulanan şoklardan oluşur:
+        SpotShock göreli spot değişimi (0.05 = %5), VolatilityShock volatilite puanı, RateShock faiz puanı,
+        DaysElapsed geçen gün sayısı. SpotShock ve VolatilityShock (senaryo sayısı,) boyutlu ise tüm dayanak
+        varlıklara, (senaryo sayısı, dayanak sayısı) boyutlu ise Underlyings sırasıyla her dayanağa ayrı uygulanır.
+
+    """
+
+    def __init__(self, SpotShock=0, VolatilityShock=0, RateShock=0, DaysElapsed=0, Underlyings=None, Names=None):
+        spot = _ShockMatrix(SpotShock)
+        volatility = _ShockMatrix(VolatilityShock)
+        (count,) = np.broadcast_shapes(
+            spot.shape[:1], volatility.shape[:1], np.shape(RateShock), np.shape(DaysElapsed), (1,)
+        )
+        self._SpotShock = np.broadcast_to(spot, (count, spot.shape[1]))
+        self._VolatilityShock = np.broadcast_to(volatility, (count, volatility.shape[1]))
+        self._RateShock = np.broadcast_to(np.asarray(RateShock, dtype=float), (count,))
+        self._DaysElapsed = np.broadcast_to(np.asarray(DaysElapsed, dtype=float), (count,))
+        self._Underlyings = None if Underlyings is None else list(Underlyings)
+        self._Names = None if Names is None else list(Names)
+        widths = {self._SpotShock.shape[1], self._VolatilityShock.shape[1]} - {1}
+        if widths and (self._Underlyings is None or widths != {len(self._Underlyings)}):
+            raise ValueError("Per-underlying shocks need an Underlyings list matching their columns.")
+
+    def __len__(self):
+        return self._RateShock.size
+
+    @classmethod
+    def FromHistory(cls, Prices, Horizon=1, Volatilities=None, Rates=None, DaysElapsed=0, Underlyings=None):
+        """
+
+            Fonksiyon, geçmiş fiyat (zaman x dayanak) serilerinden Horizon günlük göreli değişimleri senaryo olarak
+            üretir. Volatilities (yüzde) ve Rates (yüzde) verilirse aynı ufuktaki puan değişimleri de eklenir.
+            DataFrame verilirse kolon adları dayanak adı olarak kullanılır.
+
+        """
+        if hasattr(Prices, "columns"):
+            Underlyings = list(Prices.columns) if Underlyings is None else Underlyings
+            Prices = Prices.to_numpy()
+        prices = np.asarray(Prices, dtype=float)
+        prices = prices[:, None] if prices.ndim == 1 else prices
+        spot = prices[Horizon:] / prices[:-Horizon] - 1
+        volatility = 0
+        if Volatilities is not None:
+            volatilities = np.asarray(getattr(Volatilities, "values", Volatilities), dtype=float)
+            volatilities = volatilities[:, None] if volatilities.ndim == 1 else volatilities
+            volatility = volatilities[Horizon:] - volatilities[:-Horizon]
+        rate = 0
+        if Rates is not None:
+            rates = np.asarray(getattr(Rates, "values", Rates), dtype=float)
+            rate = rates[Horizon:] - rates[:-Horizon]
+        if spot.shape[1] == 1 and Underlyings is None:
+            spot = spot[:, 0]
+        return cls(spot, volatility, rate, DaysElapsed, Underlyings)
+
+    @classmethod
+    def Grid(cls, SpotShocks, VolatilityShocks=(0,), RateShocks=(0,), DaysElapsed=(0,)):
+        """
+
+            Fonksiyon, verilen şok değerlerinin tüm birleşimlerinden kullanıcı tanımlı senaryo ızgarası üretir
+
+        """
+        spot, volatility, rate, days = (
+            grid.ravel()
+            for grid in np.meshgrid(SpotShocks, VolatilityShocks, RateShocks, DaysElapsed, indexing="ij")
+        )
+        return cls(spot, volatility, rate, days)
+
+    def _Columns(self, Underlyings):
+        if self._Underlyings is None:
+            return np.zeros(len(Underlyings), dtype=np.int64)
+        lookup = {name: index for index, name in enumerate(self._Underlyings)}
+        missing = set(Underlyings) - set(lookup)
+        if missing:
+            raise ValueError(f"No scenario shocks given for underlyings: {sorted(missing)}.")
+        return np.array([lookup[name] for name in Underlyings], dtype=np.int64)
+
+class StressResult:
+    """
+
+        Stres testi sonucu. Total (senaryo,) portföy kâr/zararı, ByUnderlying (senaryo, dayanak) ve istenirse
+        ByPosition (senaryo, pozisyon) kâr/zarar matrisleridir. Kayıplar VaR ve ES için pozitif işaretlidir.
+
+    """
+
+    def __init__(self, Total, ByUnderlying, ByPosition, Underlyings, Names=None):
+        self.Total = Total
+        self.ByUnderlying = ByUnderlying
+        self.ByPosition = ByPosition
+        self.Underlyings = Underlyings
+        self.Names = Names
+
+    def __len__(self):
+        return self.Total.size
+
+    def VaR(self, Confidence=0.99):
+        """
+
+            Fonksiyon, senaryo kâr/zarar dağılımından Confidence düzeyindeki riske maruz değeri döndürür
+
+        """
+        return float(np.quantile(-self.Total, Confidence))
+
+    def ExpectedShortfall(self, Confidence=0.99):
+        """
+
+            Fonksiyon, VaR'ı aşan ya da ona eşit senaryo kayıplarının ortalamasını döndürür
+
+        """
+        losses = -self.Total
+        return float(losses[losses >= np.quantile(losses, Confidence)].mean())
+
+    def WorstScenarios(self, Count=10):
+        order = np.argsort(self.Total)[:Count]
+        return order if self.Names is None else [self.Names[index] for index in order]
+
+    def ToFrame(self):
+        import pandas as pd
+
+        return pd.DataFrame(self.ByUnderlying, columns=self.Underlyings, index=self.Names).assign(
+            Total=self.Total
+        )
+
+def _FullValues(Positions, Spot, Volatility, Rate, Time):
+    values = np.zeros(Spot.shape)
+    option = Positions["Kind"] == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if option.any():
+            price, _ = _EuropeanPrice(
+                Positions["Sign"][option],
+                Spot[:, option],
+                Positions["StrikePrice"][option],
+                Time[:, option],
+                Rate[:, option],
+                Rate[:, option] - Positions["Dividend"][option] / 100,
+                Volatility[:, option],
+            )
+            values[:, option] = price * Positions["ConversionRate"][option]
+        future = ~option
+        if future.any():
+            shape = (Spot.shape[0], int(future.sum()))
+            values[:, future] = _FutureRisk(
+                np.broadcast_to(Positions["FutureType"][future], shape),
+                Spot[:, future],
+                Time[:, future],
+                Rate[:, future],
+                np.broadcast_to(Positions["Dividend"][future] / 100, shape),
+                np.broadcast_to(Positions["ForeignRate"][future] / 100, shape),
+                np.broadcast_to(Positions["CarryAdjustment"][future] / 100, shape),
+                np.broadcast_to(Positions["PresentValue"][future], shape),
+            )[..., 0]
+    return np.nan_to_num(values * Positions["Quantity"])
+
+def _Select(Shocks, Chunk, Columns):
+    shocks = Shocks[Chunk]
+    return shocks[:, Columns] if shocks.shape[1] > 1 else shocks
+
+def stress_test(Book, Scenarios, Mode="Full", ByPosition=True, ChunkSize=2_000_000):
+    """
+
+        Fonksiyon, bir Book'taki tüm pozisyonlara senaryo kümesini uygular ve StressResult döndürür.
+        Mode="Full" her senaryoda opsiyon/varant ve vadeli pozisyonları tam yeniden değerler;
+        Mode="DeltaGamma" defterdeki Delta, Gamma, Vega, Theta ve Rho ile ikinci derece yaklaşım kullanır.
+        Senaryolar, bellek ChunkSize eleman ile sınırlı kalacak şekilde parçalar halinde işlenir.
+
+    """
+    if Mode not in MODES:
+        raise ValueError(f"Mode must be one of {MODES}.")
+    positions = Book.Positions()
+    names = positions["Underlying"].tolist()
+    lookup = {}
+    underlyingIndex = np.array([lookup.setdefault(name, len(lookup)) for name in names], dtype=np.int64)
+    underlyings = list(lookup)
+    order = np.argsort(underlyingIndex, kind="stable")
+    positions = {name: column[order] for name, column in positions.items()}
+    starts = np.flatnonzero(np.r_[True, np.diff(underlyingIndex[order]) != 0])
+    spot = np.array([Book.Spot(name) for name in underlyings])[underlyingIndex[order]]
+    columns = Scenarios._Columns(positions["Underlying"].tolist())
+    count, size = len(Scenarios), len(names)
+
+    total = np.zeros(count)
+    byUnderlying = np.zeros((count, len(underlyings)))
+    byPosition = np.zeros((count, size)) if ByPosition else None
+    if size == 0:
+        return StressResult(total, byUnderlying, byPosition, underlyings, Scenarios._Names)
+    if Mode == "DeltaGamma" and not ByPosition:
+        risk = {
+            field: np.add.reduceat(np.nan_to_num(positions[field]), starts)
+            for field in ("Delta", "Gamma", "Vega", "Theta", "Rho")
+        }
+        positions = dict(positions, **risk)
+        spot, columns, size = spot[starts], columns[starts], starts.size
+        starts = np.arange(size)
+    base = _FullValues(
+        positions,
+        spot[None, :],
+        positions["ImpliedVolatility"][None, :] / 100,
+        positions["DomesticRate"][None, :] / 100,
+        positions["DaysToMaturity"][None, :] / 365,
+    ) if Mode == "Full" else None
+    step = max(int(ChunkSize) // size, 1)
+    for start in range(0, count, step):
+        chunk = slice(start, min(start + step, count))
+        spotChange = spot * _Select(Scenarios._SpotShock, chunk, columns)
+        volatilityChange = _Select(Scenarios._VolatilityShock, chunk, columns)
+        rateChange = Scenarios._RateShock[chunk, None]
+        days = Scenarios._DaysElapsed[chunk, None]
+        if Mode == "Full":
+            pnl = _FullValues(
+                positions,
+                spot + spotChange,
+                np.maximum(positions["ImpliedVolatility"] + volatilityChange, 1e-4) / 100,
+                (positions["DomesticRate"] + rateChange) / 100,
+                np.maximum(positions["DaysToMaturity"] - days, 1e-6) / 365,
+            ) - base
+        else:
+            pnl = np.nan_to_num(
+                positions["Delta"] * spotChange
+                + 0.5 * positions["Gamma"] * spotChange**2
+                + positions["Vega"] * volatilityChange
+                + positions["Theta"] * days
+                + positions["Rho"] * rateChange
+            )
+        if ByPosition:
+            byPosition[chunk][:, order] = pnl
+        byUnderlying[chunk] = np.add.reduceat(pnl, starts, axis=1)
+        total[chunk] = byUnderlying[chunk].sum(axis=1)
+    return StressResult(total, byUnderlying, byPosition, underlyings, Scenarios._Names)
@@ -0,0 +1,277 @@
+import numpy as np
+
+from .batch import WarrantBatch, implied_volatility_batch
+from .core import OptionCalculate, WarrantCalculate
+from .curve import _CurveValues
+
+def _Svi(Parameters, LogMoneyness):
+    a, b, rho, m, sigma = np.moveaxis(Parameters, -1, 0)
+    x = LogMoneyness - m
+    return a + b * (rho * x + np.sqrt(x * x + sigma * sigma))
+
+def _FitSvi(LogMoneyness, TotalVariance, Weights, GridSize=15, Rounds=4):
+    """
+
+        Ham SVI parametrelerini (a, b, rho, m, sigma) tüm vadeler için aynı anda kalibre eder.
+        Girdiler (vade, kotasyon) boyutlu, eksik kotasyonlar sıfır ağırlıklıdır. Sabit (m, sigma) için
+        model (a, b*rho, b) parametrelerinde doğrusal olduğundan ağırlıklı en küçük kareler kapalı formda
+        çözülür; (m, sigma) ızgarası her turda en iyi noktanın çevresinde daraltılır. Çözüm b >= 0,
+        |rho| <= 1 ve negatif olmayan en küçük varyans koşullarına izdüşürülür.
+
+    """
+    count = LogMoneyness.shape[0]
+    quoted = Weights > 0
+    low = np.where(quoted, LogMoneyness, np.inf).min(axis=1)
+    high = np.where(quoted, LogMoneyness, -np.inf).max(axis=1)
+    width = np.maximum(high - low, 1e-2)
+    center = 0.5 * (low + high)
+    centerSpan = width
+    logSigma = np.log(0.2 * width)
+    logSigmaSpan = np.full(count, np.log(1000) / 2)
+    steps = np.linspace(-1, 1, GridSize)
+    weightedTarget = Weights * TotalVariance
+    total = Weights.sum(axis=1)[:, None]
+    sumK = (Weights * LogMoneyness).sum(axis=1)[:, None]
+    sumKK = (Weights * LogMoneyness**2).sum(axis=1)[:, None]
+    sumY = weightedTarget.sum(axis=1)[:, None]
+    sumKY = (weightedTarget * LogMoneyness).sum(axis=1)[:, None]
+    sumYY = (weightedTarget * TotalVariance).sum(axis=1)[:, None]
+    rows = np.arange(count)
+    for _ in range(Rounds):
+        m = (center[:, None] + centerSpan[:, None] * steps)[:, :, None]
+        sigma = np.exp(logSigma[:, None] + logSigmaSpan[:, None] * steps)[:, None, :]
+        m, sigma = (value.reshape(count, -1) for value in np.broadcast_arrays(m, sigma))
+        x = LogMoneyness[:, None, :] - m[..., None]
+        root = np.sqrt(x * x + sigma[..., None] ** 2)
+        # Ağırlıklı toplamlar: kökü içermeyenler momentlerden kapalı formda, diğerleri matris-vektör çarpımıyla
+        sumX = sumK - m * total
+        sumXX = sumKK - 2 * m * sumK + m * m * total
+        sumR = np.matmul(root, Weights[..., None])[..., 0]
+        sumXR = np.matmul(x * root, Weights[..., None])[..., 0]
+        sumRR = sumXX + sigma * sigma * total
+        normal = np.stack(
+            [
+                np.stack([np.broadcast_to(total, m.shape), sumX, sumR], axis=-1),
+                np.stack([sumX, sumXX, sumXR], axis=-1),
+                np.stack([sumR, sumXR, sumRR], axis=-1),
+            ],
+            axis=-2,
+        )
+        moment = np.stack(
+            [
+                np.broadcast_to(sumY, m.shape),
+                sumKY - m * sumY,
+                np.matmul(root, weightedTarget[..., None])[..., 0],
+            ],
+            axis=-1,
+        )
+        ridge = 1e-12 * np.trace(normal, axis1=-2, axis2=-1)[..., None, None] * np.eye(3)
+        a, slope, b = np.moveaxis(np.linalg.solve(normal + ridge, moment[..., None])[..., 0], -1, 0)
+        b = np.maximum(b, 0.0)
+        slope = np.clip(slope, -b, b)
+        a = np.maximum(a, -sigma * np.sqrt(np.maximum(b * b - slope * slope, 0.0)))
+        theta = np.stack([a, slope, b], axis=-1)
+        error = np.einsum("epi,epij,epj->ep", theta, normal, theta) - 2 * (theta * moment).sum(-1) + sumYY
+        best = np.argmin(error, axis=1)
+        center, logSigma = m[rows, best], np.log(sigma[rows, best])
+        centerSpan = centerSpan * 4 / (GridSize - 1)
+        logSigmaSpan = logSigmaSpan * 4 / (GridSize - 1)
+    a, slope, b = a[rows, best], slope[rows, best], b[rows, best]
+    rho = np.divide(slope, b, out=np.zeros(count), where=b > 0)
+    return np.stack([a, b, rho, center, np.exp(logSigma)], axis=-1)
+
+class VolatilitySurface:
+    """
+
+        Her vade için ham SVI gülümsemesi (toplam varyans w(k) = a + b(rho(k - m) + sqrt((k - m)^2 + sigma^2)),
+        k = ln(K / F)) ile tanımlı volatilite yüzeyi. Vadeler arasında aynı k için toplam varyans doğrusal
+        interpole edilir; ilk vadeden önce ve son vadeden sonra volatilite sabit tutulur. Vadeler sıralı
+        tutulduğundan her sorgu searchsorted ile O(log n) sürede ve tüm dizi için tek geçişte çözülür.
+
+    """
+
+    def __init__(self, DaysToMaturity, Parameters, Errors=None):
+        days = np.atleast_1d(np.asarray(DaysToMaturity, dtype=float))
+        order = np.argsort(days)
+        self._DaysToMaturity = days[order]
+        self._Parameters = np.atleast_2d(np.asarray(Parameters, dtype=float))[order]
+        self._Errors = None if Errors is None else np.asarray(Errors, dtype=float)[order]
+        self.__Time = self._DaysToMaturity / 365
+
+    @classmethod
+    def Calibrate(
+        cls,
+        UnderlyingPrice,
+        StrikePrice,
+        DaysToMaturity,
+        ImpliedVolatility,
+        DomesticRate=0,
+        Dividend=0,
+        Weights=1,
+    ):
+        """
+
+            Fonksiyon, yüzde zımni volatilite kotasyonlarından yüzeyi kalibre eder. Kotasyonlar vadeye kalan
+            güne göre gruplanır ve her grup için bir SVI gülümsemesi tüm vadelerde birlikte çözülür.
+            Faiz ve temettü sabit, kotasyonlarla hizalı dizi ya da RateCurve olabilir.
+
+        """
+        days = np.asarray(DaysToMaturity, dtype=float)
+        spot, strike, days, volatility, weights = (
+            np.array(values, dtype=float).ravel()
+            for values in np.broadcast_arrays(UnderlyingPrice, StrikePrice, days, ImpliedVolatility, Weights)
+        )
+        time = days / 365
+        carry = (_CurveValues(DomesticRate, days) - _CurveValues(Dividend, days)) / 100
+        logMoneyness = np.log(strike / spot) - carry * time
+
+        expiries, group = np.unique(days, return_inverse=True)
+        order = np.argsort(group, kind="stable")
+        counts = np.bincount(group)
+        column = np.arange(days.size) - np.repeat(np.cumsum(counts) - counts, counts)
+        shape = (expiries.size, counts.max())
+        padded = [np.zeros(shape) for _ in range(3)]
+        for output, values in zip(padded, (logMoneyness, (volatility / 100) ** 2 * time, weights)):
+            output[group[order], column] = values[order]
+        parameters = _FitSvi(*padded)
+
+        fitted = 100 * np.sqrt(np.maximum(_Svi(parameters[group], logMoneyness), 0) / time)
+        errors = np.sqrt(np.bincount(group, (fitted - volatility) ** 2) / counts)
+        return cls(expiries, parameters, errors)
+
+    @classmethod
+    def FromPrices(
+        cls,
+        Type,
+        UnderlyingPrice,
+        StrikePrice,
+        DaysToMaturity,
+        DomesticRate,
+        Dividend,
+        MarketPrice,
+        ConversionRate=1,
+        Weights=1,
+    ):
+        """
+
+            Fonksiyon, opsiyon/varant piyasa fiyatlarından önce zımni volatiliteleri toplu olarak çözer,
+            yakınsamayan kotasyonları atar ve yüzeyi kalibre eder
+
+        """
+        days = np.asarray(DaysToMaturity, dtype=float)
+        domestic = _CurveValues(DomesticRate, days)
+        dividend = _CurveValues(Dividend, days)
+        implied = implied_volatility_batch(
+            Type, UnderlyingPrice, StrikePrice, days, domestic, dividend, MarketPrice, ConversionRate
+        )
+        spot, strike, days, domestic, dividend, weights = (
+            np.broadcast_to(values, implied.Converged.shape)[implied.Converged]
+            for values in (UnderlyingPrice, StrikePrice, days, domestic, dividend, Weights)
+        )
+        return cls.Calibrate(
+            spot, strike, days, implied.ImpliedVolatility[implied.Converged], domestic, dividend, weights
+        )
+
+    @property
+    def DaysToMaturity(self):
+        return self._DaysToMaturity
+
+    @property
+    def Parameters(self):
+        return self._Parameters
+
+    @property
+    def Errors(self):
+        """
+
+            Her vade için kalibrasyonun volatilite puanı cinsinden kök ortalama kare hatası
+
+        """
+        return self._Errors
+
+    def TotalVariance(self, LogMoneyness, DaysToMaturity):
+        """
+
+            Fonksiyon, k = ln(K / F) ve vadeye kalan gün dizileri için toplam varyansı döndürür
+
+        """
+        k, days = np.broadcast_arrays(
+            np.asarray(LogMoneyness, dtype=float), np.asarray(DaysToMaturity, dtype=float)
+        )
+        time = days / 365
+        index = np.searchsorted(self._DaysToMaturity, days)
+        last = self._DaysToMaturity.size - 1
+        lower, upper = np.clip(index - 1, 0, last), np.clip(index, 0, last)
+        lowerTime, upperTime = self.__Time[lower], self.__Time[upper]
+        lowerVariance = _Svi(self._Parameters[lower], k)
+        upperVariance = _Svi(self._Parameters[upper], k)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weight = np.where(lower == upper, 0.0, (time - lowerTime) / (upperTime - lowerTime))
+            flat = lowerVariance * time / lowerTime
+        return np.where(lower == upper, flat, lowerVariance + weight * (upperVariance - lowerVariance))
+
+    def ImpliedVolatility(self, UnderlyingPrice, StrikePrice, DaysToMaturity, DomesticRate=0, Dividend=0):
+        """
+
+            Fonksiyon, sözleşmelerin yüzeyden okunan yüzde zımni volatilitelerini dizi olarak döndürür
+
+        """
+        spot, strike, days = np.broadcast_arrays(
+            np.asarray(UnderlyingPrice, dtype=float),
+            np.asarray(StrikePrice, dtype=float),
+            np.asarray(DaysToMaturity, dtype=float),
+        )
+        time = days / 365
+        carry = (_CurveValues(DomesticRate, days) - _CurveValues(Dividend, days)) / 100
+        variance = self.TotalVariance(np.log(strike / spot) - carry * time, days)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return 100 * np.sqrt(np.maximum(variance, 0) / time)
+
+    def Batch(self, Type, UnderlyingPrice, StrikePrice, DaysToMaturity, DomesticRate, Dividend, ConversionRate=1):
+        """
+
+            Fonksiyon, volatiliteleri yüzeyden okunan bir WarrantBatch (ConversionRate=1 ile opsiyon) döndürür
+
+        """
+        days = np.asarray(DaysToMaturity, dtype=float)
+        domestic = _CurveValues(DomesticRate, days)
+        dividend = _CurveValues(Dividend, days)
+        return WarrantBatch(
+            Type,
+            UnderlyingPrice,
+            StrikePrice,
+            days,
+            domestic,
+            self.ImpliedVolatility(UnderlyingPrice, StrikePrice, days, domestic, dividend),
+            dividend,
+            ConversionRate,
+        )
+
+    def __Scalar(self, Class, Type, UnderlyingPrice, StrikePrice, DaysToMaturity, DomesticRate, Dividend, *Extra):
+        days = np.asarray(DaysToMaturity, dtype=float)
+        domestic = float(_CurveValues(DomesticRate, days))
+        dividend = float(_CurveValues(Dividend, days))
+        volatility = float(self.ImpliedVolatility(UnderlyingPrice, StrikePrice, days, domestic, dividend))
+        return Class(Type, UnderlyingPrice, StrikePrice, DaysToMaturity, domestic, volatility, dividend, *Extra)
+
+    def Option(self, Type, UnderlyingPrice, StrikePrice, DaysToMaturity, DomesticRate, Dividend):
+        """
+
+            Fonksiyon, volatilitesi yüzeyden okunan bir OptionCalculate nesnesi döndürür
+
+        """
+        return self.__Scalar(
+            OptionCalculate, Type, UnderlyingPrice, StrikePrice, DaysToMaturity, DomesticRate, Dividend
+        )
+
+    def Warrant(self, Type, UnderlyingPrice, StrikePrice, DaysToMaturity, DomesticRate, Dividend, ConversionRate=1):
+        return self.__Scalar(
+            WarrantCalculate,
+            Type,
+            UnderlyingPrice,
+            StrikePrice,
+            DaysToMaturity,
+            DomesticRate,
+            Dividend,
+            ConversionRate,
+        )
@@ -0,0 +1,69 @@
+"""
+
+    PyDerivativeLib import süresi ölçümü. Her deneme yeni bir yorumlayıcıda çalışır; medyan süre
+    bütçeyi aşarsa ya da ağır bağımlılıklardan biri import sırasında yüklenirse 1 koduyla çıkar.
+
+    Kullanım: python benchmarks/bench_import.py --repeat 20 --budget-ms 50
+
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ("numpy", "scipy", "pandas", "matplotlib", "statsmodels")
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import PyDerivativeLib
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "loaded": [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+def MeasureImport(Repeat):
+    samples = []
+    loaded = set()
+    for _ in range(Repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        result = json.loads(output)
+        samples.append(result["seconds"])
+        loaded.update(result["loaded"])
+    return samples, sorted(loaded)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PyDerivativeLib import-time benchmark")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=50.0)
+    args = parser.parse_args(argv)
+
+    samples, loaded = MeasureImport(args.repeat)
+    median_ms = statistics.median(samples) * 1000
+    report = {
+        "benchmark": "import PyDerivativeLib",
+        "repeat": args.repeat,
+        "median_ms": median_ms,
+        "min_ms": min(samples) * 1000,
+        "max_ms": max(samples) * 1000,
+        "budget_ms": args.budget_ms,
+        "heavy_modules_loaded": loaded,
+    }
+    print(json.dumps(report, indent=2))
+    if loaded:
+        print(f"Heavy modules loaded at import time: {', '.join(loaded)}", file=sys.stderr)
+        return 1
+    if median_ms > args.budget_ms:
+        print(f"Import took {median_ms:.1f} ms, budget is {args.budget_ms:.1f} ms", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
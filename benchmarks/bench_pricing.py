@@ -0,0 +1,468 @@
+"""
+
+    PyDerivativeLib fiyatlama yollarının verim ve gecikme ölçümü. Her yol 1'den 1M sözleşmeye kadar
+    seçilen parti boyutlarında ölçülür; sonuçlar, ortam bilgisi ve referans değerlerle sayısal uyum
+    kontrolü makinece okunabilir JSON olarak yazılır. Uyum kontrolü başarısız olursa 1 koduyla çıkar.
+
+    Kullanım: python benchmarks/bench_pricing.py --sizes 1,100,10000,1000000 --output bench.json
+              python benchmarks/bench_pricing.py --paths batch --compare onceki.json
+
+"""
+import argparse
+import datetime
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+
+import PyDerivativeLib as lib
+
+REFERENCE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "reference_values.json")
+GREEK_FIELDS = ("Price", "Delta", "Theta", "Vega", "Gamma", "Rho")
+BENCHMARKS = {}
+
+def Benchmark(Name, Group, Scalar=False):
+    """
+
+        Bir ölçüm yolunu kaydeder. Fonksiyon (n, rng) alır ve zamanlanacak argümansız bir çağrı döndürür.
+
+    """
+
+    def register(function):
+        BENCHMARKS[Name] = (Group, Scalar, function)
+        return function
+
+    return register
+
+def Contracts(Count, Rng):
+    return {
+        "Type": np.where(Rng.random(Count) < 0.5, "C", "P"),
+        "UnderlyingPrice": Rng.uniform(80, 120, Count),
+        "StrikePrice": Rng.uniform(80, 120, Count),
+        "DaysToMaturity": Rng.uniform(5, 730, Count),
+        "DomesticRate": Rng.uniform(0, 10, Count),
+        "ImpliedVolatility": Rng.uniform(10, 80, Count),
+        "Dividend": Rng.uniform(0, 3, Count),
+        "ConversionRate": Rng.choice([1.0, 0.1, 0.01], Count),
+    }
+
+def _ScalarRows(Columns, Names):
+    return list(zip(*(Columns[name].tolist() for name in Names)))
+
+_OPTION_ARGUMENTS = (
+    "Type",
+    "UnderlyingPrice",
+    "StrikePrice",
+    "DaysToMaturity",
+    "DomesticRate",
+    "ImpliedVolatility",
+    "Dividend",
+)
+
+def _ScalarMetric(Class, Method, Names=_OPTION_ARGUMENTS):
+    def setup(Count, Rng):
+        rows = _ScalarRows(Contracts(Count, Rng), Names)
+        return lambda: [getattr(Class(*row), Method)() for row in rows]
+
+    return setup
+
+for _metric in GREEK_FIELDS + ("Greeks", "HigherOrderGreeks"):
+    Benchmark(f"OptionCalculate.{_metric}", "scalar", Scalar=True)(
+        _ScalarMetric(lib.OptionCalculate, _metric)
+    )
+for _metric in ("Price", "Greeks", "Leverage"):
+    Benchmark(f"WarrantCalculate.{_metric}", "scalar", Scalar=True)(
+        _ScalarMetric(lib.WarrantCalculate, _metric, _OPTION_ARGUMENTS + ("ConversionRate",))
+    )
+
+@Benchmark("implied_volatility", "scalar", Scalar=True)
+def _ScalarImplied(Count, Rng):
+    columns = Contracts(Count, Rng)
+    prices = lib.OptionBatch(*(columns[name] for name in _OPTION_ARGUMENTS)).Price()
+    rows = _ScalarRows(
+        columns, ("Type", "UnderlyingPrice", "StrikePrice", "DaysToMaturity", "DomesticRate", "Dividend")
+    )
+    return lambda: [lib.implied_volatility(*row, price) for row, price in zip(rows, prices.tolist())]
+
+@Benchmark("Future.TheoreticalPrice", "scalar", Scalar=True)
+def _ScalarFuture(Count, Rng):
+    spots = Rng.uniform(80, 120, Count).tolist()
+    days = Rng.uniform(5, 365, Count).tolist()
+    return lambda: [
+        lib.Future(lib.Future_Type.Index, spot, day, 8, 0, 2).TheoreticalPrice()
+        for spot, day in zip(spots, days)
+    ]
+
+@Benchmark("Future.HedgeRatio", "scalar")
+def _HedgeRatio(Count, Rng):
+    market = 100 * np.exp(np.cumsum(Rng.normal(0, 0.01, Count + 2)))
+    future = market * (1 + Rng.normal(0, 0.001, Count + 2))
+    contract = lib.Future(lib.Future_Type.Index, 100, 30, 8, 0, 2)
+    return lambda: contract.HedgeRatio(market.tolist(), future.tolist())
+
+@Benchmark("OptionBatch.Greeks", "batch")
+def _OptionBatch(Count, Rng):
+    columns = Contracts(Count, Rng)
+    return lambda: lib.OptionBatch(*(columns[name] for name in _OPTION_ARGUMENTS)).Greeks()
+
+@Benchmark("OptionBatch.HigherOrderGreeks", "batch")
+def _HigherOrder(Count, Rng):
+    columns = Contracts(Count, Rng)
+    return lambda: lib.OptionBatch(*(columns[name] for name in _OPTION_ARGUMENTS)).HigherOrderGreeks()
+
+@Benchmark("WarrantBatch.Greeks", "batch")
+def _WarrantBatch(Count, Rng):
+    columns = Contracts(Count, Rng)
+    names = _OPTION_ARGUMENTS + ("ConversionRate",)
+    return lambda: lib.WarrantBatch(*(columns[name] for name in names)).Greeks()
+
+@Benchmark("WarrantBatch.Analytics", "batch")
+def _WarrantAnalytics(Count, Rng):
+    columns = Contracts(Count, Rng)
+    names = _OPTION_ARGUMENTS + ("ConversionRate",)
+    return lambda: lib.WarrantBatch(*(columns[name] for name in names)).Analytics()
+
+@Benchmark("ContractStore.Greeks", "batch")
+def _ContractStore(Count, Rng):
+    columns = Contracts(Count, Rng)
+    store = lib.ContractStore(Count)
+    store.Add(*(columns[name] for name in _OPTION_ARGUMENTS + ("ConversionRate",)))
+    return lambda: store.Greeks(ChunkSize=250_000)
+
+@Benchmark("VolatilitySurface.Calibrate", "batch")
+def _SurfaceCalibrate(Count, Rng):
+    columns = Contracts(Count, Rng)
+    days = np.round(columns["DaysToMaturity"] / 30) * 30 + 7
+    return lambda: lib.VolatilitySurface.Calibrate(
+        columns["UnderlyingPrice"], columns["StrikePrice"], days, columns["ImpliedVolatility"], 8, 1
+    )
+
+@Benchmark("VolatilitySurface.ImpliedVolatility", "batch")
+def _SurfaceLookup(Count, Rng):
+    days = np.repeat([7, 30, 91, 182, 365], 21)
+    strikes = np.tile(np.linspace(70, 130, 21), 5)
+    surface = lib.VolatilitySurface.Calibrate(100, strikes, days, 20 + 10 * np.abs(np.log(strikes / 100)))
+    columns = Contracts(Count, Rng)
+    return lambda: surface.ImpliedVolatility(
+        columns["UnderlyingPrice"], columns["StrikePrice"], columns["DaysToMaturity"], 8, 1
+    )
+
+@Benchmark("FutureOptionBatch.Greeks", "batch")
+def _Black76(Count, Rng):
+    columns = Contracts(Count, Rng)
+    return lambda: lib.FutureOptionBatch(
+        columns["Type"],
+        columns["UnderlyingPrice"],
+        columns["StrikePrice"],
+        columns["DaysToMaturity"],
+        columns["DomesticRate"],
+        columns["ImpliedVolatility"],
+    ).Greeks()
+
+@Benchmark("AmericanBatch.Greeks", "batch")
+def _American(Count, Rng):
+    columns = Contracts(Count, Rng)
+    return lambda: lib.AmericanBatch(*(columns[name] for name in _OPTION_ARGUMENTS)).Greeks()
+
+@Benchmark("MonteCarloWarrant.Price", "batch")
+def _MonteCarlo(Count, Rng):
+    warrant = lib.MonteCarloWarrant("C", 100, 95, 90, 8, 30, 1, 0.1, Payoff="Asian", Seed=1)
+    return lambda: warrant.Price(Paths=max(Count, 2))
+
+@Benchmark("implied_volatility_batch", "batch")
+def _BatchImplied(Count, Rng):
+    columns = Contracts(Count, Rng)
+    prices = lib.OptionBatch(*(columns[name] for name in _OPTION_ARGUMENTS)).Price()
+    names = ("Type", "UnderlyingPrice", "StrikePrice", "DaysToMaturity", "DomesticRate", "Dividend")
+    return lambda: lib.implied_volatility_batch(*(columns[name] for name in names), prices)
+
+@Benchmark("StreamingPricer.Update", "batch")
+def _Streaming(Count, Rng):
+    columns = Contracts(Count, Rng)
+    pricer = lib.StreamingPricer(
+        *(columns[name] for name in _OPTION_ARGUMENTS if name != "UnderlyingPrice")
+    )
+    return lambda: pricer.Update(100.0)
+
+@Benchmark("FutureCurve.TheoreticalPrices", "batch")
+def _FutureCurve(Count, Rng):
+    curve = lib.FutureCurve(lib.Future_Type.Index, 100, np.linspace(5, 365, 12), 8, Dividend=2)
+    spots = Rng.uniform(80, 120, max(Count // 12, 1))
+    return lambda: curve.TheoreticalPrices(spots)
+
+@Benchmark("Graphs.ScenarioSurface", "batch")
+def _Scenario(Count, Rng):
+    side = max(int(round(Count ** (1 / 3))), 1)
+    graph = lib.Graphs("Warrant", "C", 100, 100, 90, 8, 30, 1, 0.1)
+    spots = np.linspace(70, 130, side)
+    vols = np.linspace(10, 80, side)
+    days = np.linspace(1, 365, max(Count // (side * side), 1))
+    return lambda: graph.ScenarioSurface(lib.Graph_Case.Delta, spots, vols, days)
+
+def TimeCall(Call, MinimumTime):
+    Call()
+    samples = []
+    started = time.perf_counter()
+    while len(samples) < 3 or (time.perf_counter() - started < MinimumTime and len(samples) < 1000):
+        start = time.perf_counter()
+        Call()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+def RunBenchmarks(Sizes, Groups, MaxScalarSize, MinimumTime, Seed):
+    results = []
+    for name, (group, scalar, setup) in BENCHMARKS.items():
+        if group not in Groups:
+            continue
+        for size in Sizes:
+            entry = {"path": name, "group": group, "size": size}
+            if scalar and size > MaxScalarSize:
+                entry["skipped"] = f"scalar path above --max-scalar-size {MaxScalarSize}"
+                results.append(entry)
+                continue
+            try:
+                samples = TimeCall(setup(size, np.random.default_rng(Seed)), MinimumTime)
+            except ImportError as error:
+                entry["skipped"] = f"missing dependency: {error.name}"
+                results.append(entry)
+                continue
+            best = min(samples)
+            entry.update(
+                {
+                    "repeats": len(samples),
+                    "best_seconds": best,
+                    "median_seconds": statistics.median(samples),
+                    "throughput_per_second": size / best,
+                    "latency_per_contract_us": best / size * 1e6,
+                }
+            )
+            results.append(entry)
+            print(
+                f"{name:<28} n={size:>9,}  best={best * 1e3:10.3f} ms  "
+                f"{size / best:14,.0f}/s",
+                file=sys.stderr,
+            )
+    return results
+
+def CheckAgreement(Tolerance, Seed):
+    """
+
+        Skaler ve vektörel yolları bağımsız referans değerlerle ve birbirleriyle karşılaştırır
+
+    """
+    with open(REFERENCE_FILE) as handle:
+        reference = json.load(handle)
+    checks = []
+
+    def record(Name, Actual, Expected):
+        error = abs(Actual - Expected) / max(abs(Expected), 1.0)
+        checks.append({"check": Name, "actual": Actual, "expected": Expected, "error": error})
+
+    options = reference["options"]
+    for index, case in enumerate(options):
+        arguments = [case[name] for name in _OPTION_ARGUMENTS]
+        warrant = lib.WarrantCalculate(*arguments, case["ConversionRate"])
+        batch = lib.WarrantBatch(*arguments, case["ConversionRate"]).Greeks()
+        for field in GREEK_FIELDS:
+            expected = case["Expected"][field]
+            record(f"options[{index}].WarrantCalculate.{field}", getattr(warrant, field)(), expected)
+            record(f"options[{index}].WarrantBatch.{field}", float(getattr(batch, field)), expected)
+        implied = lib.implied_volatility(
+            case["Type"],
+            case["UnderlyingPrice"],
+            case["StrikePrice"],
+            case["DaysToMaturity"],
+            case["DomesticRate"],
+            case["Dividend"],
+            case["Expected"]["Price"],
+            case["ConversionRate"],
+        )
+        record(f"options[{index}].implied_volatility", implied.ImpliedVolatility, case["ImpliedVolatility"])
+
+    # İkinci derece greeksler, kütüphanenin kendi birinci derece greekslerinin merkezi farklarıyla tutarlı olmalı
+    bump = 1e-3
+    for index, case in enumerate(options):
+        if not case["Dividend"]:
+            continue
+        arguments = [case[name] for name in _OPTION_ARGUMENTS]
+
+        def first(Name, Shift, Field):
+            shifted = list(arguments)
+            shifted[_OPTION_ARGUMENTS.index(Name)] += Shift
+            return getattr(lib.OptionCalculate(*shifted).Greeks(), Field)
+
+        def difference(Name, Field):
+            # Richardson ekstrapolasyonu merkezi farkın kesme hatasını O(h^4)'e indirir
+            central = [(first(Name, h, Field) - first(Name, -h, Field)) / (2 * h) for h in (bump, bump / 2)]
+            return (4 * central[1] - central[0]) / 3
+
+        expected = {
+            "Vanna": difference("ImpliedVolatility", "Delta"),
+            "Volga": difference("ImpliedVolatility", "Vega"),
+            "Charm": -difference("DaysToMaturity", "Delta"),
+            "Speed": difference("UnderlyingPrice", "Gamma"),
+            "Color": -difference("DaysToMaturity", "Gamma"),
+        }
+        scalar = lib.OptionCalculate(*arguments).HigherOrderGreeks()
+        batch = lib.OptionBatch(*arguments).HigherOrderGreeks()
+        for field, value in expected.items():
+            name = f"options[{index}].{{}}.{field} vs bumped first order"
+            record(name.format("OptionCalculate.HigherOrderGreeks"), getattr(scalar, field), value)
+            record(name.format("OptionBatch.HigherOrderGreeks"), float(getattr(batch, field)), value)
+
+    for index, case in enumerate(reference["futures"]):
+        future = lib.Future(
+            lib.Future_Type[case["Type"]],
+            case["UnderlyingPrice"],
+            case["DaysToMaturity"],
+            case["DomesticRate"],
+            case["ForeignRate"],
+            case["Dividend"],
+        )
+        actual = future.TheoreticalPrice(
+            case["AnnualStorageCostRate"], case["GoldLeaseRate"], case["PresentValue"]
+        )
+        record(f"futures[{index}].TheoreticalPrice", actual, case["Expected"])
+        curve = lib.FutureCurve(
+            lib.Future_Type[case["Type"]],
+            case["UnderlyingPrice"],
+            case["DaysToMaturity"],
+            case["DomesticRate"],
+            case["ForeignRate"],
+            case["Dividend"],
+            case["AnnualStorageCostRate"],
+            case["GoldLeaseRate"],
+            case["PresentValue"],
+        )
+        record(f"futures[{index}].FutureCurve", float(curve.TheoreticalPrices()[0]), case["Expected"])
+
+    columns = Contracts(1000, np.random.default_rng(Seed))
+    batch = lib.OptionBatch(*(columns[name] for name in _OPTION_ARGUMENTS)).Greeks()
+    worst = {field: 0.0 for field in GREEK_FIELDS}
+    for index, row in enumerate(_ScalarRows(columns, _OPTION_ARGUMENTS)):
+        greeks = lib.OptionCalculate(*row).Greeks()
+        for field in GREEK_FIELDS:
+            expected = getattr(greeks, field)
+            error = abs(float(getattr(batch, field)[index]) - expected) / max(abs(expected), 1.0)
+            worst[field] = max(worst[field], error)
+    for field, error in worst.items():
+        checks.append({"check": f"OptionBatch vs OptionCalculate.{field} (1000 random)", "error": error})
+
+    # Başlangıç spotu bariyerin ötesindeyse nakavt varant indirimli rebate, nakavt-giriş varantı Avrupa fiyatıdır
+    european = lib.WarrantCalculate("C", 100, 95, 90, 8, 30, 1, 0.1).Price()
+    for barrierType, barrier, expected in (
+        ("DownAndOut", 101, 0.1 * 2 * math.exp(-0.08 * 90 / 365)),
+        ("UpAndOut", 99, 0.1 * 2 * math.exp(-0.08 * 90 / 365)),
+        ("DownAndIn", 101, european),
+        ("UpAndIn", 99, european),
+    ):
+        warrant = lib.MonteCarloWarrant(
+            "C", 100, 95, 90, 8, 30, 1, 0.1, Payoff="Barrier", Barrier=barrier, BarrierType=barrierType, Rebate=2
+        )
+        record(f"MonteCarloWarrant.{barrierType} breached at spot", warrant.Price(Paths=2000).Price, expected)
+
+    # Profil kapatıldıktan sonra paket ve tembel içe aktarmalar orijinal fonksiyonlara dönmeli
+    from PyDerivativeLib import batch as batchModule, core as coreModule, profiling
+
+    profiling.enable_profiling()
+    try:
+        lib.price_batch("C", 100, 95, 120, 5, 30, 2)
+        lib.implied_volatility("C", 100, 95, 120, 5, 2, 10)
+        recorded = profiling.profiling_snapshot(Reset=True)["Calls"]
+    finally:
+        profiling.disable_profiling()
+    restored = (
+        lib.price_batch is batchModule.price_batch
+        and not hasattr(batchModule.price_batch, "__wrapped__")
+        and lib.implied_volatility is coreModule.implied_volatility
+        and not hasattr(coreModule.implied_volatility, "__wrapped__")
+    )
+    for name in ("price_batch", "implied_volatility"):
+        error = 0.0 if name in recorded else float("inf")
+        checks.append({"check": f"profiling records lib.{name}", "error": error})
+    error = 0.0 if restored else float("inf")
+    checks.append({"check": "disable_profiling restores originals", "error": error})
+
+    failed = [check for check in checks if not check["error"] <= Tolerance]
+    return {"tolerance": Tolerance, "checks": len(checks), "failed": failed, "passed": not failed}
+
+def Environment():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True
+        ).stdout.strip()
+    except OSError:
+        commit = None
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "git_commit": commit or None,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+
+def Compare(Results, PreviousFile):
+    with open(PreviousFile) as handle:
+        previous = {
+            (entry["path"], entry["size"]): entry
+            for entry in json.load(handle)["results"]
+            if "best_seconds" in entry
+        }
+    comparison = []
+    for entry in Results:
+        before = previous.get((entry["path"], entry["size"]))
+        if before and "best_seconds" in entry:
+            comparison.append(
+                {
+                    "path": entry["path"],
+                    "size": entry["size"],
+                    "speedup": before["best_seconds"] / entry["best_seconds"],
+                }
+            )
+    return comparison
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PyDerivativeLib pricing benchmark suite")
+    parser.add_argument("--sizes", default="1,100,10000,1000000")
+    parser.add_argument("--paths", default="scalar,batch", help="comma separated groups: scalar,batch")
+    parser.add_argument("--max-scalar-size", type=int, default=10_000)
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds spent per measurement")
+    parser.add_argument("--tolerance", type=float, default=1e-9)
+    parser.add_argument("--seed", type=int, default=20230601)
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--compare", help="previous JSON report to compute speedups against")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    groups = set(args.paths.split(","))
+    agreement = CheckAgreement(args.tolerance, args.seed)
+    results = RunBenchmarks(sizes, groups, args.max_scalar_size, args.min_time, args.seed)
+    report = {"environment": Environment(), "agreement": agreement, "results": results}
+    if args.compare:
+        report["comparison"] = Compare(results, args.compare)
+
+    text = json.dumps(report, indent=2, default=float)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(text)
+    else:
+        print(text)
+    if not agreement["passed"]:
+        for check in agreement["failed"]:
+            print(f"Agreement check failed: {check}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())